@@ -5,13 +5,26 @@ Synq brings the fast, offline-first workflow of tools like Drizzle ORM
 to the Python and SQLAlchemy ecosystem.
 """
 
+from importlib import import_module
+
 __version__ = "0.0.1"
 __author__ = "Synq Contributors"
 __license__ = "MIT"
 
-from synq.core.config import SynqConfig
-from synq.core.migration import MigrationManager
-from synq.core.snapshot import SnapshotManager
+# Avoids importing typing at runtime; type checkers treat this as True
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from synq.core.config import SynqConfig
+    from synq.core.migration import MigrationManager
+    from synq.core.snapshot import SnapshotManager
+
+# Exported names and their modules. They are imported on first access, so
+# "import synq" stays cheap and SQLAlchemy only loads when actually needed.
+_LAZY_EXPORTS = {
+    "SynqConfig": "synq.core.config",
+    "SnapshotManager": "synq.core.snapshot",
+    "MigrationManager": "synq.core.migration",
+}
 
 __all__ = [
     "__version__",
@@ -21,3 +34,18 @@ __all__ = [
     "SnapshotManager",
     "MigrationManager",
 ]
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
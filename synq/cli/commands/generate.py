@@ -6,6 +6,7 @@ from typing import Optional
 import click
 
 from synq.core.config import SynqConfig
+from synq.core.metadata_cache import MetadataCache
 from synq.core.migration import MigrationManager
 from synq.core.naming import generate_migration_name
 from synq.core.snapshot import SnapshotManager
@@ -22,18 +23,46 @@ def generate_command(
         # Load configuration
         config = SynqConfig.from_file(config_path)
 
+        snapshot_manager = SnapshotManager(config)
+        metadata_cache = MetadataCache(config) if config.cache_metadata else None
+
+        # Unchanged model files still produce the latest snapshot, so the
+        # application does not even need to be imported
+        if metadata_cache is not None:
+            cached_fingerprint = metadata_cache.get_fingerprint()
+            if (
+                cached_fingerprint is not None
+                and cached_fingerprint == snapshot_manager.get_latest_fingerprint()
+            ):
+                click.echo(safe_echo("📦 Model files unchanged since the last run"))
+                click.echo(
+                    format_success("No schema changes detected. Nothing to migrate!")
+                )
+                return
+
         # Import metadata
         click.echo(safe_echo("📦 Loading SQLAlchemy metadata..."))
         metadata = import_metadata_from_path(config.metadata_path)
         validate_metadata_object(metadata)
 
         # Initialize managers
-        snapshot_manager = SnapshotManager(config)
         migration_manager = MigrationManager(config)
 
         # Get current and previous snapshots
         click.echo(safe_echo("📸 Creating current schema snapshot..."))
         current_snapshot = snapshot_manager.create_snapshot(metadata)
+        current_fingerprint = current_snapshot.fingerprint()
+
+        if metadata_cache is not None:
+            metadata_cache.store(current_fingerprint)
+
+        # Matching fingerprints mean nothing changed, so skip loading and
+        # diffing the previous snapshot entirely
+        if current_fingerprint == snapshot_manager.get_latest_fingerprint():
+            click.echo(
+                format_success("No schema changes detected. Nothing to migrate!")
+            )
+            return
 
         previous_snapshot = snapshot_manager.get_latest_snapshot()
 
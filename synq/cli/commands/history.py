@@ -0,0 +1,57 @@
+"""History command implementation."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from synq.core.config import SynqConfig
+from synq.core.history import DROPPED
+from synq.core.migration import MigrationManager
+from synq.core.snapshot import SnapshotManager
+from synq.utils.output import format_error, format_info, safe_echo
+
+
+def history_command(
+    config_path: Optional[Path], target: str, schema: Optional[str] = None
+) -> None:
+    """Show the migrations at which a table or column changed."""
+
+    try:
+        config = SynqConfig.from_file(config_path)
+        snapshot_manager = SnapshotManager(config)
+
+        table_name, _, column_name = target.partition(".")
+        if not table_name:
+            raise ValueError("Expected <table> or <table>.<column>")
+
+        if column_name:
+            history = snapshot_manager.get_column_history(
+                table_name, column_name, schema
+            )
+        else:
+            history = snapshot_manager.get_table_history(table_name, schema)
+
+        subject = f"{schema}.{target}" if schema else target
+        if not history:
+            click.echo(format_info(f"No history found for {subject}", "📭"))
+            return
+
+        # Migration files share their number with the snapshot they produced
+        migration_names = {
+            migration.number: migration.filename
+            for migration in MigrationManager(config).get_all_migrations()
+        }
+
+        click.echo(safe_echo(f"📜 History of {subject}:"))
+        for entry in history:
+            marker = "-" if entry.change == DROPPED else "•"
+            migration_name = migration_names.get(entry.migration_number, "")
+            click.echo(
+                f"  {marker} {entry.migration_number:04d}  {entry.change:<8} "
+                f"{migration_name}".rstrip()
+            )
+
+    except Exception as e:
+        click.echo(format_error(f"Error reading history: {e}"), err=True)
+        raise click.Abort() from e
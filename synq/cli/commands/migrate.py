@@ -7,11 +7,16 @@ import click
 
 from synq.core.config import SynqConfig
 from synq.core.database import DatabaseManager
+from synq.core.fanout import TargetResult, migrate_targets
 from synq.core.migration import MigrationManager
 
 
 def migrate_command(
-    config_path: Optional[Path], dry_run: bool, auto_confirm: bool = False
+    config_path: Optional[Path],
+    dry_run: bool,
+    auto_confirm: bool = False,
+    batch: bool = False,
+    workers: Optional[int] = None,
 ) -> None:
     """Apply all pending migrations to the database."""
 
@@ -19,6 +24,13 @@ def migrate_command(
         # Load configuration
         config = SynqConfig.from_file(config_path)
 
+        target_uris = config.target_db_uris
+        if target_uris:
+            _migrate_multiple_targets(
+                config, target_uris, dry_run, auto_confirm, batch, workers
+            )
+            return
+
         if not config.db_uri:
             click.echo(
                 "❌ No database URI configured. Please add 'db_uri' to your synq.toml file.",
@@ -28,7 +40,7 @@ def migrate_command(
 
         # Initialize managers
         migration_manager = MigrationManager(config)
-        db_manager = DatabaseManager(config.db_uri)
+        db_manager = DatabaseManager(config)
 
         # Get pending migrations
         click.echo("🔍 Checking for pending migrations...")
@@ -58,6 +70,22 @@ def migrate_command(
         # Apply migrations
         click.echo("🚀 Applying migrations...")
 
+        if batch:
+            click.echo(
+                f"⏳ Applying {len(pending_migrations)} migration(s) in one batch..."
+            )
+
+            try:
+                db_manager.apply_migrations_batch(pending_migrations)
+            except Exception as e:
+                click.echo(f"❌ Batch migration failed: {e}", err=True)
+                raise click.Abort() from e
+
+            click.echo(
+                f"🎉 Successfully applied {len(pending_migrations)} migration(s)!"
+            )
+            return
+
         for migration in pending_migrations:
             click.echo(f"⏳ Applying {migration.filename}...")
 
@@ -75,3 +103,67 @@ def migrate_command(
     except Exception as e:
         click.echo(f"❌ Error during migration: {e}", err=True)
         raise click.Abort() from e
+
+
+def _migrate_multiple_targets(
+    config: SynqConfig,
+    db_uris: list[str],
+    dry_run: bool,
+    auto_confirm: bool,
+    batch: bool,
+    workers: Optional[int],
+) -> None:
+    """Apply pending migrations to every configured target database."""
+    click.echo(f"🌐 Found {len(db_uris)} target database(s)")
+
+    if dry_run:
+        click.echo("🔍 Dry run mode - no changes will be applied")
+    elif not auto_confirm and not click.confirm(
+        f"Apply pending migrations to {len(db_uris)} database(s)?", default=True
+    ):
+        click.echo("Migration cancelled.")
+        return
+
+    def report(result: TargetResult) -> None:
+        if not result.ok:
+            click.echo(f"❌ {result.display_name}: {result.error}", err=True)
+        elif dry_run:
+            click.echo(
+                f"🔍 {result.display_name}: {len(result.pending)} pending migration(s)"
+            )
+        elif result.applied:
+            click.echo(
+                f"✅ {result.display_name}: applied {len(result.applied)} migration(s)"
+            )
+        else:
+            click.echo(f"✅ {result.display_name}: up to date")
+
+    results = migrate_targets(
+        config,
+        db_uris,
+        max_workers=workers,
+        dry_run=dry_run,
+        batch=batch,
+        on_result=report,
+    )
+
+    failed = [result for result in results if not result.ok]
+    click.echo("\n📊 Summary:")
+    click.echo(f"  ✅ Succeeded: {len(results) - len(failed)}")
+    click.echo(f"  ❌ Failed: {len(failed)}")
+    if dry_run:
+        pending = sum(len(result.pending) for result in results)
+        click.echo(f"  📋 Pending migrations: {pending}")
+    else:
+        applied = sum(len(result.applied) for result in results)
+        click.echo(f"  🚀 Applied migrations: {applied}")
+
+    if failed:
+        for result in failed:
+            click.echo(f"    • {result.display_name}", err=True)
+        raise RuntimeError(
+            f"{len(failed)} of {len(results)} database(s) failed to migrate"
+        )
+
+    if not dry_run:
+        click.echo(f"🎉 Successfully migrated {len(results)} database(s)!")
@@ -0,0 +1,44 @@
+"""Snapshot maintenance command implementations."""
+
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from synq.core.config import SynqConfig
+from synq.core.snapshot import SnapshotManager
+from synq.utils.output import format_error, format_success, safe_echo
+
+
+def convert_command(config_path: Optional[Path], target_format: Optional[str]) -> None:
+    """Convert stored snapshots to another on-disk format."""
+
+    try:
+        # Load configuration
+        config = SynqConfig.from_file(config_path)
+        target_format = target_format or config.snapshot_format
+
+        snapshot_manager = SnapshotManager(config)
+
+        click.echo(safe_echo(f"🔄 Converting snapshots to {target_format} format..."))
+        converted = snapshot_manager.convert_snapshots(target_format)
+
+        if not converted:
+            click.echo(
+                format_success(f"All snapshots already use the {target_format} format.")
+            )
+        else:
+            for snapshot_file in converted:
+                click.echo(f"  • {snapshot_file.name}")
+            click.echo(format_success(f"Converted {len(converted)} snapshot(s)"))
+
+        if target_format != config.snapshot_format:
+            click.echo("")
+            click.echo(
+                f'Set snapshot_format = "{target_format}" in synq.toml so new '
+                "snapshots are saved in the same format."
+            )
+
+    except Exception as e:
+        click.echo(format_error(f"Error converting snapshots: {e}"), err=True)
+        raise click.Abort() from e
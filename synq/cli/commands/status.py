@@ -42,9 +42,23 @@ def status_command(config_path: Optional[Path]) -> None:
 
         # Check database status
         try:
-            db_manager = DatabaseManager(config.db_uri)
-            applied_migrations = db_manager.get_applied_migrations()
-            pending_migrations = migration_manager.get_pending_migrations(db_manager)
+            # Status only reads, so never create the migrations table
+            db_manager = DatabaseManager(config, read_only=True)
+            # Only filenames are shown, so don't read the pending SQL
+            pending_migrations = migration_manager.get_pending_migration_files(
+                db_manager, all_migrations
+            )
+            if config.pending_detection == "high_water_mark":
+                # Only the high-water mark row was read: every local
+                # migration below it counts as applied
+                pending_names = {migration.filename for migration in pending_migrations}
+                applied_migrations = [
+                    migration.filename
+                    for migration in all_migrations
+                    if migration.filename not in pending_names
+                ]
+            else:
+                applied_migrations = db_manager.get_applied_migrations()
 
             click.echo(f"🗄️  Database: {config.db_uri}")
             click.echo(f"✅ Applied migrations: {len(applied_migrations)}")
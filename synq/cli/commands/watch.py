@@ -0,0 +1,78 @@
+"""Watch command implementation."""
+
+import time
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from synq.core.config import SynqConfig
+from synq.core.watch import SchemaWatcher
+from synq.utils.output import format_error, format_success, safe_echo
+
+
+def watch_command(config_path: Optional[Path], interval: float = 0.5) -> None:
+    """Watch the model files and print pending schema changes on every save."""
+
+    try:
+        config = SynqConfig.from_file(config_path)
+        watcher = SchemaWatcher(config)
+
+        click.echo(safe_echo("📦 Loading SQLAlchemy metadata..."))
+        _check(watcher)
+        click.echo(
+            safe_echo(
+                f"👀 Watching {len(watcher.files)} file(s) for changes "
+                "(press Ctrl+C to stop)"
+            )
+        )
+
+        while True:
+            time.sleep(interval)
+
+            changed = watcher.changed_files()
+            if not changed:
+                continue
+
+            names = ", ".join(_display_path(path, watcher) for path in changed)
+            click.echo(safe_echo(f"\n🔄 Changed: {names}"))
+            _check(watcher)
+
+    except KeyboardInterrupt:
+        click.echo("\nStopped watching.")
+    except Exception as e:
+        click.echo(format_error(f"Error watching models: {e}"), err=True)
+        raise click.Abort() from e
+
+
+def _check(watcher: SchemaWatcher) -> None:
+    """Re-import the models and print the operations a migration would contain."""
+    started = time.perf_counter()
+
+    try:
+        snapshot = watcher.load()
+        operations = watcher.pending_operations(snapshot)
+    except Exception as e:
+        # Keep watching: the next save may fix it
+        click.echo(format_error(f"Could not load models: {e}"), err=True)
+        return
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if not operations:
+        click.echo(format_success(f"No schema changes detected ({elapsed_ms:.0f}ms)"))
+        return
+
+    click.echo(
+        safe_echo(f"📋 {len(operations)} pending operation(s) ({elapsed_ms:.0f}ms):")
+    )
+    for operation in operations:
+        click.echo(f"  • {operation}")
+
+
+def _display_path(path: Path, watcher: SchemaWatcher) -> str:
+    """Show a watched file relative to the project when possible."""
+    try:
+        return str(path.relative_to(watcher.project_root))
+    except ValueError:
+        return str(path)
@@ -5,10 +5,8 @@ from typing import Optional
 
 import click
 
-from synq.cli.commands import generate as generate_cmd
-from synq.cli.commands import init as init_cmd
-from synq.cli.commands import migrate as migrate_cmd
-from synq.cli.commands import status as status_cmd
+# Command modules import SQLAlchemy and synq.core, so each one is imported
+# only when its command runs, keeping "synq --help" and "--version" fast.
 
 
 @click.group()
@@ -45,6 +43,8 @@ def init(
     migrations_dir: str,
 ) -> None:
     """Initialize Synq in the current directory."""
+    from synq.cli.commands import init as init_cmd
+
     init_cmd.init_command(metadata_path, db_uri, migrations_dir)
 
 
@@ -74,6 +74,8 @@ def generate(
       synq generate "Add user authentication" # Use description
       synq generate --name "custom_migration" # Use custom name
     """
+    from synq.cli.commands import generate as generate_cmd
+
     generate_cmd.generate_command(description, config, name)
 
 
@@ -95,9 +97,33 @@ def generate(
     is_flag=True,
     help="Automatically confirm migration application",
 )
-def migrate(config: Optional[Path], dry_run: bool, yes: bool) -> None:
-    """Apply all pending migrations to the database."""
-    migrate_cmd.migrate_command(config, dry_run, yes)
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Apply all pending migrations over one connection and, where the "
+    "database supports transactional DDL, in one transaction",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of databases migrated at once when several targets are "
+    "configured (defaults to migrate_workers in synq.toml)",
+)
+def migrate(
+    config: Optional[Path],
+    dry_run: bool,
+    yes: bool,
+    batch: bool,
+    workers: Optional[int],
+) -> None:
+    """Apply all pending migrations to the database.
+
+    When db_uris or db_uri_template is set in synq.toml, every target
+    database is migrated in parallel and a summary is printed at the end.
+    """
+    from synq.cli.commands import migrate as migrate_cmd
+
+    migrate_cmd.migrate_command(config, dry_run, yes, batch, workers)
 
 
 @cli.command()
@@ -109,8 +135,80 @@ def migrate(config: Optional[Path], dry_run: bool, yes: bool) -> None:
 )
 def status(config: Optional[Path]) -> None:
     """Show the current state of the database and pending migrations."""
+    from synq.cli.commands import status as status_cmd
+
     status_cmd.status_command(config)
 
 
+@cli.command()
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True),
+    help="Path to synq.toml configuration file",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=0.05),
+    default=0.5,
+    show_default=True,
+    help="Seconds between checks for changed files",
+)
+def watch(config: Optional[Path], interval: float) -> None:
+    """Watch the models and print pending schema changes on every save.
+
+    The process stays running, so each check only re-imports the project's
+    own modules instead of starting Python and SQLAlchemy again.
+    """
+    from synq.cli.commands import watch as watch_cmd
+
+    watch_cmd.watch_command(config, interval)
+
+
+@cli.command()
+@click.argument("target", metavar="TABLE[.COLUMN]")
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True),
+    help="Path to synq.toml configuration file",
+)
+@click.option("--schema", help="Database schema of the table")
+def history(config: Optional[Path], target: str, schema: Optional[str]) -> None:
+    """Show the migrations at which a table or column changed.
+
+    Answered from an index of the stored snapshots, built on first use and
+    updated whenever a migration is generated.
+    """
+    from synq.cli.commands import history as history_cmd
+
+    history_cmd.history_command(config, target, schema)
+
+
+@cli.group()
+def snapshot() -> None:
+    """Inspect and maintain stored schema snapshots."""
+
+
+@snapshot.command("convert")
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True),
+    help="Path to synq.toml configuration file",
+)
+@click.option(
+    "--to",
+    "target_format",
+    type=click.Choice(["json", "binary"]),
+    help="Snapshot format to convert to (defaults to snapshot_format in synq.toml)",
+)
+def snapshot_convert(config: Optional[Path], target_format: Optional[str]) -> None:
+    """Convert stored snapshots between the JSON and binary formats."""
+    from synq.cli.commands import snapshot as snapshot_cmd
+
+    snapshot_cmd.convert_command(config, target_format)
+
+
 if __name__ == "__main__":
     cli()
@@ -0,0 +1,209 @@
+"""Asyncio database connection and migration state management."""
+
+import asyncio
+from types import TracebackType
+from typing import Any, Optional, Union
+
+from sqlalchemy import MetaData, Table, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from synq.core.database import (
+    create_tracking_tables,
+    define_high_water_mark_table,
+    define_migrations_table,
+    record_applied_migrations,
+    statement_cache_dir,
+    uses_backslash_escapes,
+)
+from synq.core.migration import PendingMigration, read_migration_files
+from synq.core.sql_splitter import get_sql_statements
+
+
+class AsyncDatabaseManager:
+    """Manages migration state over an asyncio SQLAlchemy engine.
+
+    Mirrors ``DatabaseManager`` for applications running on async drivers
+    such as asyncpg or aiosqlite, so migrations can be applied from an event
+    loop without a second, synchronous driver. Managers for different
+    databases can be driven concurrently, e.g. with ``asyncio.gather``.
+    """
+
+    def __init__(self, db_uri_or_config: Union[str, Any]) -> None:
+        # Accept a config object or a plain URI, like DatabaseManager
+        if hasattr(db_uri_or_config, "db_uri"):
+            self.db_uri = db_uri_or_config.db_uri
+            self.config = db_uri_or_config
+        else:
+            self.db_uri = db_uri_or_config
+            self.config = None
+
+        if not self.db_uri:
+            raise ValueError("Database URI is required")
+
+        self.statement_cache_dir = statement_cache_dir(self.config)
+
+        self.engine: AsyncEngine = create_async_engine(self.db_uri)
+
+        self.metadata: MetaData = MetaData()
+        self.migrations_table: Table = define_migrations_table(self.metadata)
+        self.high_water_mark_table: Table = define_high_water_mark_table(self.metadata)
+
+        # The migrations table is created on first use, there is no
+        # event loop available while constructing the manager
+        self._migrations_table_ready = False
+        self._migrations_table_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self) -> "AsyncDatabaseManager":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def ensure_migrations_table(self) -> None:
+        """Ensure the migrations tracking table exists."""
+        if self._migrations_table_ready:
+            return
+
+        if self._migrations_table_lock is None:
+            self._migrations_table_lock = asyncio.Lock()
+
+        async with self._migrations_table_lock:
+            if self._migrations_table_ready:
+                return
+
+            try:
+                async with self.engine.begin() as conn:
+                    await conn.run_sync(
+                        create_tracking_tables,
+                        self.migrations_table,
+                        self.high_water_mark_table,
+                    )
+            except SQLAlchemyError:
+                # If creation fails, the table might already exist
+                try:
+                    async with self.engine.connect() as conn:
+                        await conn.execute(self.migrations_table.select().limit(1))
+                except SQLAlchemyError as exc:
+                    raise RuntimeError(
+                        f"Failed to create or access migrations table: {exc}"
+                    ) from exc
+
+            self._migrations_table_ready = True
+
+    async def get_applied_migrations(self) -> list[str]:
+        """Get list of applied migration filenames."""
+        await self.ensure_migrations_table()
+
+        try:
+            async with self.engine.connect() as conn:
+                result = await conn.execute(
+                    self.migrations_table.select().order_by(
+                        self.migrations_table.c.filename
+                    )
+                )
+                return [row.filename for row in result.fetchall()]
+        except SQLAlchemyError as e:
+            raise RuntimeError(f"Failed to query applied migrations: {e}") from e
+
+    async def apply_migration(self, migration: PendingMigration) -> None:
+        """Apply a single migration and record it, in one transaction."""
+        await self.ensure_migrations_table()
+
+        try:
+            statements = await self._split_migration_sql(migration.sql_content)
+            async with self.engine.begin() as conn:
+                for statement in statements:
+                    await conn.execute(text(statement))
+                await conn.run_sync(
+                    record_applied_migrations,
+                    self.migrations_table,
+                    self.high_water_mark_table,
+                    [migration.filename],
+                )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to apply migration {migration.filename}: {e}"
+            ) from e
+
+    async def get_pending_migrations(
+        self, migration_manager: Any
+    ) -> list[PendingMigration]:
+        """Get migrations that haven't been applied to the database.
+
+        The migrations directory is listed and read in a worker thread, so
+        the event loop is not blocked on file I/O.
+        """
+        applied_migrations = set(await self.get_applied_migrations())
+
+        return await asyncio.to_thread(
+            _read_pending_migrations, migration_manager, applied_migrations
+        )
+
+    async def apply_pending_migrations(
+        self, migration_manager: Optional[Any] = None
+    ) -> list[str]:
+        """Apply all pending migrations in order.
+
+        Returns:
+            The filenames of the applied migrations
+        """
+        if migration_manager is None:
+            from synq.core.config import SynqConfig
+            from synq.core.migration import MigrationManager
+
+            if not isinstance(self.config, SynqConfig):
+                raise ValueError(
+                    "A migration manager is required when the manager was "
+                    "created from a database URI"
+                )
+            migration_manager = MigrationManager(self.config)
+
+        applied = []
+        for migration in await self.get_pending_migrations(migration_manager):
+            await self.apply_migration(migration)
+            applied.append(migration.filename)
+
+        return applied
+
+    async def _split_migration_sql(self, sql_content: str) -> list[str]:
+        """Split a migration into statements in a worker thread.
+
+        Splitting may read and write the on-disk statement cache, so it is
+        kept off the event loop and done before a connection is taken.
+        """
+        return await asyncio.to_thread(
+            get_sql_statements,
+            sql_content,
+            uses_backslash_escapes(self.engine.dialect.name),
+            self.statement_cache_dir,
+        )
+
+    async def test_connection(self) -> bool:
+        """Test database connection."""
+        try:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except SQLAlchemyError:
+            return False
+
+    async def close(self) -> None:
+        """Close database connections."""
+        await self.engine.dispose()
+
+
+def _read_pending_migrations(
+    migration_manager: Any, applied_migrations: set[str]
+) -> list[PendingMigration]:
+    """List the migrations directory and read the migrations not yet applied."""
+    return read_migration_files(
+        migration
+        for migration in migration_manager.get_all_migrations()
+        if migration.filename not in applied_migrations
+    )
@@ -0,0 +1,222 @@
+"""Compact binary encoding for schema snapshots.
+
+Layout (all integers are unsigned 32-bit little-endian):
+
+    magic     b"SYNQSNAP"
+    version   one byte, the binary format version
+    strings   count, the UTF-8 byte length of each string, then the bytes
+    body      count, then the integer stream describing the snapshot
+
+Every string in a snapshot (table, column and type names, defaults, ...)
+is stored once in the string table and referenced from the body by its
+position, so repeated type names such as ``VARCHAR(255)`` cost four bytes
+per use. Optional strings are stored as position + 1, with 0 meaning None.
+"""
+
+import struct
+import sys
+from collections.abc import Iterator
+from typing import Optional
+
+from synq.core.snapshot import (
+    ColumnSnapshot,
+    ForeignKeySnapshot,
+    IndexSnapshot,
+    SchemaSnapshot,
+    TableSnapshot,
+)
+
+MAGIC = b"SYNQSNAP"
+FORMAT_VERSION = 1
+
+# Column flag bits
+_NULLABLE = 1
+_PRIMARY_KEY = 2
+_AUTOINCREMENT = 4
+_UNIQUE = 8
+
+
+class _StringTable:
+    """Interns strings and hands out their positions."""
+
+    def __init__(self) -> None:
+        self.positions: dict[str, int] = {}
+        self.strings: list[str] = []
+
+    def ref(self, value: str) -> int:
+        position = self.positions.get(value)
+        if position is None:
+            position = len(self.strings)
+            self.positions[value] = position
+            self.strings.append(value)
+        return position
+
+    def optional_ref(self, value: Optional[str]) -> int:
+        return 0 if value is None else self.ref(value) + 1
+
+
+def encode_snapshot(snapshot: SchemaSnapshot) -> bytes:
+    """Encode a snapshot into the binary snapshot format."""
+    strings = _StringTable()
+    body = [strings.ref(snapshot.version), len(snapshot.tables)]
+
+    for table in snapshot.tables:
+        body.append(strings.ref(table.name))
+        body.append(strings.optional_ref(table.schema))
+
+        body.append(len(table.columns))
+        for column in table.columns:
+            flags = (
+                (_NULLABLE if column.nullable else 0)
+                | (_PRIMARY_KEY if column.primary_key else 0)
+                | (_AUTOINCREMENT if column.autoincrement else 0)
+                | (_UNIQUE if column.unique else 0)
+            )
+            body.extend(
+                (
+                    strings.ref(column.name),
+                    strings.ref(column.type),
+                    strings.optional_ref(column.default),
+                    flags,
+                )
+            )
+
+        body.append(len(table.indexes))
+        for index in table.indexes:
+            body.extend(
+                (strings.ref(index.name), int(index.unique), len(index.columns))
+            )
+            body.extend(strings.ref(name) for name in index.columns)
+
+        body.append(len(table.foreign_keys))
+        for fk in table.foreign_keys:
+            body.extend((strings.optional_ref(fk.name), len(fk.columns)))
+            body.extend(strings.ref(name) for name in fk.columns)
+            body.extend((strings.ref(fk.referred_table), len(fk.referred_columns)))
+            body.extend(strings.ref(name) for name in fk.referred_columns)
+            body.extend(
+                (strings.optional_ref(fk.ondelete), strings.optional_ref(fk.onupdate))
+            )
+
+    encoded = [value.encode("utf-8") for value in strings.strings]
+
+    return b"".join(
+        (
+            MAGIC,
+            bytes((FORMAT_VERSION,)),
+            struct.pack("<I", len(encoded)),
+            struct.pack(f"<{len(encoded)}I", *(len(value) for value in encoded)),
+            *encoded,
+            struct.pack("<I", len(body)),
+            struct.pack(f"<{len(body)}I", *body),
+        )
+    )
+
+
+def decode_snapshot(data: bytes) -> SchemaSnapshot:
+    """Decode a snapshot from the binary snapshot format.
+
+    Raises:
+        ValueError: If the data is not a valid binary snapshot
+    """
+    if not is_binary_snapshot(data):
+        raise ValueError("Data is not a binary Synq snapshot")
+
+    format_version = data[len(MAGIC)]
+    if format_version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary snapshot version: {format_version}")
+
+    try:
+        offset = len(MAGIC) + 1
+        (string_count,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        lengths = struct.unpack_from(f"<{string_count}I", data, offset)
+        offset += 4 * string_count
+
+        strings = []
+        for length in lengths:
+            strings.append(sys.intern(data[offset : offset + length].decode("utf-8")))
+            offset += length
+
+        (body_length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        body = struct.unpack_from(f"<{body_length}I", data, offset)
+
+        return _decode_body(iter(body), strings)
+    except (struct.error, StopIteration, IndexError) as e:
+        raise ValueError(f"Truncated or corrupt binary snapshot: {e}") from e
+
+
+def is_binary_snapshot(data: bytes) -> bool:
+    """Check whether data starts with the binary snapshot header."""
+    return data[: len(MAGIC)] == MAGIC
+
+
+def _decode_body(body: Iterator[int], strings: list[str]) -> SchemaSnapshot:
+    """Rebuild the snapshot dataclasses from the integer stream."""
+
+    def optional(ref: int) -> Optional[str]:
+        return None if ref == 0 else strings[ref - 1]
+
+    version = strings[next(body)]
+    tables = []
+
+    for _ in range(next(body)):
+        name = strings[next(body)]
+        schema = optional(next(body))
+
+        columns = []
+        for _ in range(next(body)):
+            column_name = strings[next(body)]
+            column_type = strings[next(body)]
+            default = optional(next(body))
+            flags = next(body)
+            columns.append(
+                ColumnSnapshot(
+                    name=column_name,
+                    type=column_type,
+                    nullable=bool(flags & _NULLABLE),
+                    default=default,
+                    primary_key=bool(flags & _PRIMARY_KEY),
+                    autoincrement=bool(flags & _AUTOINCREMENT),
+                    unique=bool(flags & _UNIQUE),
+                )
+            )
+
+        indexes = []
+        for _ in range(next(body)):
+            index_name = strings[next(body)]
+            unique = bool(next(body))
+            index_columns = [strings[next(body)] for _ in range(next(body))]
+            indexes.append(
+                IndexSnapshot(name=index_name, columns=index_columns, unique=unique)
+            )
+
+        foreign_keys = []
+        for _ in range(next(body)):
+            fk_name = optional(next(body))
+            fk_columns = [strings[next(body)] for _ in range(next(body))]
+            referred_table = strings[next(body)]
+            referred_columns = [strings[next(body)] for _ in range(next(body))]
+            foreign_keys.append(
+                ForeignKeySnapshot(
+                    name=fk_name,
+                    columns=fk_columns,
+                    referred_table=referred_table,
+                    referred_columns=referred_columns,
+                    ondelete=optional(next(body)),
+                    onupdate=optional(next(body)),
+                )
+            )
+
+        tables.append(
+            TableSnapshot(
+                name=name,
+                columns=columns,
+                indexes=indexes,
+                foreign_keys=foreign_keys,
+                schema=schema,
+            )
+        )
+
+    return SchemaSnapshot(tables=tables, version=version)
@@ -0,0 +1,39 @@
+"""Location of the derived files synq keeps between runs.
+
+Split migration statements, the metadata fingerprint cache, snapshot table
+indexes and the history index can all be rebuilt from the migrations and
+snapshots, and are specific to the machine they were built on. They live in
+one cache directory, ``.synq_cache`` inside the migrations directory unless
+``cache_dir`` is configured, which carries its own ``.gitignore`` so it never
+shows up in version control.
+"""
+
+from pathlib import Path
+from typing import Any
+
+# Name of the cache directory created inside the migrations directory
+CACHE_DIR_NAME = ".synq_cache"
+
+# Written into every cache directory synq creates
+_GITIGNORE = "# Created by synq: derived files, safe to delete\n*\n"
+
+
+def cache_path(config: Any) -> Path:
+    """Get the cache directory configured by ``cache_dir``, or the default."""
+    cache_dir = getattr(config, "cache_dir", None)
+    if cache_dir:
+        return Path(cache_dir)
+    return Path(getattr(config, "migrations_dir", "migrations")) / CACHE_DIR_NAME
+
+
+def ensure_cache_dir(directory: Path) -> None:
+    """Create a cache directory that git ignores.
+
+    Raises:
+        OSError: If the directory cannot be created
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+
+    gitignore = directory / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text(_GITIGNORE, encoding="utf-8")
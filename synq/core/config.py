@@ -1,11 +1,20 @@
 """Configuration management for Synq."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
 import toml
 
+from synq.core.cache import cache_path
+
+# Supported on-disk snapshot formats
+SNAPSHOT_FORMATS = ("json", "binary")
+
+# How pending migrations are detected: by comparing against every applied
+# filename, or only against the highest applied migration number
+PENDING_DETECTION_MODES = ("applied", "high_water_mark")
+
 
 @dataclass
 class SynqConfig:
@@ -15,6 +24,20 @@ class SynqConfig:
     db_uri: Optional[str] = None
     migrations_dir: str = "migrations"
     snapshot_dir: str = "migrations/meta"
+    snapshot_format: str = "json"
+    snapshot_keyframe_interval: int = 1
+    db_uris: list[str] = field(default_factory=list)
+    db_uri_template: Optional[str] = None
+    db_targets: list[str] = field(default_factory=list)
+    migrate_workers: int = 8
+    pending_detection: str = "applied"
+    pool_size: Optional[int] = None
+    pool_pre_ping: bool = False
+    connect_timeout: Optional[float] = None
+    statement_timeout: Optional[float] = None
+    cache_metadata: bool = False
+    snapshot_workers: Optional[int] = None
+    cache_dir: Optional[str] = None
 
     @classmethod
     def from_file(cls, config_path: Optional[Path] = None) -> "SynqConfig":
@@ -32,11 +55,113 @@ class SynqConfig:
             config_data = toml.load(config_path)
             synq_config = config_data.get("synq", {})
 
+            snapshot_format = synq_config.get("snapshot_format", "json")
+            if snapshot_format not in SNAPSHOT_FORMATS:
+                raise ValueError(
+                    f"Unsupported snapshot_format '{snapshot_format}', "
+                    f"expected one of: {', '.join(SNAPSHOT_FORMATS)}"
+                )
+
+            keyframe_interval = synq_config.get("snapshot_keyframe_interval", 1)
+            if not isinstance(keyframe_interval, int) or keyframe_interval < 1:
+                raise ValueError(
+                    "snapshot_keyframe_interval must be a positive integer, "
+                    f"got {keyframe_interval!r}"
+                )
+
+            db_uris = synq_config.get("db_uris", [])
+            if not isinstance(db_uris, list) or not all(
+                isinstance(uri, str) for uri in db_uris
+            ):
+                raise ValueError("db_uris must be a list of database URIs")
+
+            db_uri_template = synq_config.get("db_uri_template")
+            db_targets = synq_config.get("db_targets", [])
+            if not isinstance(db_targets, list):
+                raise ValueError("db_targets must be a list of target names")
+            if db_uri_template is not None and "{target}" not in db_uri_template:
+                raise ValueError("db_uri_template must contain a {target} placeholder")
+            if db_targets and db_uri_template is None:
+                raise ValueError("db_targets requires db_uri_template")
+
+            migrate_workers = synq_config.get("migrate_workers", 8)
+            if not isinstance(migrate_workers, int) or migrate_workers < 1:
+                raise ValueError(
+                    f"migrate_workers must be a positive integer, got {migrate_workers!r}"
+                )
+
+            pending_detection = synq_config.get("pending_detection", "applied")
+            if pending_detection not in PENDING_DETECTION_MODES:
+                raise ValueError(
+                    f"Unsupported pending_detection '{pending_detection}', "
+                    f"expected one of: {', '.join(PENDING_DETECTION_MODES)}"
+                )
+
+            pool_size = synq_config.get("pool_size")
+            if pool_size is not None and (
+                not isinstance(pool_size, int) or pool_size < 1
+            ):
+                raise ValueError(
+                    f"pool_size must be a positive integer, got {pool_size!r}"
+                )
+
+            pool_pre_ping = synq_config.get("pool_pre_ping", False)
+            if not isinstance(pool_pre_ping, bool):
+                raise ValueError(
+                    f"pool_pre_ping must be true or false, got {pool_pre_ping!r}"
+                )
+
+            timeouts = {}
+            for key in ("connect_timeout", "statement_timeout"):
+                timeout = synq_config.get(key)
+                if timeout is not None and (
+                    isinstance(timeout, bool)
+                    or not isinstance(timeout, (int, float))
+                    or timeout <= 0
+                ):
+                    raise ValueError(
+                        f"{key} must be a positive number of seconds, got {timeout!r}"
+                    )
+                timeouts[key] = timeout
+
+            cache_metadata = synq_config.get("cache_metadata", False)
+            if not isinstance(cache_metadata, bool):
+                raise ValueError(
+                    f"cache_metadata must be true or false, got {cache_metadata!r}"
+                )
+
+            snapshot_workers = synq_config.get("snapshot_workers")
+            if snapshot_workers is not None and (
+                not isinstance(snapshot_workers, int) or snapshot_workers < 1
+            ):
+                raise ValueError(
+                    "snapshot_workers must be a positive integer, "
+                    f"got {snapshot_workers!r}"
+                )
+
+            cache_dir = synq_config.get("cache_dir")
+            if cache_dir is not None and not isinstance(cache_dir, str):
+                raise ValueError(f"cache_dir must be a path, got {cache_dir!r}")
+
             return cls(
                 metadata_path=synq_config["metadata_path"],
                 db_uri=synq_config.get("db_uri"),
                 migrations_dir=synq_config.get("migrations_dir", "migrations"),
                 snapshot_dir=synq_config.get("snapshot_dir", "migrations/meta"),
+                snapshot_format=snapshot_format,
+                snapshot_keyframe_interval=keyframe_interval,
+                db_uris=db_uris,
+                db_uri_template=db_uri_template,
+                db_targets=[str(target) for target in db_targets],
+                migrate_workers=migrate_workers,
+                pending_detection=pending_detection,
+                pool_size=pool_size,
+                pool_pre_ping=pool_pre_ping,
+                connect_timeout=timeouts["connect_timeout"],
+                statement_timeout=timeouts["statement_timeout"],
+                cache_metadata=cache_metadata,
+                snapshot_workers=snapshot_workers,
+                cache_dir=cache_dir,
             )
         except KeyError as e:
             raise ValueError(f"Missing required configuration key: {e}") from e
@@ -45,7 +170,7 @@ class SynqConfig:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary for TOML serialization."""
-        result = {"metadata_path": self.metadata_path}
+        result: dict[str, Any] = {"metadata_path": self.metadata_path}
 
         if self.db_uri:
             result["db_uri"] = self.db_uri
@@ -53,6 +178,34 @@ class SynqConfig:
             result["migrations_dir"] = self.migrations_dir
         if self.snapshot_dir != "migrations/meta":
             result["snapshot_dir"] = self.snapshot_dir
+        if self.snapshot_format != "json":
+            result["snapshot_format"] = self.snapshot_format
+        if self.snapshot_keyframe_interval != 1:
+            result["snapshot_keyframe_interval"] = self.snapshot_keyframe_interval
+        if self.db_uris:
+            result["db_uris"] = self.db_uris
+        if self.db_uri_template:
+            result["db_uri_template"] = self.db_uri_template
+        if self.db_targets:
+            result["db_targets"] = self.db_targets
+        if self.migrate_workers != 8:
+            result["migrate_workers"] = self.migrate_workers
+        if self.pending_detection != "applied":
+            result["pending_detection"] = self.pending_detection
+        if self.pool_size is not None:
+            result["pool_size"] = self.pool_size
+        if self.pool_pre_ping:
+            result["pool_pre_ping"] = self.pool_pre_ping
+        if self.connect_timeout is not None:
+            result["connect_timeout"] = self.connect_timeout
+        if self.statement_timeout is not None:
+            result["statement_timeout"] = self.statement_timeout
+        if self.cache_metadata:
+            result["cache_metadata"] = self.cache_metadata
+        if self.snapshot_workers is not None:
+            result["snapshot_workers"] = self.snapshot_workers
+        if self.cache_dir is not None:
+            result["cache_dir"] = self.cache_dir
 
         return {"synq": result}
 
@@ -73,3 +226,24 @@ class SynqConfig:
     def snapshot_path(self) -> Path:
         """Get the snapshot directory path."""
         return Path(self.snapshot_dir)
+
+    @property
+    def cache_path(self) -> Path:
+        """Get the directory of derived files, see ``synq.core.cache``."""
+        return cache_path(self)
+
+    @property
+    def target_db_uris(self) -> list[str]:
+        """Get the database URIs ``synq migrate`` fans out to.
+
+        Combines ``db_uris`` with ``db_uri_template`` expanded once per entry
+        of ``db_targets``, without repeats. Empty when no multi-target setup
+        is configured.
+        """
+        uris = list(self.db_uris)
+        if self.db_uri_template:
+            uris.extend(
+                self.db_uri_template.replace("{target}", target)
+                for target in self.db_targets
+            )
+        return list(dict.fromkeys(uris))
@@ -1,7 +1,10 @@
 """Database connection and migration state management."""
 
+import weakref
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Optional, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
 if TYPE_CHECKING:
     pass
@@ -13,20 +16,155 @@ from sqlalchemy import (
     MetaData,
     String,
     Table,
-    create_engine,
+    inspect,
+    select,
     text,
 )
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
+from synq.core.cache import cache_path
+from synq.core.engines import engine_options, get_engine, release_engine
 from synq.core.migration import PendingMigration
+from synq.core.sql_splitter import get_sql_statements
+
+# Directory under the cache directory holding pre-split migration SQL
+STATEMENT_CACHE_DIR = "statements"
+
+# Engines known to have the tracking tables, shared by every manager
+_engines_with_migrations_table: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+# Dialects whose DDL statements can be rolled back as part of a transaction
+_TRANSACTIONAL_DDL_DIALECTS = frozenset({"postgresql", "mssql"})
+
+
+def define_migrations_table(metadata: MetaData) -> Table:
+    """Define the table recording applied migrations on a MetaData."""
+    return Table(
+        "synq_migrations",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("filename", String(255), nullable=False, unique=True),
+        Column("applied_at", DateTime, default=lambda: datetime.now(timezone.utc)),
+    )
+
+
+def define_high_water_mark_table(metadata: MetaData) -> Table:
+    """Define the one-row table holding the highest applied migration."""
+    return Table(
+        "synq_high_water_mark",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("filename", String(255), nullable=False),
+    )
+
+
+_T = TypeVar("_T")
+
+
+class _MissingTableError(Exception):
+    """Raised internally when a read finds a tracking table missing."""
+
+
+# Primary key of the only row of the high-water mark table
+_HIGH_WATER_MARK_ID = 1
+
+
+def create_tracking_tables(
+    conn: Connection, migrations_table: Table, high_water_mark_table: Table
+) -> None:
+    """Create the migrations and high-water mark tables that do not exist yet.
+
+    A high-water mark table added to a database that already has applied
+    migrations is filled from them, so this reads the applied history once.
+    """
+    migrations_table.create(conn, checkfirst=True)
+    if inspect(conn).has_table(high_water_mark_table.name):
+        return
+
+    high_water_mark_table.create(conn)
+    filenames = conn.execute(select(migrations_table.c.filename)).scalars()
+    latest = _highest_migration(filenames)
+    if latest is not None:
+        conn.execute(
+            high_water_mark_table.insert().values(
+                id=_HIGH_WATER_MARK_ID, filename=latest
+            )
+        )
+
+
+def record_applied_migrations(
+    conn: Connection,
+    migrations_table: Table,
+    high_water_mark_table: Table,
+    filenames: list[str],
+) -> None:
+    """Record migrations as applied and raise the high-water mark.
+
+    Runs in the caller's transaction, so the mark never disagrees with the
+    migrations table.
+    """
+    applied_at = datetime.now(timezone.utc)
+    conn.execute(
+        migrations_table.insert(),
+        [{"filename": filename, "applied_at": applied_at} for filename in filenames],
+    )
+
+    mark = high_water_mark_table.c
+    current = conn.execute(
+        select(mark.filename).where(mark.id == _HIGH_WATER_MARK_ID)
+    ).scalar()
+    latest = _highest_migration([*filenames, *([current] if current else [])])
+    if latest == current:
+        return
+
+    if current is None:
+        conn.execute(
+            high_water_mark_table.insert().values(
+                id=_HIGH_WATER_MARK_ID, filename=latest
+            )
+        )
+    else:
+        conn.execute(
+            high_water_mark_table.update()
+            .where(mark.id == _HIGH_WATER_MARK_ID)
+            .values(filename=latest)
+        )
+
+
+def statement_cache_dir(config: Optional[Any]) -> Optional[Path]:
+    """Get the directory caching pre-split migration SQL for a config."""
+    return cache_path(config) / STATEMENT_CACHE_DIR if config is not None else None
+
+
+def _highest_migration(filenames: Iterable[str]) -> Optional[str]:
+    """Pick the filename with the highest numeric prefix."""
+    latest: Optional[tuple[int, str]] = None
+    unnumbered: Optional[str] = None
+
+    for filename in filenames:
+        prefix = filename.split("_", 1)[0]
+        if prefix.isdigit():
+            if latest is None or (int(prefix), filename) > latest:
+                latest = (int(prefix), filename)
+        elif unnumbered is None or filename > unnumbered:
+            unnumbered = filename
+
+    return latest[1] if latest is not None else unnumbered
+
+
+def uses_backslash_escapes(dialect_name: str) -> bool:
+    """Whether string literals of a dialect treat backslashes as escapes."""
+    return dialect_name in ("mysql", "mariadb")
 
 
 class DatabaseManager:
     """Manages database connections and migration state."""
 
-    def __init__(self, db_uri_or_config: Union[str, Any]) -> None:
+    def __init__(
+        self, db_uri_or_config: Union[str, Any], read_only: bool = False
+    ) -> None:
         # Handle both string URI and config object for backward compatibility
         if hasattr(db_uri_or_config, "db_uri"):
             # It's a config object
@@ -40,37 +178,72 @@ class DatabaseManager:
         if not self.db_uri:
             raise ValueError("Database URI is required")
 
-        self.engine: Engine = create_engine(self.db_uri)
+        # A read-only manager never issues DDL and refuses to apply migrations
+        self.read_only = read_only
+
+        self.statement_cache_dir = statement_cache_dir(self.config)
+
+        # Engines are shared per URI, so managers in one process reuse pools
+        self.engine: Engine = get_engine(self.db_uri, **engine_options(self.config))
+        self._closed = False
         self.SessionClass = sessionmaker(bind=self.engine)
 
-        # Define migrations table using SQLAlchemy ORM
+        # Define migrations table using SQLAlchemy ORM. It is created on
+        # first use rather than here, so constructing a manager is free.
         self.metadata: MetaData = MetaData()
-        self.migrations_table: Table = Table(
-            "synq_migrations",
-            self.metadata,
-            Column("id", Integer, primary_key=True),
-            Column("filename", String(255), nullable=False, unique=True),
-            Column("applied_at", DateTime, default=lambda: datetime.now(timezone.utc)),
-        )
-
-        self._ensure_migrations_table()
+        self.migrations_table: Table = define_migrations_table(self.metadata)
+        self.high_water_mark_table: Table = define_high_water_mark_table(self.metadata)
+
+    def _migrations_table_ready(self) -> bool:
+        """Check that the tracking tables exist, creating them unless read-only.
+
+        The check runs once per engine: after the tables have been seen, later
+        calls return without touching the database. A read-only manager on a
+        database without the high-water mark table, which older versions did
+        not create, still reads the migrations table.
+
+        Returns:
+            False only in read-only mode when the migrations table does not
+            exist yet
+        """
+        if self.engine in _engines_with_migrations_table:
+            return True
 
-    def _ensure_migrations_table(self) -> None:
-        """Ensure the migrations tracking table exists."""
         try:
-            # Create the table if it doesn't exist
-            self.metadata.create_all(self.engine, tables=[self.migrations_table])
-        except SQLAlchemyError:
-            # If creation fails, the table might already exist
-            # Try to verify by querying it
+            with self.engine.connect() as conn:
+                inspector = inspect(conn)
+                has_migrations = inspector.has_table(self.migrations_table.name)
+                has_mark = inspector.has_table(self.high_water_mark_table.name)
+        except SQLAlchemyError as exc:
+            raise RuntimeError(
+                f"Failed to create or access migrations table: {exc}"
+            ) from exc
+
+        if not (has_migrations and has_mark):
+            if self.read_only:
+                return has_migrations
+
             try:
-                with self.engine.connect() as conn:
-                    conn.execute(self.migrations_table.select().limit(1))
+                with self.engine.begin() as conn:
+                    create_tracking_tables(
+                        conn, self.migrations_table, self.high_water_mark_table
+                    )
             except SQLAlchemyError as exc:
                 raise RuntimeError(
                     f"Failed to create or access migrations table: {exc}"
                 ) from exc
 
+        _engines_with_migrations_table.add(self.engine)
+        return True
+
+    def _ensure_migrations_table(self) -> None:
+        """Ensure the migrations tracking table exists."""
+        if not self._migrations_table_ready():
+            raise RuntimeError(
+                "The migrations table does not exist and cannot be created "
+                "in read-only mode"
+            )
+
     def ensure_migrations_table(self) -> None:
         """Public method to ensure the migrations tracking table exists."""
         self._ensure_migrations_table()
@@ -79,53 +252,98 @@ class DatabaseManager:
         """Alias for ensure_migrations_table for backwards compatibility."""
         self._ensure_migrations_table()
 
-    def get_applied_migrations(self) -> list[str]:
-        """Get list of applied migration filenames."""
+    def _read(self, table: Table, read: Callable[[Connection], _T]) -> _T:
+        """Run a read on a tracking table, assuming it exists.
+
+        Whether the table exists is only checked when the read fails, so
+        reading an existing table takes one query even in a fresh process.
+
+        Raises:
+            _MissingTableError: If the table does not exist
+            RuntimeError: If the read fails for another reason
+        """
         try:
-            with self.SessionClass() as session:
-                result = session.execute(
-                    self.migrations_table.select().order_by(
-                        self.migrations_table.c.filename
-                    )
-                )
-                return [row.filename for row in result.fetchall()]
+            with self.engine.connect() as conn:
+                return read(conn)
         except SQLAlchemyError as e:
-            raise RuntimeError(f"Failed to query applied migrations: {e}") from e
+            error = e
 
-    def apply_migration(self, migration: PendingMigration) -> None:
-        """Apply a single migration to the database."""
-        with self.engine.connect() as conn, conn.begin() as trans:
-            try:
-                # Execute migration SQL statements
-                statements = [stmt.strip() for stmt in migration.sql_content.split(";")]
+        try:
+            with self.engine.connect() as conn:
+                exists = inspect(conn).has_table(table.name)
+        except SQLAlchemyError as exc:
+            raise RuntimeError(
+                f"Failed to create or access migrations table: {exc}"
+            ) from exc
+
+        if exists:
+            raise RuntimeError(
+                f"Failed to query applied migrations: {error}"
+            ) from error
+        raise _MissingTableError(table.name)
+
+    def get_applied_migrations(self) -> list[str]:
+        """Get list of applied migration filenames.
+
+        A missing migrations table reads as empty in read-only mode and is
+        created otherwise.
+        """
+        filename = self.migrations_table.c.filename
 
-                for statement in statements:
-                    # Skip empty statements
-                    if not statement or not statement.strip():
-                        continue
+        def read(conn: Connection) -> list[str]:
+            return list(conn.execute(select(filename).order_by(filename)).scalars())
 
-                    # Remove comments but keep SQL statements
-                    sql_lines = []
-                    for line in statement.split("\n"):
-                        line = line.strip()
-                        if line and not line.startswith("--"):
-                            sql_lines.append(line)
+        try:
+            return self._read(self.migrations_table, read)
+        except _MissingTableError:
+            if not self._migrations_table_ready():
+                return []
+        return self._read(self.migrations_table, read)
+
+    def get_latest_applied_migration(self) -> Optional[str]:
+        """Get the applied migration with the highest number, the high-water mark.
+
+        The mark is kept in its own one-row table, raised whenever migrations
+        are applied, so reading it costs one row however long the history.
+        Numbers are compared as integers, so ``10000_x.sql`` is above
+        ``9999_y.sql`` although it sorts before it as a string.
+
+        Returns:
+            The filename with the highest numeric prefix, the highest
+            filename when none is numbered, or None if nothing was applied
+        """
+        mark = self.high_water_mark_table.c
+
+        def read_mark(conn: Connection) -> Optional[str]:
+            return conn.execute(
+                select(mark.filename).where(mark.id == _HIGH_WATER_MARK_ID)
+            ).scalar()
+
+        try:
+            return self._read(self.high_water_mark_table, read_mark)
+        except _MissingTableError:
+            if not self._migrations_table_ready():
+                return None
 
-                    clean_statement = "\n".join(sql_lines).strip()
+        if self.engine in _engines_with_migrations_table:
+            return self._read(self.high_water_mark_table, read_mark)
 
-                    if not clean_statement:
-                        continue
+        # Read-only, and the database predates the mark table
+        def read_history(conn: Connection) -> Optional[str]:
+            filenames = conn.execute(select(self.migrations_table.c.filename))
+            return _highest_migration(filenames.scalars())
 
-                    # Execute the statement
-                    conn.execute(text(clean_statement))
+        return self._read(self.migrations_table, read_history)
+
+    def apply_migration(self, migration: PendingMigration) -> None:
+        """Apply a single migration to the database."""
+        self._check_writable()
+        with self.engine.connect() as conn, conn.begin() as trans:
+            try:
+                self._execute_migration_sql(conn, migration.sql_content)
 
                 # Record migration as applied
-                conn.execute(
-                    self.migrations_table.insert().values(
-                        filename=migration.filename,
-                        applied_at=datetime.now(timezone.utc),
-                    )
-                )
+                self._record_applied(conn, [migration.filename])
 
                 # Explicitly commit the transaction
                 trans.commit()
@@ -137,6 +355,69 @@ class DatabaseManager:
                     f"Failed to apply migration {migration.filename}: {e}"
                 ) from e
 
+    def apply_migrations_batch(self, migrations: list[PendingMigration]) -> None:
+        """Apply several migrations over a single connection.
+
+        On databases with transactional DDL all migrations run in one
+        transaction and are recorded with a single bulk insert, so either
+        all of them are applied or none. Elsewhere a failed migration cannot
+        undo the DDL that already ran, so each migration is committed and
+        recorded as soon as it has been applied.
+        """
+        if not migrations:
+            return
+
+        self._check_writable()
+
+        if self.engine.dialect.name not in _TRANSACTIONAL_DDL_DIALECTS:
+            with self.engine.connect() as conn:
+                for migration in migrations:
+                    with conn.begin() as trans:
+                        try:
+                            self._execute_migration_sql(conn, migration.sql_content)
+                            self._record_applied(conn, [migration.filename])
+                        except Exception as e:
+                            trans.rollback()
+                            raise RuntimeError(
+                                f"Failed to apply migration {migration.filename}: {e}"
+                            ) from e
+            return
+
+        with self.engine.connect() as conn, conn.begin() as trans:
+            for migration in migrations:
+                try:
+                    self._execute_migration_sql(conn, migration.sql_content)
+                except Exception as e:
+                    trans.rollback()
+                    raise RuntimeError(
+                        f"Failed to apply migration {migration.filename}, "
+                        f"rolled back the whole batch: {e}"
+                    ) from e
+
+            self._record_applied(conn, [migration.filename for migration in migrations])
+            trans.commit()
+
+    def _record_applied(self, conn: Connection, filenames: list[str]) -> None:
+        """Record migrations as applied in the open transaction."""
+        record_applied_migrations(
+            conn, self.migrations_table, self.high_water_mark_table, filenames
+        )
+
+    def _check_writable(self) -> None:
+        """Refuse changes in read-only mode and make sure the table exists."""
+        if self.read_only:
+            raise RuntimeError("Cannot apply migrations in read-only mode")
+        self._ensure_migrations_table()
+
+    def _execute_migration_sql(self, conn: Connection, sql_content: str) -> None:
+        """Execute the statements of a migration on an open connection."""
+        for statement in get_sql_statements(
+            sql_content,
+            uses_backslash_escapes(self.engine.dialect.name),
+            self.statement_cache_dir,
+        ):
+            conn.execute(text(statement))
+
     def rollback(self) -> None:
         """Rollback current transaction (handled by context manager)."""
         # This method exists for API completeness
@@ -194,6 +475,11 @@ class DatabaseManager:
             self.apply_migration(migration)
 
     def close(self) -> None:
-        """Close database connection."""
-        if self.engine:
-            self.engine.dispose()
+        """Close database connection.
+
+        Engines shared with other managers are left open until the last of
+        them is closed.
+        """
+        if self.engine and not self._closed:
+            self._closed = True
+            release_engine(self.engine)
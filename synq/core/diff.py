@@ -78,8 +78,8 @@ class SchemaDiffer:
         operations = []
 
         # Create table name sets for comparison
-        old_tables = {table.name: table for table in old_snapshot.tables}
-        new_tables = {table.name: table for table in new_snapshot.tables}
+        old_tables = old_snapshot.tables_by_name
+        new_tables = new_snapshot.tables_by_name
 
         old_table_names = set(old_tables.keys())
         new_table_names = set(new_tables.keys())
@@ -106,9 +106,14 @@ class SchemaDiffer:
 
         # Find modified tables
         for table_name in old_table_names & new_table_names:
-            table_operations = self._detect_table_changes(
-                old_tables[table_name], new_tables[table_name]
-            )
+            old_table = old_tables[table_name]
+            new_table = new_tables[table_name]
+
+            # Identical content hashes mean there is nothing to compare
+            if old_table.fingerprint() == new_table.fingerprint():
+                continue
+
+            table_operations = self._detect_table_changes(old_table, new_table)
             operations.extend(table_operations)
 
         return operations
@@ -0,0 +1,192 @@
+"""Process-wide registry of SQLAlchemy engines."""
+
+import os
+import threading
+from typing import Any, Optional, cast
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.engine.default import DefaultDialect
+from sqlalchemy.pool import QueuePool
+
+# Engines by normalized URI and options, reused by every manager in the process
+_engines: dict[tuple[str, tuple[tuple[str, Any], ...]], Engine] = {}
+
+# Number of ``get_engine`` calls not yet matched by ``release_engine``
+_engine_references: dict[Engine, int] = {}
+_engines_lock = threading.Lock()
+
+# Connection argument naming the connect timeout, by dialect
+_CONNECT_TIMEOUT_ARGS = {
+    "postgresql": "connect_timeout",
+    "mysql": "connect_timeout",
+    "mariadb": "connect_timeout",
+    "sqlite": "timeout",
+}
+
+
+def engine_options(config: Optional[Any]) -> dict[str, Any]:
+    """Collect the engine settings configured in synq.toml."""
+    options = {
+        "pool_size": getattr(config, "pool_size", None),
+        "pool_pre_ping": getattr(config, "pool_pre_ping", False),
+        "connect_timeout": getattr(config, "connect_timeout", None),
+        "statement_timeout": getattr(config, "statement_timeout", None),
+    }
+    return {key: value for key, value in options.items() if value}
+
+
+def get_engine(
+    db_uri: str,
+    pool_size: Optional[int] = None,
+    pool_pre_ping: bool = False,
+    connect_timeout: Optional[float] = None,
+    statement_timeout: Optional[float] = None,
+) -> Engine:
+    """
+    Get the shared engine for a database URI, creating it on first use.
+
+    Managers asking for the same URI and options get the same engine and
+    therefore share its connection pool. Every call must be matched by a
+    ``release_engine`` call; the engine is disposed once the last user
+    releases it. In-memory SQLite databases are private to their
+    connection, so those always get a new engine.
+
+    Args:
+        db_uri: The database URI
+        pool_size: Number of connections kept in the pool
+        pool_pre_ping: Test pooled connections before handing them out
+        connect_timeout: Seconds to wait when opening a connection
+        statement_timeout: Seconds a statement may run before the
+            database cancels it (PostgreSQL, MySQL and MariaDB)
+    """
+    url = make_url(db_uri)
+    options: dict[str, Any] = {
+        "pool_size": pool_size,
+        "pool_pre_ping": pool_pre_ping,
+        "connect_timeout": connect_timeout,
+        "statement_timeout": statement_timeout,
+    }
+
+    if _is_memory_database(url):
+        return _create_engine(url, **options)
+
+    if url.get_backend_name() == "sqlite" and url.database:
+        # Relative paths depend on the working directory at connect time
+        url = url.set(database=os.path.abspath(url.database))
+
+    key = (url.render_as_string(hide_password=False), tuple(sorted(options.items())))
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _create_engine(url, **options)
+            _engines[key] = engine
+        _engine_references[engine] = _engine_references.get(engine, 0) + 1
+
+    return engine
+
+
+def release_engine(engine: Engine) -> None:
+    """Release an engine obtained from ``get_engine``.
+
+    Shared engines stay open while other managers still use them. The last
+    release removes the engine from the registry and disposes its pool.
+    """
+    with _engines_lock:
+        references = _engine_references.get(engine, 0) - 1
+        if references > 0:
+            _engine_references[engine] = references
+            return
+
+        _engine_references.pop(engine, None)
+        for key, registered in list(_engines.items()):
+            if registered is engine:
+                del _engines[key]
+
+    engine.dispose()
+
+
+def dispose_engines() -> None:
+    """Dispose every shared engine and empty the registry.
+
+    Engines still held by managers are disposed too; their pools reconnect
+    on next use, but those engines are no longer shared.
+    """
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+        _engine_references.clear()
+
+    for engine in engines:
+        engine.dispose()
+
+
+def _is_memory_database(url: URL) -> bool:
+    """Check whether a URL points to an in-memory SQLite database."""
+    return url.get_backend_name() == "sqlite" and (
+        url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+    )
+
+
+def _uses_queue_pool(url: URL) -> bool:
+    """Check whether engines for a URL get a pool that takes ``pool_size``."""
+    dialect = cast("type[DefaultDialect]", url.get_dialect())
+    return issubclass(dialect.get_pool_class(url), QueuePool)
+
+
+def _create_engine(
+    url: URL,
+    pool_size: Optional[int],
+    pool_pre_ping: bool,
+    connect_timeout: Optional[float],
+    statement_timeout: Optional[float],
+) -> Engine:
+    """Create an engine applying the configured pool and timeout settings."""
+    backend = url.get_backend_name()
+    kwargs: dict[str, Any] = {}
+
+    # Only queue pools have a size: SQLite in-memory databases use a
+    # SingletonThreadPool, and file databases a NullPool on SQLAlchemy 1.4
+    if pool_size is not None and _uses_queue_pool(url):
+        kwargs["pool_size"] = pool_size
+    if pool_pre_ping:
+        kwargs["pool_pre_ping"] = True
+
+    timeout_arg = _CONNECT_TIMEOUT_ARGS.get(backend)
+    if connect_timeout is not None and timeout_arg is not None:
+        # psycopg2 and the MySQL drivers only accept whole seconds
+        kwargs["connect_args"] = {
+            timeout_arg: connect_timeout
+            if backend == "sqlite"
+            else max(1, round(connect_timeout))
+        }
+
+    engine = create_engine(url, **kwargs)
+
+    if statement_timeout is not None:
+        _set_statement_timeout(engine, statement_timeout)
+
+    return engine
+
+
+def _set_statement_timeout(engine: Engine, seconds: float) -> None:
+    """Apply a server-side statement timeout to every new connection."""
+    milliseconds = int(seconds * 1000)
+    backend = engine.dialect.name
+
+    if backend == "postgresql":
+        statement = f"SET statement_timeout = {milliseconds}"
+    elif backend == "mariadb":
+        statement = f"SET SESSION max_statement_time = {seconds}"
+    elif backend == "mysql":
+        statement = f"SET SESSION max_execution_time = {milliseconds}"
+    else:
+        return
+
+    @event.listens_for(engine, "connect")
+    def set_timeout(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
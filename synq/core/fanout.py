@@ -0,0 +1,134 @@
+"""Applying migrations to many databases in parallel."""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+
+from synq.core.config import SynqConfig
+from synq.core.database import DatabaseManager
+from synq.core.migration import MigrationFile, MigrationManager
+
+
+@dataclass
+class TargetResult:
+    """Outcome of migrating one target database."""
+
+    db_uri: str
+    applied: list[str] = field(default_factory=list)
+    pending: list[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the target was migrated without errors."""
+        return self.error is None
+
+    @property
+    def display_name(self) -> str:
+        """The target URI with any password masked."""
+        return display_uri(self.db_uri)
+
+
+def display_uri(db_uri: str) -> str:
+    """Render a database URI for output, hiding its password."""
+    try:
+        return make_url(db_uri).render_as_string(hide_password=True)
+    except Exception:
+        return db_uri
+
+
+def migrate_targets(
+    config: SynqConfig,
+    db_uris: list[str],
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+    batch: bool = False,
+    on_result: Optional[Callable[[TargetResult], None]] = None,
+) -> list[TargetResult]:
+    """
+    Apply pending migrations to several databases using a bounded thread pool.
+
+    Each target gets its own ``DatabaseManager``, and a failure on one target
+    is recorded in its result without affecting the others. Migration files
+    are listed once and shared by all targets, so each file's SQL is read at
+    most once. A URI given more than once is migrated once.
+
+    Args:
+        config: Configuration whose migrations are applied
+        db_uris: Database URIs to migrate
+        max_workers: Number of targets migrated at once, defaults to
+            ``config.migrate_workers``
+        dry_run: Only collect the pending migrations of each target
+        batch: Apply each target's migrations with ``apply_migrations_batch``
+        on_result: Called with each result as soon as its target finishes
+
+    Returns:
+        One result per distinct URI, in the order of ``db_uris``
+    """
+    # Migrating one database twice at once would race, and results are by URI
+    db_uris = list(dict.fromkeys(db_uris))
+
+    migration_manager = MigrationManager(config)
+    migrations = migration_manager.get_all_migrations()
+    workers = max(1, min(max_workers or config.migrate_workers, len(db_uris) or 1))
+
+    results: dict[str, TargetResult] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _migrate_target,
+                config,
+                migration_manager,
+                migrations,
+                db_uri,
+                dry_run,
+                batch,
+            ): db_uri
+            for db_uri in db_uris
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+
+    return [results[db_uri] for db_uri in db_uris]
+
+
+def _migrate_target(
+    config: SynqConfig,
+    migration_manager: MigrationManager,
+    migrations: list[MigrationFile],
+    db_uri: str,
+    dry_run: bool,
+    batch: bool,
+) -> TargetResult:
+    """Migrate a single target, capturing any error in the result."""
+    result = TargetResult(db_uri=db_uri)
+    db_manager = None
+
+    try:
+        db_manager = DatabaseManager(replace(config, db_uri=db_uri))
+        pending = migration_manager.get_pending_migrations(db_manager, migrations)
+        result.pending = [migration.filename for migration in pending]
+
+        if dry_run or not pending:
+            return result
+
+        if batch:
+            db_manager.apply_migrations_batch(pending)
+            result.applied = list(result.pending)
+        else:
+            for migration in pending:
+                db_manager.apply_migration(migration)
+                result.applied.append(migration.filename)
+    except Exception as e:
+        result.error = str(e)
+    finally:
+        if db_manager is not None:
+            db_manager.close()
+
+    return result
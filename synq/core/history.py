@@ -0,0 +1,290 @@
+"""Index of the migrations at which tables and columns changed."""
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from synq.core.cache import cache_path, ensure_cache_dir
+from synq.core.snapshot import ColumnSnapshot, SchemaSnapshot, TableSnapshot
+
+if TYPE_CHECKING:
+    from synq.core.snapshot import SnapshotManager
+
+# Bumped whenever the index layout changes, so old indexes are rebuilt
+HISTORY_INDEX_VERSION = 1
+
+HISTORY_INDEX_FILE = "history.json"
+
+# Kinds of change recorded in the history
+ADDED = "added"
+CHANGED = "changed"
+DROPPED = "dropped"
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    """A change to a table or column in one snapshot."""
+
+    migration_number: int
+    change: str
+
+
+class HistoryIndex:
+    """Records, per table and column, the snapshots in which it changed.
+
+    The index is stored in ``history.json`` in the cache directory, see
+    ``cache_path(config)``. It is built by reading every snapshot once, and
+    afterwards extended with each snapshot saved after the last indexed one,
+    so answering a query does not read any snapshot. The index is rebuilt
+    when the snapshots it was built from no longer match the ones on disk,
+    e.g. after switching branches.
+
+    A table counts as changed when its fingerprint changes, which includes
+    its indexes and foreign keys. A column counts as changed when any of its
+    attributes do.
+    """
+
+    def __init__(self, snapshot_manager: "SnapshotManager") -> None:
+        self.snapshot_manager = snapshot_manager
+        self.index_file = cache_path(snapshot_manager.config) / HISTORY_INDEX_FILE
+
+        # Indexed snapshot numbers, in order
+        self.snapshots: list[int] = []
+        self.last_fingerprint: Optional[str] = None
+
+        # Per (schema, name): current fingerprint (None once dropped), the
+        # changes, and per column its current hash and changes
+        self.tables: dict[tuple[Optional[str], str], dict[str, Any]] = {}
+
+        # Tables of the last snapshot added in this process. Their stored
+        # fingerprints are only brought up to date when the index is written.
+        self._current: dict[tuple[Optional[str], str], TableSnapshot] = {}
+
+    def table_history(
+        self, name: str, schema: Optional[str] = None
+    ) -> list[HistoryEntry]:
+        """Get the snapshots in which a table was added, changed or dropped."""
+        self.refresh()
+
+        table = self.tables.get((schema, name))
+        if table is None:
+            return []
+        return [HistoryEntry(number, change) for number, change in table["changes"]]
+
+    def column_history(
+        self, table_name: str, column_name: str, schema: Optional[str] = None
+    ) -> list[HistoryEntry]:
+        """Get the snapshots in which a column was added, changed or dropped."""
+        self.refresh()
+
+        table = self.tables.get((schema, table_name))
+        if table is None or column_name not in table["columns"]:
+            return []
+        return [
+            HistoryEntry(number, change)
+            for number, change in table["columns"][column_name]["changes"]
+        ]
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the stored snapshots.
+
+        Snapshots saved since the index was written are added to it. When
+        the indexed snapshots are no longer a prefix of the stored ones,
+        the index is rebuilt from scratch.
+        """
+        numbers = self.snapshot_manager.get_all_snapshots()
+
+        current = self._load() and self._is_prefix_of(numbers)
+        if not current:
+            self._reset()
+
+        # Snapshots are decoded in parallel, but added one at a time, in order
+        new_numbers = numbers[len(self.snapshots) :]
+        for number, snapshot in self.snapshot_manager.iter_snapshots(new_numbers):
+            if snapshot is None:
+                raise ValueError(f"Snapshot {number:04d} could not be read")
+            self.add_snapshot(number, snapshot)
+
+        if new_numbers or not current:
+            self._write()
+
+    def record(self, migration_number: int, snapshot: SchemaSnapshot) -> None:
+        """Update a stored index for a snapshot that was just saved.
+
+        Only appending the next snapshot is done incrementally. Otherwise,
+        e.g. when an earlier snapshot was overwritten, the index is dropped
+        and rebuilt by the next query. Without a stored index nothing is
+        done, so projects that never query the history never build it.
+        """
+        if not self.index_file.exists():
+            return
+
+        numbers = self.snapshot_manager.get_all_snapshots()
+        if (
+            self._load()
+            and numbers[-1:] == [migration_number]
+            and len(self.snapshots) == len(numbers) - 1
+            and self._is_prefix_of(numbers)
+        ):
+            self.add_snapshot(migration_number, snapshot)
+            self._write()
+        else:
+            with contextlib.suppress(OSError):
+                self.index_file.unlink()
+
+    def add_snapshot(self, migration_number: int, snapshot: SchemaSnapshot) -> None:
+        """Record the differences between a snapshot and the indexed state."""
+        current = {}
+        for table in snapshot.tables:
+            key = (table.schema, table.name)
+            current[key] = table
+
+            entry = self.tables.setdefault(
+                key, {"fingerprint": None, "changes": [], "columns": {}}
+            )
+
+            previous = self._current.get(key)
+            if previous is not None:
+                # Comparing with the previous snapshot is cheaper than
+                # fingerprinting, and free for tables shared through deltas
+                if previous is table or previous == table:
+                    continue
+                change = CHANGED
+            elif entry["fingerprint"] is not None:
+                if entry["fingerprint"] == table.fingerprint():
+                    continue
+                change = CHANGED
+            else:
+                change = ADDED
+
+            entry["changes"].append([migration_number, change])
+            _record_columns(entry["columns"], migration_number, table.columns)
+
+        for key, entry in self.tables.items():
+            if key not in current and (
+                key in self._current or entry["fingerprint"] is not None
+            ):
+                entry["changes"].append([migration_number, DROPPED])
+                entry["fingerprint"] = None
+                _record_columns(entry["columns"], migration_number, [])
+
+        self._current = current
+
+        self.snapshots.append(migration_number)
+        self.last_fingerprint = self.snapshot_manager.get_snapshot_fingerprint(
+            migration_number
+        )
+
+    def _is_prefix_of(self, numbers: list[int]) -> bool:
+        """Check that the indexed snapshots are still the first ones stored."""
+        if numbers[: len(self.snapshots)] != self.snapshots:
+            return False
+        if not self.snapshots:
+            return True
+
+        # Catches a snapshot that was replaced, e.g. by a checkout
+        return bool(
+            self.snapshot_manager.get_snapshot_fingerprint(self.snapshots[-1])
+            == self.last_fingerprint
+        )
+
+    def _reset(self) -> None:
+        """Forget everything indexed so far."""
+        self.snapshots = []
+        self.last_fingerprint = None
+        self.tables = {}
+        self._current = {}
+
+    def _load(self) -> bool:
+        """Read the stored index.
+
+        Returns:
+            False if there is no usable index
+        """
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        try:
+            if data["version"] != HISTORY_INDEX_VERSION:
+                return False
+            self.snapshots = [int(number) for number in data["snapshots"]]
+            self.last_fingerprint = data["last_fingerprint"]
+            self.tables = {
+                (table["schema"], table["name"]): {
+                    "fingerprint": table["fingerprint"],
+                    "changes": table["changes"],
+                    "columns": table["columns"],
+                }
+                for table in data["tables"]
+            }
+        except (KeyError, TypeError, ValueError):
+            self._reset()
+            return False
+
+        return True
+
+    def _write(self) -> None:
+        """Store the index; errors are ignored, it is rebuilt when missing."""
+        for key, table in self._current.items():
+            self.tables[key]["fingerprint"] = table.fingerprint()
+
+        data = {
+            "version": HISTORY_INDEX_VERSION,
+            "snapshots": self.snapshots,
+            "last_fingerprint": self.last_fingerprint,
+            "tables": [
+                {"schema": schema, "name": name, **entry}
+                for (schema, name), entry in self.tables.items()
+            ],
+        }
+
+        try:
+            ensure_cache_dir(self.index_file.parent)
+            # Write then rename, so concurrent readers never see a partial index
+            fd, temp_name = tempfile.mkstemp(
+                dir=self.index_file.parent, prefix=".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(temp_name, self.index_file)
+            except BaseException:
+                os.unlink(temp_name)
+                raise
+        except OSError:
+            pass
+
+
+def _record_columns(
+    columns: dict[str, dict[str, Any]],
+    migration_number: int,
+    current: list[ColumnSnapshot],
+) -> None:
+    """Record the column changes of a table between two snapshots."""
+    present = set()
+    for column in current:
+        present.add(column.name)
+        entry = columns.setdefault(column.name, {"hash": None, "changes": []})
+        column_hash = _column_hash(column)
+        if entry["hash"] != column_hash:
+            change = ADDED if entry["hash"] is None else CHANGED
+            entry["changes"].append([migration_number, change])
+            entry["hash"] = column_hash
+
+    for name, entry in columns.items():
+        if name not in present and entry["hash"] is not None:
+            entry["changes"].append([migration_number, DROPPED])
+            entry["hash"] = None
+
+
+def _column_hash(column: ColumnSnapshot) -> str:
+    """Hash a column definition, short enough to keep the index small."""
+    payload = json.dumps(asdict(column), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
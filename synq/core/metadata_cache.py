@@ -0,0 +1,138 @@
+"""Cache of the schema fingerprint produced by the user's model modules."""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from synq.core.cache import cache_path, ensure_cache_dir
+
+# Bumped whenever the cache layout changes, so old caches are ignored
+METADATA_CACHE_VERSION = 1
+
+METADATA_CACHE_FILE = "metadata_cache.json"
+
+
+class MetadataCache:
+    """Remembers the schema fingerprint of the imported MetaData.
+
+    Alongside the fingerprint, the cache records every source file of the
+    project that was imported to build the MetaData. As long as none of
+    those files changed, the fingerprint still describes the models, so
+    ``synq generate`` can tell that nothing changed without importing the
+    application at all.
+
+    Files are compared by modification time and size first, and only
+    re-hashed when those differ, so touching a file without editing it
+    still hits the cache.
+    """
+
+    def __init__(self, config: Any, project_root: Optional[Path] = None) -> None:
+        self.config = config
+        self.project_root = (project_root or Path.cwd()).resolve()
+        self.cache_file = cache_path(config) / METADATA_CACHE_FILE
+
+    def get_fingerprint(self) -> Optional[str]:
+        """Get the cached fingerprint if no tracked model file changed."""
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("key") != self._cache_key():
+            return None
+
+        files = data.get("files")
+        fingerprint = data.get("fingerprint")
+        if not isinstance(files, dict) or not files or not isinstance(fingerprint, str):
+            return None
+
+        for path, signature in files.items():
+            if not self._file_unchanged(Path(path), signature):
+                return None
+
+        return fingerprint
+
+    def store(self, fingerprint: str) -> None:
+        """Record a fingerprint together with the currently imported model files.
+
+        Call this right after importing the MetaData and creating its
+        snapshot. Errors writing the cache are ignored.
+        """
+        files = {}
+        for path in self.project_module_files():
+            try:
+                stat = path.stat()
+                files[str(path)] = [stat.st_mtime_ns, stat.st_size, _hash_file(path)]
+            except OSError:
+                continue
+
+        if not files:
+            return
+
+        data = {"key": self._cache_key(), "fingerprint": fingerprint, "files": files}
+        try:
+            ensure_cache_dir(self.cache_file.parent)
+            with open(self.cache_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+        except OSError:
+            pass
+
+    def project_module_files(self) -> list[Path]:
+        """Get the source files of imported modules that belong to the project."""
+        return project_module_files(self.project_root)
+
+    def _cache_key(self) -> list[str]:
+        """Settings that invalidate the cache when they change."""
+        from synq import __version__
+
+        return [
+            str(METADATA_CACHE_VERSION),
+            self.config.metadata_path,
+            str(self.project_root),
+            __version__,
+        ]
+
+    def _file_unchanged(self, path: Path, signature: Any) -> bool:
+        """Check a tracked file against its recorded signature."""
+        if not isinstance(signature, list) or len(signature) != 3:
+            return False
+
+        mtime_ns, size, digest = signature
+        try:
+            stat = path.stat()
+            if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+                return True
+            return bool(stat.st_size == size and _hash_file(path) == digest)
+        except OSError:
+            return False
+
+
+def _hash_file(path: Path) -> str:
+    """Hash the contents of a source file."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def project_module_files(project_root: Path) -> list[Path]:
+    """Get the source files of imported modules under a project directory.
+
+    Modules installed into a virtual environment inside the project are
+    not part of the models and are skipped.
+    """
+    project_root = project_root.resolve()
+
+    files = set()
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if not module_file or not module_file.endswith(".py"):
+            continue
+
+        path = Path(module_file).resolve()
+        if path.is_relative_to(project_root) and not (
+            {"site-packages", "dist-packages"} & set(path.parts)
+        ):
+            files.add(path)
+
+    return sorted(files)
@@ -1,14 +1,17 @@
 """Migration management and SQL generation."""
 
+import os
 import re
+import threading
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
 # Forward declaration to avoid circular imports
-from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union, overload
 
-from sqlalchemy import MetaData, Table, create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import MetaData, Table
+from sqlalchemy.engine import Dialect, make_url
 from sqlalchemy.schema import CreateTable
 from sqlalchemy.sql.type_api import TypeEngine
 
@@ -26,14 +29,121 @@ if TYPE_CHECKING:
     from synq.core.database import DatabaseManager
 
 
-class MigrationFile(NamedTuple):
-    """Represents a migration file."""
+# Serializes first reads of migration SQL shared between threads
+_sql_read_lock = threading.Lock()
 
-    number: int
-    name: str
-    filename: str
-    filepath: Path
-    sql_content: str
+# Compile-only dialects by URL driver name, kept for the process lifetime
+_compile_dialects: dict[str, Dialect] = {}
+
+
+def _get_compile_dialect(db_uri: Optional[str]) -> Dialect:
+    """Get the dialect used to compile DDL for a database URI.
+
+    Only the dialect is resolved from the URL: no engine or connection pool
+    is created and the DBAPI driver is never imported. SQLite is used when
+    no URI is configured.
+
+    Raises:
+        ValueError: If the URI cannot be parsed or names an unknown dialect
+    """
+    try:
+        url = make_url(db_uri or "sqlite://")
+        dialect = _compile_dialects.get(url.drivername)
+        if dialect is None:
+            dialect = url.get_dialect()()
+            _compile_dialects[url.drivername] = dialect
+    except Exception as e:
+        raise ValueError(f"Could not resolve SQL dialect for db_uri: {e}") from e
+
+    return dialect
+
+
+class MigrationFile:
+    """Represents a migration file.
+
+    The SQL is read from disk the first time ``sql_content`` is accessed, so
+    listing migrations only needs the directory entries. Unpacking, indexing,
+    ``_replace`` and ``_asdict`` work as they did when this was a NamedTuple.
+    """
+
+    _fields = ("number", "name", "filename", "filepath", "sql_content")
+
+    def __init__(
+        self,
+        number: int,
+        name: str,
+        filename: str,
+        filepath: Path,
+        sql_content: Optional[str] = None,
+    ) -> None:
+        self.number = number
+        self.name = name
+        self.filename = filename
+        self.filepath = filepath
+        self._sql_content = sql_content
+
+    @property
+    def sql_content(self) -> str:
+        """The migration SQL, read on first access."""
+        if self._sql_content is None:
+            # Targets migrated in parallel share migration files; read once
+            with _sql_read_lock:
+                if self._sql_content is None:
+                    with open(self.filepath) as f:
+                        self._sql_content = f.read()
+        return self._sql_content
+
+    def __iter__(self) -> Iterator[Any]:
+        return (getattr(self, field) for field in self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Any, ...]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return tuple(getattr(self, field) for field in self._fields[index])
+        return getattr(self, self._fields[index])
+
+    def _replace(self, **changes: Any) -> "MigrationFile":
+        """Return a copy with the given fields replaced, like a NamedTuple."""
+        unknown = set(changes) - set(self._fields)
+        if unknown:
+            raise ValueError(f"Got unexpected field names: {sorted(unknown)!r}")
+        values = {field: getattr(self, field) for field in self._fields[:-1]}
+        # The copy reads the SQL lazily too, unless it would read another file
+        values["sql_content"] = (
+            self.sql_content if "filepath" in changes else self._sql_content
+        )
+        values.update(changes)
+        return MigrationFile(**values)
+
+    def _asdict(self) -> dict[str, Any]:
+        """Return the fields as a dictionary, like a NamedTuple."""
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MigrationFile):
+            return NotImplemented
+        return (self.number, self.filename, self.filepath) == (
+            other.number,
+            other.filename,
+            other.filepath,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.number, self.filename, self.filepath))
+
+    def __repr__(self) -> str:
+        return (
+            f"MigrationFile(number={self.number!r}, name={self.name!r}, "
+            f"filename={self.filename!r}, filepath={self.filepath!r})"
+        )
 
 
 @dataclass
@@ -44,6 +154,24 @@ class PendingMigration:
     sql_content: str
 
 
+def read_migration_files(migrations: Iterable[MigrationFile]) -> list[PendingMigration]:
+    """Read the SQL of migration files to apply.
+
+    Files that can no longer be read, or are not valid text, are skipped,
+    the same as when listing them.
+    """
+    pending = []
+    for migration in migrations:
+        try:
+            sql_content = migration.sql_content
+        except (OSError, ValueError):
+            continue
+        pending.append(
+            PendingMigration(filename=migration.filename, sql_content=sql_content)
+        )
+    return pending
+
+
 class MigrationManager:
     """Manages migration generation and application."""
 
@@ -66,24 +194,14 @@ class MigrationManager:
         if not operations:
             return ""
 
-        # Create a temporary engine for SQL compilation
-        # Use target database if available, otherwise SQLite for compatibility
-        db_uri = getattr(self.config, "db_uri", None)
-        if db_uri and db_uri != "sqlite:///:memory:":
-            try:
-                # Use the actual database URI for proper SQL dialect generation
-                engine = create_engine(db_uri)
-            except Exception:
-                # Fall back to SQLite if target database unavailable
-                engine = create_engine("sqlite:///:memory:")
-        else:
-            engine = create_engine("sqlite:///:memory:")
+        # Compile for the target database's dialect, or SQLite if none is set
+        dialect = _get_compile_dialect(getattr(self.config, "db_uri", None))
 
         sql_statements = []
 
         for operation in operations:
             try:
-                sql = self._operation_to_sql(operation, metadata, engine)
+                sql = self._operation_to_sql(operation, metadata, dialect)
                 if sql:
                     sql_statements.append(f"-- {operation}")
                     sql_statements.append(sql)
@@ -98,7 +216,7 @@ class MigrationManager:
         return "\n".join(sql_statements)
 
     def _operation_to_sql(
-        self, operation: MigrationOperation, metadata: MetaData, engine: Engine
+        self, operation: MigrationOperation, metadata: MetaData, dialect: Dialect
     ) -> str:
         """Convert a single operation to SQL."""
 
@@ -119,7 +237,7 @@ class MigrationManager:
                     )
                 table = self._build_sqlalchemy_table(table_def, metadata)
             create_table = CreateTable(table)
-            return str(create_table.compile(engine)).strip() + ";"
+            return str(create_table.compile(dialect=dialect)).strip() + ";"
 
         if operation.operation_type == OperationType.DROP_TABLE:
             return f"DROP TABLE {operation.table_name};"
@@ -291,10 +409,24 @@ class MigrationManager:
         return filepath
 
     def get_all_migrations(self) -> list[MigrationFile]:
-        """Get all migration files."""
+        """Get all migration files.
+
+        Only the directory is listed; each file's SQL is read when its
+        ``sql_content`` is first accessed. Files that cannot be read are
+        skipped.
+        """
         migration_files = []
 
-        for filepath in sorted(self.migrations_path.glob("*.sql")):
+        # scandir reports file types from the directory listing itself
+        with os.scandir(self.migrations_path) as entries:
+            sql_filenames = sorted(
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".sql") and entry.is_file()
+            )
+
+        for sql_filename in sql_filenames:
+            filepath = self.migrations_path / sql_filename
             try:
                 # Parse migration number and name from filename
                 filename = filepath.stem
@@ -306,9 +438,8 @@ class MigrationManager:
                 number = int(parts[0])
                 name = parts[1]
 
-                # Read SQL content
-                with open(filepath) as f:
-                    sql_content = f.read()
+                if not os.access(filepath, os.R_OK):
+                    continue
 
                 migration_files.append(
                     MigrationFile(
@@ -316,33 +447,68 @@ class MigrationManager:
                         name=name,
                         filename=filepath.name,
                         filepath=filepath,
-                        sql_content=sql_content,
                     )
                 )
 
-            except (OSError, ValueError):
+            except ValueError:
                 # Skip invalid files
                 continue
 
         return migration_files
 
-    def get_pending_migrations(
-        self, db_manager: "DatabaseManager"
-    ) -> list[PendingMigration]:
-        """Get migrations that haven't been applied to the database."""
-        all_migrations = self.get_all_migrations()
+    def get_pending_migration_files(
+        self,
+        db_manager: "DatabaseManager",
+        migrations: Optional[list[MigrationFile]] = None,
+    ) -> list[MigrationFile]:
+        """Get unapplied migration files without reading their SQL.
+
+        ``migrations`` lets callers checking several databases list the
+        migration files once; by default the directory is listed.
+
+        With ``pending_detection = "high_water_mark"`` only the highest
+        applied migration number is kept and every migration numbered above
+        it is pending, so no set of applied names is built and compared.
+        Migrations added below the high-water mark afterwards are not
+        detected in that mode.
+        """
+        if migrations is None:
+            migrations = self.get_all_migrations()
+
+        if getattr(self.config, "pending_detection", "applied") == "high_water_mark":
+            latest = db_manager.get_latest_applied_migration()
+            if latest is None:
+                return migrations
+
+            prefix = latest.split("_", 1)[0]
+            if prefix.isdigit():
+                return [
+                    migration
+                    for migration in migrations
+                    if migration.number > int(prefix)
+                ]
+            # Not a numbered filename, fall back to comparing every name
+
         applied_migrations = set(db_manager.get_applied_migrations())
 
-        pending = []
-        for migration in all_migrations:
-            if migration.filename not in applied_migrations:
-                pending.append(
-                    PendingMigration(
-                        filename=migration.filename, sql_content=migration.sql_content
-                    )
-                )
+        return [
+            migration
+            for migration in migrations
+            if migration.filename not in applied_migrations
+        ]
+
+    def get_pending_migrations(
+        self,
+        db_manager: "DatabaseManager",
+        migrations: Optional[list[MigrationFile]] = None,
+    ) -> list[PendingMigration]:
+        """Get migrations that haven't been applied to the database.
 
-        return pending
+        See ``get_pending_migration_files`` for ``migrations``.
+        """
+        return read_migration_files(
+            self.get_pending_migration_files(db_manager, migrations)
+        )
 
     def create_migration(
         self,
@@ -426,12 +592,12 @@ class MigrationManager:
 
     def _generate_sql_for_metadata(self, metadata: MetaData) -> list[str]:
         """Generate SQL statements for metadata (for testing)."""
-        engine = create_engine("sqlite:///:memory:")
+        dialect = _get_compile_dialect(None)
         statements = []
 
         for table in metadata.tables.values():
             create_table = CreateTable(table)
-            sql = str(create_table.compile(engine)).strip() + ";"
+            sql = str(create_table.compile(dialect=dialect)).strip() + ";"
             statements.append(sql)
 
         return statements
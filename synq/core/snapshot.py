@@ -1,14 +1,72 @@
 """Snapshot system for schema state management."""
 
+import bisect
+import functools
+import hashlib
 import json
+import sys
+import weakref
+from collections import Counter, deque
+from collections.abc import Generator, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import asdict, dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Optional, cast
 
 from sqlalchemy import MetaData, Table
+from sqlalchemy.sql.type_api import TypeEngine
 
+from synq.core.cache import cache_path
 
-@dataclass
+if TYPE_CHECKING:
+    from synq.core.history import HistoryEntry
+
+# File extension used for each supported snapshot format
+SNAPSHOT_EXTENSIONS: dict[str, str] = {"json": ".json", "binary": ".bin"}
+
+# Suffix of snapshots stored as a delta against an earlier snapshot
+DELTA_SUFFIX = "_delta.json"
+
+
+# dataclass(slots=True) needs Python 3.10, older versions keep an instance dict
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _FingerprintSlot:
+    """Base reserving the slot a frozen snapshot caches its fingerprint in."""
+
+    __slots__ = ("_fingerprint",)
+
+
+def _interned(data: dict[str, Any]) -> dict[str, Any]:
+    """Intern the strings of a snapshot dictionary, including list items.
+
+    Type names, column names and defaults repeat across tables and across
+    the snapshots held in memory while diffing, so they share one object.
+    """
+    result = {}
+    for key, value in data.items():
+        if isinstance(value, str):
+            value = sys.intern(value)
+        elif isinstance(value, list):
+            value = [sys.intern(v) if isinstance(v, str) else v for v in value]
+        result[key] = value
+    return result
+
+
+def _intern(value: str) -> str:
+    """Intern a string, converting subclasses such as ``quoted_name`` first."""
+    return sys.intern(str(value))
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern a string that may be None."""
+    return None if value is None else _intern(value)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ColumnSnapshot:
     """Snapshot of a column definition."""
 
@@ -21,7 +79,7 @@ class ColumnSnapshot:
     unique: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class IndexSnapshot:
     """Snapshot of an index definition."""
 
@@ -30,7 +88,7 @@ class IndexSnapshot:
     unique: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class ForeignKeySnapshot:
     """Snapshot of a foreign key constraint."""
 
@@ -42,9 +100,14 @@ class ForeignKeySnapshot:
     onupdate: Optional[str] = None
 
 
-@dataclass
-class TableSnapshot:
-    """Snapshot of a table definition."""
+@dataclass(frozen=True, **_SLOTS)
+class TableSnapshot(_FingerprintSlot):
+    """Snapshot of a table definition.
+
+    Table snapshots are frozen and may be shared between schema snapshots,
+    so their column, index and foreign key lists must not be modified. Use
+    ``dataclasses.replace`` to derive a changed table.
+    """
 
     name: str
     columns: list[ColumnSnapshot]
@@ -52,59 +115,354 @@ class TableSnapshot:
     foreign_keys: list[ForeignKeySnapshot]
     schema: Optional[str] = None
 
+    def __hash__(self) -> int:
+        return hash(self.fingerprint())
+
+    def fingerprint(self) -> str:
+        """Return a stable content hash of the table definition.
+
+        The hash is computed once and cached on the instance.
+        """
+        cached: Optional[str] = getattr(self, "_fingerprint", None)
+        if cached is None:
+            payload = json.dumps(asdict(self), sort_keys=True, separators=(",", ":"))
+            cached = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            object.__setattr__(self, "_fingerprint", cached)
+        return cached
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "TableSnapshot":
+        """Create table snapshot from dictionary."""
+        return cls(
+            name=sys.intern(data["name"]),
+            columns=[ColumnSnapshot(**_interned(col)) for col in data["columns"]],
+            indexes=[IndexSnapshot(**_interned(idx)) for idx in data["indexes"]],
+            foreign_keys=[
+                ForeignKeySnapshot(**_interned(fk)) for fk in data["foreign_keys"]
+            ],
+            schema=_intern_optional(data.get("schema")),
+        )
+
+
+class _TableList(list[TableSnapshot]):
+    """Tables of a schema snapshot, counting the changes made in place.
+
+    ``SchemaSnapshot`` compares the count with the one its lookups were
+    built at, so they never outlive a change to the list.
+    """
+
+    __slots__ = ("changes",)
+
+    def __init__(self, tables: Iterable[TableSnapshot] = ()) -> None:
+        super().__init__(tables)
+        self.changes = 0
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (_TableList, (list(self),))
+
+
+def _counts_change(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a list method to count the calls on a ``_TableList``."""
+
+    @functools.wraps(method)
+    def wrapper(self: _TableList, *args: Any, **kwargs: Any) -> Any:
+        self.changes += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _method in (
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(_TableList, _method, _counts_change(getattr(list, _method)))
+
 
 @dataclass
 class SchemaSnapshot:
-    """Complete schema snapshot."""
+    """Complete schema snapshot.
+
+    Lookups by table name go through an index built on first use, which is
+    rebuilt after ``tables`` is assigned or changed in place. Assigned
+    tables are copied into a list that tracks its changes.
+    """
 
     tables: list[TableSnapshot]
     version: str = "1.0"
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "tables" and not isinstance(value, _TableList):
+            value = _TableList(value)
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The cached lookups are rebuilt on demand rather than pickled
+        return {
+            name: value for name, value in self.__dict__.items() if name != "_lookups"
+        }
+
     def to_dict(self) -> dict[str, Any]:
         """Convert snapshot to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "tables": [asdict(table) for table in self.tables],
+            "version": self.version,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SchemaSnapshot":
         """Create snapshot from dictionary."""
-        tables = []
-        for table_data in data["tables"]:
-            columns = [ColumnSnapshot(**col) for col in table_data["columns"]]
-            indexes = [IndexSnapshot(**idx) for idx in table_data["indexes"]]
-            foreign_keys = [
-                ForeignKeySnapshot(**fk) for fk in table_data["foreign_keys"]
-            ]
-
-            tables.append(
-                TableSnapshot(
-                    name=table_data["name"],
-                    columns=columns,
-                    indexes=indexes,
-                    foreign_keys=foreign_keys,
-                    schema=table_data.get("schema"),
-                )
-            )
+        tables = [TableSnapshot.from_dict(table_data) for table_data in data["tables"]]
 
         return cls(tables=tables, version=data.get("version", "1.0"))
 
+    @property
+    def tables_by_name(self) -> Mapping[str, TableSnapshot]:
+        """Read-only mapping of table names to table snapshots.
+
+        When several schemas contain a table of the same name, the one
+        listed last wins.
+        """
+        return MappingProxyType(self._tables_by_name)
+
+    @property
+    def _tables_by_name(self) -> dict[str, TableSnapshot]:
+        return self._table_lookups()[2]
+
+    @property
+    def _tables_view(self) -> "_TableDictView":
+        return self._table_lookups()[3]
+
+    def _table_lookups(
+        self,
+    ) -> tuple[_TableList, int, dict[str, TableSnapshot], "_TableDictView"]:
+        """Get the name index and dict view, rebuilt if the tables changed."""
+        tables = cast(_TableList, self.tables)
+        lookups = self.__dict__.get("_lookups")
+        if lookups is None or lookups[0] is not tables or lookups[1] != tables.changes:
+            by_name = {table.name: table for table in tables}
+            lookups = (tables, tables.changes, by_name, _TableDictView(by_name))
+            self.__dict__["_lookups"] = lookups
+        return lookups
+
+    def fingerprint(self) -> str:
+        """Return a stable structural hash of the snapshot.
+
+        The hash combines the per-table fingerprints in table name order so
+        that it does not depend on the order in which tables were declared
+        on the MetaData.
+        """
+        tables = sorted(self.tables, key=lambda table: (table.name, table.schema or ""))
+        digest = hashlib.sha256(self.version.encode("utf-8"))
+        for table in tables:
+            digest.update(f"\n{table.schema or ''}.{table.name}:".encode())
+            digest.update(table.fingerprint().encode("utf-8"))
+        return digest.hexdigest()
+
     def __getitem__(self, key: str) -> Any:
-        """Allow dictionary-style access for backward compatibility."""
+        """Allow dictionary-style access for backward compatibility.
+
+        ``snapshot["tables"]`` is a read-only mapping of table names to
+        table dictionaries, each converted on first access and then reused.
+        """
         if key == "tables":
-            # Return a dictionary with table names as keys
-            return {table.name: self._table_to_dict(table) for table in self.tables}
+            return self._tables_view
         if key == "version":
             return self.version
         raise KeyError(f"Key '{key}' not found in SchemaSnapshot")
 
-    def _table_to_dict(self, table: TableSnapshot) -> dict[str, Any]:
-        """Convert a table to dictionary format for backward compatibility."""
-        return {
-            "name": table.name,
-            "columns": {col.name: asdict(col) for col in table.columns},
-            "indexes": [asdict(idx) for idx in table.indexes],
-            "foreign_keys": [asdict(fk) for fk in table.foreign_keys],
-            "schema": table.schema,
-        }
+
+class _TableDictView(Mapping[str, Mapping[str, Any]]):
+    """Table dictionaries of a snapshot, converted lazily and cached."""
+
+    def __init__(self, tables: dict[str, TableSnapshot]) -> None:
+        self._tables = tables
+        self._dicts: dict[str, Mapping[str, Any]] = {}
+
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        table_dict = self._dicts.get(name)
+        if table_dict is None:
+            table_dict = MappingProxyType(_table_to_dict(self._tables[name]))
+            self._dicts[name] = table_dict
+        return table_dict
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tables)
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _table_to_dict(table: TableSnapshot) -> dict[str, Any]:
+    """Convert a table to dictionary format for backward compatibility."""
+    return {
+        "name": table.name,
+        "columns": {col.name: asdict(col) for col in table.columns},
+        "indexes": [asdict(idx) for idx in table.indexes],
+        "foreign_keys": [asdict(fk) for fk in table.foreign_keys],
+        "schema": table.schema,
+    }
+
+
+def _table_key(table: TableSnapshot) -> tuple[Optional[str], str]:
+    """Identify a table by schema and name."""
+    return (table.schema, table.name)
+
+
+def _find_table(
+    snapshot: SchemaSnapshot, name: str, schema: Optional[str]
+) -> Optional[TableSnapshot]:
+    """Find a table of a snapshot by schema and name."""
+    for table in snapshot.tables:
+        if _table_key(table) == (schema, name):
+            return table
+    return None
+
+
+def _read_snapshot_file(filepath: Path) -> SchemaSnapshot:
+    """Read a snapshot in the format implied by the file extension."""
+    if filepath.suffix == SNAPSHOT_EXTENSIONS["binary"]:
+        # Imported here to avoid a circular import
+        from synq.core.binary_snapshot import decode_snapshot
+
+        return decode_snapshot(filepath.read_bytes())
+
+    with open(filepath) as f:
+        data = json.load(f)
+    return SchemaSnapshot.from_dict(data)
+
+
+def _load_snapshot_file(filepath: Path) -> Optional[SchemaSnapshot]:
+    """Read a snapshot file, or None if it is malformed.
+
+    Runs in the worker processes of ``SnapshotManager.iter_snapshots``.
+    """
+    try:
+        return _read_snapshot_file(filepath)
+    except (json.JSONDecodeError, KeyError, ValueError):
+        return None
+
+
+def _load_snapshot_files(
+    filepaths: list[Path], max_workers: int
+) -> Generator[Optional[SchemaSnapshot], None, None]:
+    """Decode snapshot files in worker processes, yielding them in order.
+
+    At most two files per worker are decoded ahead of the consumer, so
+    memory stays bounded however many files are read.
+    """
+    if max_workers <= 1 or len(filepaths) < 2:
+        for filepath in filepaths:
+            yield _load_snapshot_file(filepath)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(max_workers, len(filepaths)))
+    try:
+        remaining = iter(filepaths)
+        pending: deque[Future[Optional[SchemaSnapshot]]] = deque(
+            executor.submit(_load_snapshot_file, filepath)
+            for filepath in islice(remaining, max_workers * 2)
+        )
+        while pending:
+            future = pending.popleft()
+            for filepath in islice(remaining, 1):
+                pending.append(executor.submit(_load_snapshot_file, filepath))
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# Table snapshots by Table object: (signature, snapshot)
+_CachedTableSnapshot = tuple[tuple[Any, ...], TableSnapshot]
+_table_snapshots: "weakref.WeakKeyDictionary[Table, _CachedTableSnapshot]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# Compiled type strings by type instance: (attributes, compiled)
+_CachedTypeString = tuple[dict[str, Any], str]
+_type_strings: "weakref.WeakKeyDictionary[TypeEngine[Any], _CachedTypeString]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _type_string(column_type: "TypeEngine[Any]") -> str:
+    """Compile a column type to its string form, once per type instance.
+
+    The compiled string is reused while the instance's attributes compare
+    equal, so settings changed in place, such as ``String.length``, are
+    compiled again.
+    """
+    try:
+        cached = _type_strings.get(column_type)
+    except TypeError:
+        # Not weak-referenceable, compile every time
+        return _intern(str(column_type))
+
+    try:
+        if cached is not None and cached[0] == vars(column_type):
+            return cached[1]
+    except TypeError:
+        # An attribute whose comparison is not a plain bool, e.g. a SQL
+        # expression; treat the type as changed
+        pass
+
+    compiled = _intern(str(column_type))
+    # Compiling may memoize attributes on the instance, so read them again
+    _type_strings[column_type] = (dict(vars(column_type)), compiled)
+    return compiled
+
+
+def _table_signature(table: Table) -> tuple[Any, ...]:
+    """Describe the parts of a table its snapshot depends on.
+
+    Column types are described by their compiled strings, the values the
+    snapshot stores, so types replaced or changed in place are both seen.
+    The strings come from a per-instance cache, so unchanged types are not
+    compiled again.
+    """
+    columns = tuple(
+        (
+            column.name,
+            _type_string(column.type),
+            str(column.default) if column.default else None,
+            column.nullable,
+            column.primary_key,
+            column.autoincrement,
+            column.unique,
+        )
+        for column in table.columns
+    )
+
+    indexes = tuple(
+        (index.name, index.unique, tuple(column.name for column in index.columns))
+        for index in table.indexes
+    )
+    foreign_keys = tuple(
+        (
+            fk.constraint.name if fk.constraint is not None else None,
+            fk.parent.name,
+            fk.target_fullname,
+            fk.ondelete,
+            fk.onupdate,
+        )
+        for fk in table.foreign_keys
+    )
+
+    return (table.name, table.schema, columns, indexes, foreign_keys)
 
 
 class SnapshotManager:
@@ -113,8 +471,17 @@ class SnapshotManager:
     def __init__(self, config: Any) -> None:
         self.config = config
         self.snapshot_path = config.snapshot_path
+        self.snapshot_format: str = getattr(config, "snapshot_format", "json")
+        self.keyframe_interval: int = getattr(config, "snapshot_keyframe_interval", 1)
         self.snapshot_path.mkdir(parents=True, exist_ok=True)
 
+        # Snapshots reconstructed from deltas, by migration number
+        self._snapshot_cache: dict[int, SchemaSnapshot] = {}
+
+        # Migration number -> snapshot file, rebuilt when the directory changes
+        self._index: Optional[dict[int, Path]] = None
+        self._index_mtime: Optional[int] = None
+
     def create_snapshot(self, metadata: MetaData) -> SchemaSnapshot:
         """Create a snapshot from SQLAlchemy MetaData."""
         tables = []
@@ -126,15 +493,43 @@ class SnapshotManager:
         return SchemaSnapshot(tables=tables)
 
     def _create_table_snapshot(self, table: Table) -> TableSnapshot:
-        """Create a snapshot of a single table."""
+        """Create a snapshot of a single table.
+
+        Results are memoized per Table object together with a structural
+        signature, so snapshotting the same MetaData again only rebuilds
+        tables that were changed in the meantime.
+        """
+        signature = _table_signature(table)
+
+        cached = _table_snapshots.get(table)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        # Reuse the type strings compiled for the signature
+        column_types = [column[1] for column in signature[2]]
+        table_snapshot = self._build_table_snapshot(table, column_types)
+        _table_snapshots[table] = (signature, table_snapshot)
+        return table_snapshot
+
+    def _build_table_snapshot(
+        self, table: Table, column_types: Optional[list[str]] = None
+    ) -> TableSnapshot:
+        """Build the snapshot of a single table from scratch.
+
+        ``column_types`` are the compiled types of the table's columns, in
+        order, when the caller already has them.
+        """
+        if column_types is None:
+            column_types = [_type_string(column.type) for column in table.columns]
+
         # Extract columns
         columns = []
-        for column in table.columns:
+        for column, column_type in zip(table.columns, column_types):
             col_snapshot = ColumnSnapshot(
-                name=column.name,
-                type=str(column.type),
+                name=_intern(column.name),
+                type=column_type,
                 nullable=bool(column.nullable),
-                default=str(column.default) if column.default else None,
+                default=_intern(str(column.default)) if column.default else None,
                 primary_key=column.primary_key,
                 autoincrement=bool(column.autoincrement)
                 if isinstance(column.autoincrement, bool)
@@ -147,8 +542,8 @@ class SnapshotManager:
         indexes = []
         for index in table.indexes:
             idx_snapshot = IndexSnapshot(
-                name=str(index.name) if index.name is not None else "",
-                columns=[col.name for col in index.columns],
+                name=_intern(index.name) if index.name is not None else "",
+                columns=[_intern(col.name) for col in index.columns],
                 unique=index.unique,
             )
             indexes.append(idx_snapshot)
@@ -160,89 +555,571 @@ class SnapshotManager:
                 name=str(fk.constraint.name)
                 if fk.constraint and fk.constraint.name
                 else None,
-                columns=[fk.parent.name],
-                referred_table=fk.column.table.name,
-                referred_columns=[fk.column.name],
+                columns=[_intern(fk.parent.name)],
+                referred_table=_intern(fk.column.table.name),
+                referred_columns=[_intern(fk.column.name)],
                 ondelete=fk.ondelete,
                 onupdate=fk.onupdate,
             )
             foreign_keys.append(fk_snapshot)
 
         return TableSnapshot(
-            name=table.name,
+            name=_intern(table.name),
             columns=columns,
             indexes=indexes,
             foreign_keys=foreign_keys,
-            schema=table.schema,
+            schema=_intern_optional(table.schema),
         )
 
     def save_snapshot(self, migration_number: int, snapshot: SchemaSnapshot) -> Path:
-        """Save a snapshot to file."""
-        filename = f"{migration_number:04d}_snapshot.json"
-        filepath = self.snapshot_path / filename
+        """Save a snapshot to file.
+
+        With a keyframe interval above 1, only every Nth snapshot is stored
+        in full and the ones in between are stored as deltas against the
+        previous snapshot. Snapshots that later deltas are based on should
+        therefore not be overwritten.
+        """
+        base_number = self._delta_base_number(migration_number)
+        base = self.load_snapshot(base_number) if base_number is not None else None
+
+        if base_number is not None and base is not None:
+            filepath = self._delta_file(migration_number)
+            with open(filepath, "w") as f:
+                json.dump(self._build_delta(base_number, base, snapshot), f, indent=2)
+        else:
+            filepath = self._snapshot_file(migration_number, self.snapshot_format)
+            self._write_snapshot_file(filepath, snapshot)
+
+        # Remove other representations of the same snapshot so the file just
+        # written is the one that gets loaded
+        for candidate in self._snapshot_candidates(migration_number):
+            if candidate != filepath and candidate.exists():
+                candidate.unlink()
+        self._remove_table_index(migration_number)
+
+        self._index = None
+
+        # Reconstructions at or after this number may depend on it
+        for cached_number in list(self._snapshot_cache):
+            if cached_number >= migration_number:
+                del self._snapshot_cache[cached_number]
+
+        # Store the fingerprint next to the snapshot so unchanged schemas can
+        # be detected without loading the snapshot itself
+        with open(self._fingerprint_file(migration_number), "w") as f:
+            f.write(snapshot.fingerprint())
+
+        # Imported here to avoid a circular import
+        from synq.core.history import HistoryIndex
+
+        HistoryIndex(self).record(migration_number, snapshot)
+
+        return filepath
+
+    def _snapshot_file(self, migration_number: int, snapshot_format: str) -> Path:
+        """Get the path of a snapshot file in the given format."""
+        if snapshot_format not in SNAPSHOT_EXTENSIONS:
+            raise ValueError(f"Unsupported snapshot format: {snapshot_format}")
+
+        extension = SNAPSHOT_EXTENSIONS[snapshot_format]
+        return Path(self.snapshot_path / f"{migration_number:04d}_snapshot{extension}")
+
+    def _delta_file(self, migration_number: int) -> Path:
+        """Get the path of a delta snapshot file."""
+        return Path(self.snapshot_path / f"{migration_number:04d}{DELTA_SUFFIX}")
+
+    def _snapshot_candidates(self, migration_number: int) -> list[Path]:
+        """List possible snapshot files, in the order they are looked up."""
+        formats = [self.snapshot_format] + [
+            fmt for fmt in SNAPSHOT_EXTENSIONS if fmt != self.snapshot_format
+        ]
+        candidates = [self._snapshot_file(migration_number, fmt) for fmt in formats]
+        candidates.append(self._delta_file(migration_number))
+        return candidates
+
+    def _find_snapshot_file(self, migration_number: int) -> Optional[Path]:
+        """Find an existing snapshot file, preferring the configured format."""
+        return self._snapshot_index().get(migration_number)
+
+    def _snapshot_index(self) -> dict[int, Path]:
+        """Get the migration number -> snapshot file index.
+
+        The directory is only rescanned when its modification time changes
+        or after this manager wrote to it.
+        """
+        try:
+            mtime = self.snapshot_path.stat().st_mtime_ns
+        except OSError:
+            return {}
+
+        if self._index is None or mtime != self._index_mtime:
+            self._index = self._scan_snapshot_files()
+            self._index_mtime = mtime
+
+        return self._index
+
+    def _scan_snapshot_files(self) -> dict[int, Path]:
+        """Index snapshot files of every format, including deltas, in one scan."""
+        suffixes = tuple(
+            f"_snapshot{extension}" for extension in SNAPSHOT_EXTENSIONS.values()
+        ) + (DELTA_SUFFIX,)
+
+        index: dict[int, Path] = {}
+        for filepath in self.snapshot_path.iterdir():
+            if not filepath.name.endswith(suffixes):
+                continue
+
+            try:
+                number = int(filepath.name.split("_")[0])
+            except ValueError:
+                continue
+
+            # Several files for one number: keep the one load_snapshot prefers
+            current = index.get(number)
+            if current is None or self._file_preference(
+                number, filepath
+            ) < self._file_preference(number, current):
+                index[number] = filepath
+
+        return index
+
+    def _file_preference(self, migration_number: int, filepath: Path) -> int:
+        """Rank a snapshot file by lookup order, lower is preferred."""
+        candidates = self._snapshot_candidates(migration_number)
+        return candidates.index(filepath) if filepath in candidates else len(candidates)
+
+    def _delta_base_number(self, migration_number: int) -> Optional[int]:
+        """Get the snapshot a new snapshot should be stored as a delta against.
+
+        Returns None when the snapshot should be stored in full.
+        """
+        if (
+            self.keyframe_interval <= 1
+            or migration_number % self.keyframe_interval == 0
+        ):
+            return None
+
+        earlier = [n for n in self.get_all_snapshots() if n < migration_number]
+        return earlier[-1] if earlier else None
+
+    def _build_delta(
+        self, base_number: int, base: SchemaSnapshot, snapshot: SchemaSnapshot
+    ) -> dict[str, Any]:
+        """Describe a snapshot as the tables that changed since its base."""
+        base_tables = {_table_key(table): table for table in base.tables}
+
+        changed = []
+        for table in snapshot.tables:
+            previous = base_tables.get(_table_key(table))
+            if previous is None or previous.fingerprint() != table.fingerprint():
+                changed.append(asdict(table))
+
+        return {
+            "base": base_number,
+            "version": snapshot.version,
+            "tables": [[table.schema, table.name] for table in snapshot.tables],
+            "changed": changed,
+        }
+
+    def _apply_delta(
+        self, base: SchemaSnapshot, delta: dict[str, Any]
+    ) -> SchemaSnapshot:
+        """Rebuild a snapshot from its base and delta."""
+        base_tables = {_table_key(table): table for table in base.tables}
+        changed = {
+            _table_key(table): table
+            for table in map(TableSnapshot.from_dict, delta["changed"])
+        }
+
+        tables = []
+        for schema, name in delta["tables"]:
+            table = changed.get((schema, name)) or base_tables.get((schema, name))
+            if table is None:
+                raise ValueError(f"Table '{name}' missing from snapshot delta")
+            tables.append(table)
+
+        return SchemaSnapshot(tables=tables, version=delta["version"])
+
+    def _reconstruct_snapshot(self, migration_number: int) -> SchemaSnapshot:
+        """Replay deltas from the nearest keyframe up to a snapshot."""
+        deltas: list[tuple[int, dict[str, Any]]] = []
+        number = migration_number
+
+        # Walk back until a cached snapshot or a full keyframe is found
+        while True:
+            cached = self._snapshot_cache.get(number)
+            if cached is not None:
+                snapshot = cached
+                break
+
+            filepath = self._find_snapshot_file(number)
+            if filepath is None:
+                raise ValueError(f"Base snapshot {number:04d} not found")
+
+            if not filepath.name.endswith(DELTA_SUFFIX):
+                snapshot = self._read_snapshot_file(filepath)
+                self._snapshot_cache[number] = snapshot
+                break
+
+            with open(filepath) as f:
+                delta = json.load(f)
+            if delta["base"] >= number:
+                raise ValueError(f"Invalid base for snapshot delta {number:04d}")
+            deltas.append((number, delta))
+            number = delta["base"]
+
+        for number, delta in reversed(deltas):
+            snapshot = self._apply_delta(snapshot, delta)
+            self._snapshot_cache[number] = snapshot
+
+        return snapshot
+
+    def _write_snapshot_file(self, filepath: Path, snapshot: SchemaSnapshot) -> None:
+        """Write a snapshot in the format implied by the file extension."""
+        if filepath.suffix == SNAPSHOT_EXTENSIONS["binary"]:
+            # Imported here to avoid a circular import
+            from synq.core.binary_snapshot import encode_snapshot
+
+            filepath.write_bytes(encode_snapshot(snapshot))
+            return
 
         with open(filepath, "w") as f:
             json.dump(snapshot.to_dict(), f, indent=2)
 
-        return Path(filepath)
+    def _read_snapshot_file(self, filepath: Path) -> SchemaSnapshot:
+        """Read a snapshot in the format implied by the file extension."""
+        return _read_snapshot_file(filepath)
 
-    def load_snapshot(self, migration_number: int) -> Optional[SchemaSnapshot]:
-        """Load a snapshot from file."""
-        filename = f"{migration_number:04d}_snapshot.json"
-        filepath = self.snapshot_path / filename
+    def _fingerprint_file(self, migration_number: int) -> Path:
+        """Get the path of the fingerprint file for a snapshot."""
+        filename = f"{migration_number:04d}_snapshot.sha256"
+        return Path(self.snapshot_path / filename)
+
+    def get_snapshot_fingerprint(self, migration_number: int) -> Optional[str]:
+        """Get the stored fingerprint of a snapshot.
+
+        Returns None when the snapshot was saved without a fingerprint.
+        """
+        filepath = self._fingerprint_file(migration_number)
 
         if not filepath.exists():
             return None
 
+        fingerprint = filepath.read_text().strip()
+        return fingerprint or None
+
+    def get_latest_fingerprint(self) -> Optional[str]:
+        """Get the stored fingerprint of the most recent snapshot."""
+        snapshot_numbers = self.get_all_snapshots()
+
+        if not snapshot_numbers:
+            return None
+
+        return self.get_snapshot_fingerprint(snapshot_numbers[-1])
+
+    def load_snapshot(self, migration_number: int) -> Optional[SchemaSnapshot]:
+        """Load a snapshot from file, whichever format it was saved in."""
+        cached = self._snapshot_cache.get(migration_number)
+        if cached is not None:
+            return cached
+
+        filepath = self._find_snapshot_file(migration_number)
+
+        if filepath is None:
+            return None
+
         try:
-            with open(filepath) as f:
-                data = json.load(f)
-            return SchemaSnapshot.from_dict(data)
+            if filepath.name.endswith(DELTA_SUFFIX):
+                return self._reconstruct_snapshot(migration_number)
+            return self._read_snapshot_file(filepath)
         except (json.JSONDecodeError, KeyError, ValueError):
             # Return None for malformed or invalid snapshot files
             return None
 
+    def iter_snapshots(
+        self,
+        migration_numbers: Optional[Iterable[int]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[tuple[int, Optional[SchemaSnapshot]]]:
+        """Load many snapshots, optionally decoding their files in parallel.
+
+        Decoding a snapshot is CPU bound, so with more than one worker files
+        are decoded by a pool of processes rather than threads, a few files
+        ahead of the consumer. Deltas are rebuilt in this process from their
+        keyframe. Snapshots cached to rebuild deltas are dropped again once
+        no remaining delta of their keyframe interval needs them.
+
+        Args:
+            migration_numbers: Snapshots to load, defaults to all of them
+            max_workers: Number of worker processes, defaults to
+                ``config.snapshot_workers``. Without either, or with one
+                worker, files are decoded in this process.
+
+        Yields:
+            Each migration number with its snapshot, in the requested order.
+            The snapshot is None when it is missing or cannot be read, as
+            with ``load_snapshot``.
+        """
+        if migration_numbers is None:
+            numbers = self.get_all_snapshots()
+        else:
+            numbers = list(migration_numbers)
+        workers = max_workers or getattr(self.config, "snapshot_workers", None) or 1
+
+        index = self._snapshot_index()
+        keyframes = sorted(
+            number
+            for number, filepath in index.items()
+            if not filepath.name.endswith(DELTA_SUFFIX)
+        )
+
+        # Files to decode, in the order they are needed, and per requested
+        # snapshot: the file it waits for, whether the decoded file is the
+        # result, and the keyframe of the cached snapshots it is built from
+        jobs: list[tuple[int, Path]] = []
+        queued: dict[int, int] = {}
+        cached: set[int] = set()
+        plan: list[tuple[int, Optional[int], bool, Optional[int]]] = []
+
+        for number in numbers:
+            filepath = index.get(number)
+            if filepath is None or number in self._snapshot_cache:
+                plan.append((number, None, False, None))
+                continue
+
+            wanted = number
+            if filepath.name.endswith(DELTA_SUFFIX):
+                # Deltas chain back to the nearest keyframe before them
+                position = bisect.bisect_left(keyframes, number) - 1
+                if position < 0:
+                    plan.append((number, None, False, None))
+                    continue
+                wanted = keyframes[position]
+                if wanted in self._snapshot_cache:
+                    plan.append((number, None, False, wanted))
+                    continue
+
+            if wanted in queued:
+                cached.add(queued[wanted])
+                plan.append((number, queued[wanted], False, wanted))
+            else:
+                queued[wanted] = len(jobs)
+                if wanted != number:
+                    cached.add(len(jobs))
+                plan.append(
+                    (
+                        number,
+                        len(jobs),
+                        wanted == number,
+                        None if wanted == number else wanted,
+                    )
+                )
+                jobs.append((wanted, index[wanted]))
+
+        # Requests still to come per keyframe whose interval is cached
+        remaining = Counter(keyframe for *_, keyframe in plan if keyframe is not None)
+        previously_cached = set(self._snapshot_cache)
+
+        decoded = _load_snapshot_files([path for _, path in jobs], workers)
+        done = 0
+        snapshot: Optional[SchemaSnapshot] = None
+        try:
+            for number, job, is_result, keyframe in plan:
+                while job is not None and done <= job:
+                    snapshot = next(decoded)
+                    if done in cached and snapshot is not None:
+                        self._snapshot_cache[jobs[done][0]] = snapshot
+                    done += 1
+
+                result = snapshot if is_result else self.load_snapshot(number)
+
+                if keyframe is not None:
+                    remaining[keyframe] -= 1
+                    if not remaining[keyframe]:
+                        position = bisect.bisect_right(keyframes, keyframe)
+                        end = keyframes[position] if position < len(keyframes) else None
+                        self._drop_cached(previously_cached, keyframe, end)
+
+                yield number, result
+        finally:
+            decoded.close()
+            # Whatever iterating cached for other intervals, e.g. deltas
+            # whose chain crossed a keyframe, is dropped as well
+            self._drop_cached(previously_cached)
+
+    def _drop_cached(
+        self, keep: set[int], start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Drop cached snapshots numbered in [start, end), except ``keep``."""
+        for number in list(self._snapshot_cache):
+            if number not in keep and start <= number and (end is None or number < end):
+                del self._snapshot_cache[number]
+
+    def load_snapshots(
+        self,
+        migration_numbers: Optional[Iterable[int]] = None,
+        max_workers: Optional[int] = None,
+    ) -> list[Optional[SchemaSnapshot]]:
+        """Load many snapshots in parallel, see ``iter_snapshots``.
+
+        Returns:
+            The snapshots in the requested order, None for those that are
+            missing or cannot be read
+        """
+        return [
+            snapshot
+            for _, snapshot in self.iter_snapshots(migration_numbers, max_workers)
+        ]
+
+    def load_table(
+        self, migration_number: int, name: str, schema: Optional[str] = None
+    ) -> Optional[TableSnapshot]:
+        """Load a single table of a snapshot without loading the whole snapshot.
+
+        JSON snapshots are read through a table offset index kept in the
+        cache directory, see ``synq.core.snapshot_reader``. Deltas are followed back only until
+        the table is found.
+
+        Returns:
+            The table, or None if the snapshot or the table does not exist
+        """
+        from synq.core.snapshot_reader import TABLE_INDEX_DIR, read_snapshot_table
+
+        cached = self._snapshot_cache.get(migration_number)
+        if cached is not None:
+            return _find_table(cached, name, schema)
+
+        filepath = self._find_snapshot_file(migration_number)
+        if filepath is None:
+            return None
+
+        try:
+            if filepath.name.endswith(DELTA_SUFFIX):
+                with open(filepath) as f:
+                    delta = json.load(f)
+                if [schema, name] not in delta["tables"]:
+                    return None
+                for table_data in delta["changed"]:
+                    if (table_data.get("schema"), table_data["name"]) == (schema, name):
+                        return TableSnapshot.from_dict(table_data)
+                if delta["base"] >= migration_number:
+                    raise ValueError(
+                        f"Invalid base for snapshot delta {migration_number:04d}"
+                    )
+                return self.load_table(delta["base"], name, schema)
+
+            if filepath.suffix == SNAPSHOT_EXTENSIONS["json"]:
+                index_dir = cache_path(self.config) / TABLE_INDEX_DIR
+                return read_snapshot_table(filepath, name, schema, index_dir)
+
+            return _find_table(self._read_snapshot_file(filepath), name, schema)
+        except (json.JSONDecodeError, KeyError, ValueError):
+            # Same as load_snapshot: malformed snapshot files read as missing
+            return None
+
+    def iter_tables(self, migration_number: int) -> Iterator[TableSnapshot]:
+        """Iterate over the tables of a snapshot.
+
+        Tables of JSON snapshots are parsed one at a time as they are read,
+        other formats are loaded first.
+
+        Raises:
+            ValueError: If the snapshot does not exist or cannot be read
+        """
+        from synq.core.snapshot_reader import iter_snapshot_tables
+
+        filepath = self._find_snapshot_file(migration_number)
+        if filepath is None:
+            raise ValueError(f"Snapshot {migration_number:04d} not found")
+
+        if migration_number not in self._snapshot_cache and (
+            filepath.suffix == SNAPSHOT_EXTENSIONS["json"]
+            and not filepath.name.endswith(DELTA_SUFFIX)
+        ):
+            return iter_snapshot_tables(filepath)
+
+        snapshot = self.load_snapshot(migration_number)
+        if snapshot is None:
+            raise ValueError(f"Snapshot {migration_number:04d} could not be read")
+        return iter(snapshot.tables)
+
+    def get_table_history(
+        self, name: str, schema: Optional[str] = None
+    ) -> list["HistoryEntry"]:
+        """Get the migration numbers at which a table was added, changed or dropped.
+
+        Answered from the history index, see ``synq.core.history``, which
+        is built on first use and kept up to date by ``save_snapshot``.
+        """
+        from synq.core.history import HistoryIndex
+
+        return HistoryIndex(self).table_history(name, schema)
+
+    def get_column_history(
+        self, table_name: str, column_name: str, schema: Optional[str] = None
+    ) -> list["HistoryEntry"]:
+        """Get the migration numbers at which a column was added, changed or dropped."""
+        from synq.core.history import HistoryIndex
+
+        return HistoryIndex(self).column_history(table_name, column_name, schema)
+
+    def _remove_table_index(self, migration_number: int) -> None:
+        """Delete the table offset index of a snapshot, if there is one."""
+        from synq.core.snapshot_reader import TABLE_INDEX_DIR, table_index_file
+
+        index_file = table_index_file(
+            self._snapshot_file(migration_number, "json"),
+            cache_path(self.config) / TABLE_INDEX_DIR,
+        )
+        if index_file.exists():
+            index_file.unlink()
+
+    def convert_snapshots(self, target_format: str) -> list[Path]:
+        """Rewrite all stored snapshots in the target format.
+
+        Snapshots already stored in the target format are left untouched, as
+        are deltas, which do not depend on the format.
+
+        Returns:
+            Paths of the newly written snapshot files
+        """
+        if target_format not in SNAPSHOT_EXTENSIONS:
+            raise ValueError(f"Unsupported snapshot format: {target_format}")
+
+        converted = []
+        # Iterate over a copy, since every rewrite invalidates the index
+        for migration_number, source in sorted(self._snapshot_index().items()):
+            target = self._snapshot_file(migration_number, target_format)
+
+            if source == target or source.name.endswith(DELTA_SUFFIX):
+                continue
+
+            self._write_snapshot_file(target, self._read_snapshot_file(source))
+            source.unlink()
+            self._remove_table_index(migration_number)
+            converted.append(target)
+
+        self._index = None
+        return converted
+
     def get_latest_snapshot(self) -> Optional[SchemaSnapshot]:
         """Get the most recent snapshot."""
-        snapshot_files = list(self.snapshot_path.glob("*_snapshot.json"))
+        snapshot_numbers = self.get_all_snapshots()
 
-        if not snapshot_files:
+        if not snapshot_numbers:
             return None
 
-        # Sort by migration number (filename prefix)
-        latest_file = sorted(snapshot_files)[-1]
-        migration_number = int(latest_file.stem.split("_")[0])
-
-        return self.load_snapshot(migration_number)
+        return self.load_snapshot(snapshot_numbers[-1])
 
     def get_next_migration_number(self) -> int:
         """Get the next migration number."""
-        snapshot_files = list(self.snapshot_path.glob("*_snapshot.json"))
+        snapshot_numbers = self.get_all_snapshots()
 
-        if not snapshot_files:
+        if not snapshot_numbers:
             return 0
 
-        # Get highest migration number
-        max_number = 0
-        for file in snapshot_files:
-            try:
-                number = int(file.stem.split("_")[0])
-                max_number = max(max_number, number)
-            except ValueError:
-                continue
-
-        return max_number + 1
+        return snapshot_numbers[-1] + 1
 
     def get_all_snapshots(self) -> list[int]:
         """Get all available snapshot numbers."""
-        snapshot_files = list(self.snapshot_path.glob("*_snapshot.json"))
-        numbers = []
-
-        for file in snapshot_files:
-            try:
-                number = int(file.stem.split("_")[0])
-                numbers.append(number)
-            except ValueError:
-                continue
-
-        return sorted(numbers)
+        return sorted(self._snapshot_index())
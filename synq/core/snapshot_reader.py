@@ -0,0 +1,333 @@
+"""Streaming access to the tables of JSON snapshot files.
+
+``SnapshotManager.load_snapshot`` parses a whole snapshot before returning
+it. Tools that only look at a few tables can instead iterate over the
+tables of a file as they are parsed, or read one table by name.
+
+Reading a table by name records the byte offset and length of every table
+in a small index in the ``tables/`` directory of the cache directory
+(``.synq_cache/tables/0042_snapshot.idx``, see ``cache_path``). Later
+lookups read the index, seek to the table and parse only that table. The
+index stores the size and modification time of the snapshot it describes
+and is rebuilt whenever those change.
+"""
+
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any, Optional
+
+from synq.core.cache import ensure_cache_dir
+from synq.core.snapshot import TableSnapshot
+
+# Bumped whenever the index layout changes, so old indexes are rebuilt
+TABLE_INDEX_VERSION = 1
+
+# Extension of the table offset index of a snapshot
+TABLE_INDEX_SUFFIX = ".idx"
+
+# Directory under the cache directory holding the table offset indexes
+TABLE_INDEX_DIR = "tables"
+
+# Characters read from the snapshot at a time
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_snapshot_tables(
+    filepath: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[TableSnapshot]:
+    """Yield the tables of a JSON snapshot file as they are parsed.
+
+    Only one table is held in memory at a time, so stopping early avoids
+    reading the rest of the file.
+
+    Raises:
+        ValueError: If the file is not a valid JSON snapshot
+    """
+    for table_data, _, _ in _scan_tables(filepath, chunk_size):
+        try:
+            yield TableSnapshot.from_dict(table_data)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid table in snapshot {filepath}: {e}") from e
+
+
+def read_snapshot_table(
+    filepath: Path,
+    name: str,
+    schema: Optional[str] = None,
+    index_dir: Optional[Path] = None,
+) -> Optional[TableSnapshot]:
+    """Read a single table from a JSON snapshot file.
+
+    With an ``index_dir``, the table offset index kept there is used when it
+    is up to date and written otherwise, so only the first lookup in a
+    snapshot scans the file.
+
+    Returns:
+        The table, or None if the snapshot has no such table
+
+    Raises:
+        ValueError: If the file is not a valid JSON snapshot
+    """
+    stat = filepath.stat()
+    index = _read_index(filepath, stat, index_dir) if index_dir else None
+    if index is None:
+        index = build_table_index(filepath, index_dir)
+
+    location = index.get((schema, name))
+    if location is None:
+        return None
+
+    offset, length = location
+    with open(filepath, "rb") as f:
+        f.seek(offset)
+        data = f.read(length)
+
+    try:
+        return TableSnapshot.from_dict(json.loads(data))
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Corrupt table '{name}' in snapshot {filepath}: {e}") from e
+
+
+def build_table_index(
+    filepath: Path, index_dir: Optional[Path] = None
+) -> dict[tuple[Optional[str], str], tuple[int, int]]:
+    """Scan a JSON snapshot for the byte range of each of its tables.
+
+    The index is stored in ``index_dir`` when given. Errors writing it are
+    ignored, the index is only an optimization.
+
+    Returns:
+        Byte offset and length of each table, by schema and name
+    """
+    stat = filepath.stat()
+    index: dict[tuple[Optional[str], str], tuple[int, int]] = {}
+    for table_data, offset, length in _scan_tables(filepath, DEFAULT_CHUNK_SIZE):
+        try:
+            index[(table_data.get("schema"), table_data["name"])] = (offset, length)
+        except (AttributeError, KeyError) as e:
+            raise ValueError(f"Invalid table in snapshot {filepath}") from e
+
+    if index_dir is not None:
+        _write_index(table_index_file(filepath, index_dir), stat, index)
+    return index
+
+
+def table_index_file(filepath: Path, index_dir: Path) -> Path:
+    """Get the path of the table offset index of a snapshot file."""
+    return index_dir / (filepath.stem + TABLE_INDEX_SUFFIX)
+
+
+def _read_index(
+    filepath: Path, stat: os.stat_result, index_dir: Path
+) -> Optional[dict[tuple[Optional[str], str], tuple[int, int]]]:
+    """Load the table index of a snapshot if it matches the snapshot file."""
+    try:
+        with open(table_index_file(filepath, index_dir), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != TABLE_INDEX_VERSION
+        or data.get("size") != stat.st_size
+        or data.get("mtime_ns") != stat.st_mtime_ns
+        or not isinstance(data.get("tables"), list)
+    ):
+        return None
+
+    try:
+        return {
+            (schema, name): (offset, length)
+            for schema, name, offset, length in data["tables"]
+        }
+    except (TypeError, ValueError):
+        return None
+
+
+def _write_index(
+    index_file: Path,
+    stat: os.stat_result,
+    index: dict[tuple[Optional[str], str], tuple[int, int]],
+) -> None:
+    """Store the table index of a snapshot; errors are ignored."""
+    data = {
+        "version": TABLE_INDEX_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "tables": [
+            [schema, name, offset, length]
+            for (schema, name), (offset, length) in index.items()
+        ],
+    }
+
+    try:
+        ensure_cache_dir(index_file.parent)
+        # Write then rename, so concurrent readers never see a partial index
+        fd, temp_name = tempfile.mkstemp(
+            dir=index_file.parent, prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_name, index_file)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except OSError:
+        pass
+
+
+def _scan_tables(
+    filepath: Path, chunk_size: int
+) -> Iterator[tuple[dict[str, Any], int, int]]:
+    """Yield each table of a JSON snapshot with its byte offset and length."""
+    # newline="" keeps "\r\n" intact, so character counts match the bytes
+    with open(filepath, encoding="utf-8", newline="") as f:
+        stream = _JSONStream(f, chunk_size)
+        try:
+            stream.expect("{")
+            found_tables = False
+            first = True
+
+            while stream.peek() != "}":
+                if not first:
+                    stream.expect(",")
+                first = False
+
+                key, _, _ = stream.value()
+                stream.expect(":")
+
+                if key == "tables" and not found_tables:
+                    found_tables = True
+                    yield from _scan_table_list(stream)
+                else:
+                    stream.value()
+
+            stream.expect("}")
+            if not found_tables:
+                raise ValueError('missing "tables"')
+            if stream.peek():
+                raise ValueError("unexpected data after the snapshot")
+        except ValueError as e:
+            # Includes JSON and UTF-8 decoding errors
+            raise ValueError(f"Invalid JSON snapshot {filepath}: {e}") from e
+
+
+def _scan_table_list(
+    stream: "_JSONStream",
+) -> Iterator[tuple[dict[str, Any], int, int]]:
+    """Yield the elements of the "tables" array one by one."""
+    stream.expect("[")
+    if stream.peek() == "]":
+        stream.expect("]")
+        return
+
+    while True:
+        table_data, offset, length = stream.value()
+        if not isinstance(table_data, dict):
+            raise ValueError("Snapshot tables must be JSON objects")
+        yield table_data, offset, length
+
+        if stream.peek() == "]":
+            stream.expect("]")
+            return
+        stream.expect(",")
+
+
+class _JSONStream:
+    """Reads consecutive JSON values from a file without loading all of it.
+
+    Values are decoded with ``json.JSONDecoder.raw_decode`` from a buffer
+    that is refilled, and grown, whenever a value does not fit yet.
+    """
+
+    def __init__(self, f: IO[str], chunk_size: int) -> None:
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+        # Byte offset in the file of buffer[mark], advanced as offsets are
+        # requested so every character is encoded only once
+        self.mark = 0
+        self.mark_offset = 0
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, "" at the end."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be ``char``."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                f"Expected {char!r} at byte {self._offset(self.pos)}, "
+                f"found {found or 'end of file'!r}"
+            )
+        self.pos += 1
+
+    def value(self) -> tuple[Any, int, int]:
+        """Decode the next value.
+
+        Returns:
+            The value, its byte offset in the file and its length in bytes
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Most likely the value continues past the buffer
+                if self._fill():
+                    continue
+                raise
+
+            # A number may have been cut off at the end of the buffer
+            if end < len(self.buffer) or not self._fill():
+                break
+
+        start = self._offset(self.pos)
+        self.pos = end
+        return value, start, self._offset(end) - start
+
+    def _offset(self, pos: int) -> int:
+        """Get the byte offset in the file of a buffer position."""
+        if pos >= self.mark:
+            self.mark_offset += len(self.buffer[self.mark : pos].encode("utf-8"))
+            self.mark = pos
+            return self.mark_offset
+        return self.mark_offset - len(self.buffer[pos : self.mark].encode("utf-8"))
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, dropping consumed text.
+
+        Returns:
+            False at the end of the file
+        """
+        if self.eof:
+            return False
+
+        # Grow the reads with the buffer so a large value is decoded in a
+        # few attempts rather than one per chunk
+        chunk = self.f.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+
+        self._offset(self.pos)
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        self.mark = 0
+        return True
@@ -0,0 +1,240 @@
+"""Splitting migration SQL into individual statements."""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+from synq.core.cache import ensure_cache_dir
+
+# One alternative per token the splitter cares about. Everything else
+# (identifiers, numbers, operators, whitespace) is skipped by the search.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<line_comment>--[^\n]*)
+  | (?P<block_comment>/\*.*?(?:\*/|\Z))
+  | (?<![A-Za-z0-9_$])(?P<dollar>\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$)
+  | (?<![A-Za-z0-9_$])(?P<escape_string>E')
+  | (?P<quote>['"`])
+  | (?P<begin>\bBEGIN\b(?P<transaction>
+        (?=\s*(?:;|\Z))
+      | \s+(?:TRANSACTION|TRAN|WORK|DEFERRED|IMMEDIATE|EXCLUSIVE|ISOLATION)\b
+    )?)
+  | (?P<case>\bCASE\b)
+  | (?P<end>\bEND\b(?:\s+(?P<untracked>IF|LOOP|WHILE|REPEAT|FOR)\b|\s+CASE\b)?)
+  | (?P<semicolon>;)
+    """,
+    re.DOTALL | re.VERBOSE | re.IGNORECASE,
+)
+
+# Quoted strings and identifiers, where a doubled quote is an escaped quote
+_QUOTE_PATTERNS = {
+    "'": re.compile(r"(?:[^']|'')*(?:'|\Z)"),
+    '"': re.compile(r'(?:[^"]|"")*(?:"|\Z)'),
+    "`": re.compile(r"(?:[^`]|``)*(?:`|\Z)"),
+}
+
+# String literals where a backslash also escapes the next character (MySQL,
+# and PostgreSQL E'...' strings)
+_BACKSLASH_STRING_PATTERN = re.compile(r"(?:[^'\\]|\\.|'')*(?:'|\Z)", re.DOTALL)
+
+# Bumped whenever splitting changes, so stale on-disk entries are ignored
+STATEMENT_CACHE_VERSION = 2
+
+# Split results by content hash, most recently used last
+_CACHE_SIZE = 256
+_statement_cache: "OrderedDict[tuple[str, bool], tuple[str, ...]]" = OrderedDict()
+_statement_cache_lock = threading.Lock()
+
+
+def sql_content_hash(sql_content: str) -> str:
+    """Return the hash used to identify migration SQL content."""
+    return hashlib.sha256(sql_content.encode("utf-8")).hexdigest()
+
+
+def split_sql_statements(sql: str, backslash_escapes: bool = False) -> list[str]:
+    """
+    Split SQL text into statements in a single pass.
+
+    Semicolons only end a statement outside of string literals, quoted
+    identifiers, comments, dollar-quoted bodies and BEGIN ... END blocks
+    such as trigger bodies. PostgreSQL ``E'...'`` strings always treat
+    backslashes as escapes. Comments are removed, except MySQL-style
+    ``/*! ... */`` and ``/*+ ... */`` hints. Empty statements are dropped.
+
+    Args:
+        sql: The SQL text to split
+        backslash_escapes: Treat backslashes in string literals as escape
+            characters, as MySQL does by default
+
+    Returns:
+        The statements, without their terminating semicolons
+    """
+    statements: list[str] = []
+    pieces: list[str] = []
+    segment_start = 0
+    position = 0
+    block_depth = 0
+
+    while True:
+        match = _TOKEN_PATTERN.search(sql, position)
+        if match is None:
+            break
+
+        kind = match.lastgroup
+        position = match.end()
+
+        if kind in ("line_comment", "block_comment"):
+            if match.group().startswith(("/*!", "/*+")):
+                continue
+            pieces.append(sql[segment_start : match.start()])
+            pieces.append("\n" if kind == "line_comment" else " ")
+            segment_start = position
+
+        elif kind == "quote":
+            quote = match.group()
+            if quote == "'" and backslash_escapes:
+                quote_pattern = _BACKSLASH_STRING_PATTERN
+            else:
+                quote_pattern = _QUOTE_PATTERNS[quote]
+            quoted = quote_pattern.match(sql, position)
+            position = quoted.end() if quoted else len(sql)
+
+        elif kind == "escape_string":
+            quoted = _BACKSLASH_STRING_PATTERN.match(sql, position)
+            position = quoted.end() if quoted else len(sql)
+
+        elif kind == "dollar":
+            closing = sql.find(match.group(), position)
+            position = len(sql) if closing == -1 else closing + len(match.group())
+
+        elif kind == "begin":
+            # A statement starting with BEGIN opens a transaction, not a
+            # block, unless it is an anonymous block such as BEGIN ... END;
+            at_statement_start = not (
+                "".join(pieces).strip() or sql[segment_start : match.start()].strip()
+            )
+            if not at_statement_start or match.group("transaction") is None:
+                block_depth += 1
+
+        elif kind == "case":
+            block_depth += 1
+
+        elif kind == "end":
+            # END IF, END LOOP, ... close constructs that are not tracked,
+            # while END CASE closes a CASE statement like a bare END
+            if match.group("untracked") is None:
+                block_depth = max(block_depth - 1, 0)
+
+        elif block_depth == 0:
+            pieces.append(sql[segment_start : match.start()])
+            statement = "".join(pieces).strip()
+            if statement:
+                statements.append(statement)
+
+            pieces = []
+            segment_start = position
+
+    pieces.append(sql[segment_start:])
+    statement = "".join(pieces).strip()
+    if statement:
+        statements.append(statement)
+
+    return statements
+
+
+def get_sql_statements(
+    sql_content: str,
+    backslash_escapes: bool = False,
+    cache_dir: Optional[Path] = None,
+) -> list[str]:
+    """
+    Split migration SQL into statements, reusing earlier results.
+
+    Results are cached in memory by content hash, so the same migration
+    file is only split once per process. With ``cache_dir`` the statements
+    are also stored on disk, so later runs and other shards applying the
+    same file skip splitting altogether.
+
+    Args:
+        sql_content: The migration SQL
+        backslash_escapes: Treat backslashes in string literals as escape
+            characters, as MySQL does by default
+        cache_dir: Directory holding the on-disk statement cache
+
+    Returns:
+        The statements, without comments or terminating semicolons
+    """
+    content_hash = sql_content_hash(sql_content)
+    key = (content_hash, backslash_escapes)
+
+    with _statement_cache_lock:
+        cached = _statement_cache.get(key)
+        if cached is not None:
+            _statement_cache.move_to_end(key)
+    if cached is not None:
+        return list(cached)
+
+    cache_file = None
+    if cache_dir is not None:
+        suffix = "_backslash.json" if backslash_escapes else ".json"
+        cache_file = Path(cache_dir) / f"{content_hash}{suffix}"
+        cached = _read_cache_file(cache_file)
+
+    if cached is None:
+        cached = tuple(split_sql_statements(sql_content, backslash_escapes))
+        if cache_file is not None:
+            _write_cache_file(cache_file, cached)
+
+    with _statement_cache_lock:
+        _statement_cache[key] = cached
+        if len(_statement_cache) > _CACHE_SIZE:
+            _statement_cache.popitem(last=False)
+
+    return list(cached)
+
+
+def _read_cache_file(cache_file: Path) -> Optional[tuple[str, ...]]:
+    """Read cached statements, treating unreadable entries as missing."""
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != STATEMENT_CACHE_VERSION:
+        return None
+
+    statements = data.get("statements")
+    if not isinstance(statements, list) or not all(
+        isinstance(statement, str) for statement in statements
+    ):
+        return None
+
+    return tuple(statements)
+
+
+def _write_cache_file(cache_file: Path, statements: tuple[str, ...]) -> None:
+    """Store statements on disk; the cache is best effort, so errors are ignored."""
+    try:
+        ensure_cache_dir(cache_file.parent)
+        # Write then rename, so concurrent runs never see a partial entry
+        fd, temp_name = tempfile.mkstemp(
+            dir=cache_file.parent, prefix=".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": STATEMENT_CACHE_VERSION, "statements": statements}, f
+                )
+            os.replace(temp_name, cache_file)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+    except OSError:
+        pass
@@ -0,0 +1,102 @@
+"""Watching model files and re-detecting schema changes."""
+
+import contextlib
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+from synq.core.diff import MigrationOperation
+from synq.core.metadata_cache import project_module_files
+from synq.core.migration import MigrationManager
+from synq.core.snapshot import SchemaSnapshot, SnapshotManager
+from synq.utils.import_utils import import_metadata_from_path, validate_metadata_object
+
+
+class SchemaWatcher:
+    """Keeps the models imported and re-snapshots them when files change.
+
+    The process stays warm between checks: SQLAlchemy and other third-party
+    modules are imported once. When a project file changes, the project's
+    own modules are dropped from ``sys.modules`` and the MetaData is
+    imported again. Reloading only the edited module is not enough, since
+    tables from other modules are registered on the same MetaData and
+    would keep stale definitions.
+    """
+
+    def __init__(self, config: Any, project_root: Optional[Path] = None) -> None:
+        self.config = config
+        self.project_root = (project_root or Path.cwd()).resolve()
+        self.snapshot_manager = SnapshotManager(config)
+        self.migration_manager = MigrationManager(config)
+
+        # Watched files and their (mtime_ns, size) at the last check
+        self.files: dict[Path, tuple[int, int]] = {}
+
+    def load(self) -> SchemaSnapshot:
+        """Import the models, fresh from disk, and snapshot them.
+
+        The watched files are updated even when the import fails, so a
+        syntax error is reported once rather than on every check.
+        """
+        self._forget_project_modules()
+
+        try:
+            metadata = import_metadata_from_path(self.config.metadata_path)
+            validate_metadata_object(metadata)
+            return self.snapshot_manager.create_snapshot(metadata)
+        finally:
+            self._record_files()
+
+    def changed_files(self) -> list[Path]:
+        """Get the watched files modified since the last load."""
+        changed = []
+        for path, signature in self.files.items():
+            try:
+                stat = path.stat()
+            except OSError:
+                changed.append(path)
+                continue
+            if (stat.st_mtime_ns, stat.st_size) != signature:
+                changed.append(path)
+        return changed
+
+    def pending_operations(self, snapshot: SchemaSnapshot) -> list[MigrationOperation]:
+        """Get the operations a migration generated now would contain."""
+        if snapshot.fingerprint() == self.snapshot_manager.get_latest_fingerprint():
+            return []
+
+        return self.migration_manager.detect_changes(
+            self.snapshot_manager.get_latest_snapshot(), snapshot
+        )
+
+    def _forget_project_modules(self) -> None:
+        """Drop the project's modules so the next import re-reads them."""
+        # Bytecode is validated by whole-second mtime, which a quick edit
+        # of the same size would not change
+        for path in self.changed_files():
+            with contextlib.suppress(OSError):
+                Path(importlib.util.cache_from_source(str(path))).unlink()
+
+        for name, module in list(sys.modules.items()):
+            if name == "synq" or name.startswith("synq."):
+                continue
+            module_file = getattr(module, "__file__", None)
+            if module_file and Path(module_file).resolve() in self.files:
+                del sys.modules[name]
+
+        importlib.invalidate_caches()
+
+    def _record_files(self) -> None:
+        """Remember the current state of the project's module files."""
+        # A failed import leaves fewer modules loaded, keep watching the old ones
+        paths = set(self.files) | set(project_module_files(self.project_root))
+
+        self.files = {}
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            self.files[path] = (stat.st_mtime_ns, stat.st_size)
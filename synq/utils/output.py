@@ -18,6 +18,10 @@ EMOJI_MAP: dict[str, str] = {
     "⬇️": "[DOWN]",
     "🗄️": "[DB]",
     "🔄": "[SYNC]",
+    "👀": "[WATCH]",
+    "📋": "[LIST]",
+    "📜": "[HISTORY]",
+    "📭": "[EMPTY]",
 }
 
 
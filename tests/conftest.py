@@ -8,6 +8,7 @@ import pytest
 from sqlalchemy import Column, Integer, MetaData, String, Table
 
 from synq.core.config import SynqConfig
+from synq.core.snapshot import SnapshotManager
 
 
 @pytest.fixture()
@@ -19,14 +20,37 @@ def temp_dir():
 
 
 @pytest.fixture()
-def test_config(temp_dir):
+def config_factory(temp_dir):
+    """Create test configurations in the temporary directory.
+
+    Keyword arguments are passed on to ``SynqConfig``.
+    """
+
+    def make_config(**options):
+        return SynqConfig(
+            metadata_path="tests.fixtures:test_metadata",
+            migrations_dir=str(temp_dir / "migrations"),
+            snapshot_dir=str(temp_dir / "migrations" / "meta"),
+            **options,
+        )
+
+    return make_config
+
+
+@pytest.fixture()
+def snapshot_manager_factory(config_factory):
+    """Create snapshot managers for test configurations."""
+
+    def make_manager(**options):
+        return SnapshotManager(config_factory(**options))
+
+    return make_manager
+
+
+@pytest.fixture()
+def test_config(config_factory):
     """Create a test configuration."""
-    return SynqConfig(
-        metadata_path="tests.fixtures:test_metadata",
-        db_uri="sqlite:///test.db",
-        migrations_dir=str(temp_dir / "migrations"),
-        snapshot_dir=str(temp_dir / "migrations" / "meta"),
-    )
+    return config_factory(db_uri="sqlite:///test.db")
 
 
 @pytest.fixture()
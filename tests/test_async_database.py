@@ -0,0 +1,145 @@
+"""Tests for the asyncio database manager."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from synq.core.config import SynqConfig
+from synq.core.migration import MigrationManager, PendingMigration
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from synq.core import async_database  # noqa: E402
+from synq.core.async_database import AsyncDatabaseManager  # noqa: E402
+
+
+def test_async_database_manager_requires_uri():
+    """Test that a database URI is required."""
+    with pytest.raises(ValueError, match="Database URI is required"):
+        AsyncDatabaseManager("")
+
+
+@pytest.mark.asyncio
+async def test_async_database_manager_apply_migration(temp_dir):
+    """Test applying and recording a migration asynchronously."""
+    db_path = temp_dir / "async.db"
+
+    async with AsyncDatabaseManager(f"sqlite+aiosqlite:///{db_path}") as db_manager:
+        assert await db_manager.get_applied_migrations() == []
+        assert await db_manager.test_connection()
+
+        await db_manager.apply_migration(
+            PendingMigration(
+                filename="0001_notes.sql",
+                sql_content=(
+                    "CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT);\n"
+                    "INSERT INTO notes (body) VALUES ('a; b');"
+                ),
+            )
+        )
+
+        assert await db_manager.get_applied_migrations() == ["0001_notes.sql"]
+
+
+@pytest.mark.asyncio
+async def test_async_database_manager_rollback_on_error(temp_dir):
+    """Test that a failed migration is not recorded."""
+    db_path = temp_dir / "async.db"
+
+    async with AsyncDatabaseManager(f"sqlite+aiosqlite:///{db_path}") as db_manager:
+        with pytest.raises(RuntimeError, match="0001_bad.sql"):
+            await db_manager.apply_migration(
+                PendingMigration(filename="0001_bad.sql", sql_content="INVALID SQL;")
+            )
+
+        assert await db_manager.get_applied_migrations() == []
+
+
+@pytest.mark.asyncio
+async def test_async_database_manager_apply_pending_concurrently(temp_dir):
+    """Test applying pending migrations to several databases from one loop."""
+    migrations_dir = temp_dir / "migrations"
+    migrations_dir.mkdir()
+    (migrations_dir / "0000_first.sql").write_text(
+        "CREATE TABLE first (id INTEGER PRIMARY KEY);"
+    )
+    (migrations_dir / "0001_second.sql").write_text(
+        "CREATE TABLE second (id INTEGER PRIMARY KEY);"
+    )
+
+    configs = [
+        SynqConfig(
+            metadata_path="test:metadata",
+            db_uri=f"sqlite+aiosqlite:///{temp_dir / f'tenant_{i}.db'}",
+            migrations_dir=str(migrations_dir),
+            snapshot_dir=str(migrations_dir / "meta"),
+        )
+        for i in range(3)
+    ]
+    managers = [AsyncDatabaseManager(config) for config in configs]
+
+    try:
+        results = await asyncio.gather(
+            *(manager.apply_pending_migrations() for manager in managers)
+        )
+        assert results == [["0000_first.sql", "0001_second.sql"]] * 3
+
+        # Everything is applied now
+        migration_manager = MigrationManager(configs[0])
+        assert await managers[0].get_pending_migrations(migration_manager) == []
+        assert await managers[1].apply_pending_migrations(migration_manager) == []
+    finally:
+        await asyncio.gather(*(manager.close() for manager in managers))
+
+
+@pytest.mark.asyncio
+async def test_async_database_manager_file_io_off_the_loop(temp_dir):
+    """Test that migrations are listed, read and split in worker threads."""
+    migrations_dir = temp_dir / "migrations"
+    migrations_dir.mkdir()
+    (migrations_dir / "0000_first.sql").write_text(
+        "CREATE TABLE first (id INTEGER PRIMARY KEY);"
+    )
+    config = SynqConfig(
+        metadata_path="test:metadata",
+        db_uri=f"sqlite+aiosqlite:///{temp_dir / 'threads.db'}",
+        migrations_dir=str(migrations_dir),
+        snapshot_dir=str(migrations_dir / "meta"),
+    )
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def record_thread(function):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    list_patch = patch.object(
+        MigrationManager,
+        "get_all_migrations",
+        record_thread(MigrationManager.get_all_migrations),
+    )
+    split_patch = patch.object(
+        async_database,
+        "get_sql_statements",
+        record_thread(async_database.get_sql_statements),
+    )
+    with list_patch, split_patch:
+        async with AsyncDatabaseManager(config) as db_manager:
+            assert await db_manager.apply_pending_migrations() == ["0000_first.sql"]
+
+    assert len(threads) == 2
+    assert loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_async_database_manager_pending_requires_manager():
+    """Test that a URI-only manager needs an explicit migration manager."""
+    async with AsyncDatabaseManager("sqlite+aiosqlite://") as db_manager:
+        with pytest.raises(ValueError, match="migration manager is required"):
+            await db_manager.apply_pending_migrations()
@@ -0,0 +1,208 @@
+"""Tests for the binary snapshot format."""
+
+import pytest
+from click.testing import CliRunner
+
+from synq.cli.main import cli
+from synq.core.binary_snapshot import (
+    MAGIC,
+    decode_snapshot,
+    encode_snapshot,
+    is_binary_snapshot,
+)
+from synq.core.config import SynqConfig
+from synq.core.snapshot import (
+    ColumnSnapshot,
+    ForeignKeySnapshot,
+    IndexSnapshot,
+    SchemaSnapshot,
+    SnapshotManager,
+    TableSnapshot,
+)
+
+
+def make_snapshot() -> SchemaSnapshot:
+    """Build a snapshot exercising every field of the format."""
+    users = TableSnapshot(
+        name="users",
+        columns=[
+            ColumnSnapshot(
+                name="id",
+                type="INTEGER",
+                nullable=False,
+                primary_key=True,
+                autoincrement=True,
+            ),
+            ColumnSnapshot(
+                name="email", type="VARCHAR(255)", nullable=False, unique=True
+            ),
+            ColumnSnapshot(
+                name="nickname", type="VARCHAR(255)", nullable=True, default="'ünï'"
+            ),
+        ],
+        indexes=[IndexSnapshot(name="ix_users_email", columns=["email"], unique=True)],
+        foreign_keys=[],
+        schema="auth",
+    )
+    posts = TableSnapshot(
+        name="posts",
+        columns=[
+            ColumnSnapshot(name="id", type="INTEGER", nullable=False, primary_key=True),
+            ColumnSnapshot(name="user_id", type="INTEGER", nullable=True),
+        ],
+        indexes=[IndexSnapshot(name="", columns=["id", "user_id"])],
+        foreign_keys=[
+            ForeignKeySnapshot(
+                name=None,
+                columns=["user_id"],
+                referred_table="users",
+                referred_columns=["id"],
+                ondelete="CASCADE",
+            )
+        ],
+    )
+    return SchemaSnapshot(tables=[users, posts])
+
+
+def test_binary_snapshot_round_trip():
+    """Test that encoding and decoding preserves the snapshot."""
+    snapshot = make_snapshot()
+    data = encode_snapshot(snapshot)
+
+    assert is_binary_snapshot(data)
+    assert decode_snapshot(data) == snapshot
+
+
+def test_binary_snapshot_interns_strings():
+    """Test that repeated strings are stored and decoded only once."""
+    data = encode_snapshot(make_snapshot())
+
+    assert data.count(b"VARCHAR(255)") == 1
+    decoded = decode_snapshot(data)
+    assert decoded.tables[0].columns[1].type is decoded.tables[0].columns[2].type
+
+
+def test_binary_snapshot_is_smaller_than_json(test_config):
+    """Test that the binary format is more compact than JSON."""
+    manager = SnapshotManager(test_config)
+    snapshot = make_snapshot()
+
+    json_file = manager.save_snapshot(0, snapshot)
+    manager.snapshot_format = "binary"
+    binary_file = manager.save_snapshot(1, snapshot)
+
+    assert binary_file.stat().st_size < json_file.stat().st_size / 2
+
+
+def test_decode_invalid_binary_snapshot():
+    """Test that malformed data raises ValueError."""
+    data = encode_snapshot(make_snapshot())
+
+    with pytest.raises(ValueError, match="not a binary"):
+        decode_snapshot(b'{"tables": []}')
+    with pytest.raises(ValueError, match="Unsupported"):
+        decode_snapshot(MAGIC + b"\xff" + data[len(MAGIC) + 1 :])
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_snapshot(data[:-8])
+
+
+def test_snapshot_manager_binary_format(temp_dir):
+    """Test saving and loading snapshots in the binary format."""
+    config = SynqConfig(
+        metadata_path="test:metadata",
+        snapshot_dir=str(temp_dir / "meta"),
+        snapshot_format="binary",
+    )
+    manager = SnapshotManager(config)
+    snapshot = make_snapshot()
+
+    filepath = manager.save_snapshot(0, snapshot)
+
+    assert filepath.name == "0000_snapshot.bin"
+    assert manager.load_snapshot(0) == snapshot
+    assert manager.get_latest_snapshot() == snapshot
+    assert manager.get_next_migration_number() == 1
+
+
+def test_snapshot_manager_reads_mixed_formats(test_config):
+    """Test that snapshots in either format are read transparently."""
+    manager = SnapshotManager(test_config)
+    snapshot = make_snapshot()
+    manager.save_snapshot(0, snapshot)
+
+    manager.snapshot_format = "binary"
+    manager.save_snapshot(1, SchemaSnapshot(tables=[]))
+
+    assert manager.get_all_snapshots() == [0, 1]
+    assert manager.load_snapshot(0) == snapshot
+    assert manager.load_snapshot(1) == SchemaSnapshot(tables=[])
+
+
+def test_snapshot_manager_load_corrupt_binary_snapshot(test_config):
+    """Test that corrupt binary snapshots load as None."""
+    manager = SnapshotManager(test_config)
+    (manager.snapshot_path / "0000_snapshot.bin").write_bytes(MAGIC + b"\x01\x05")
+
+    assert manager.load_snapshot(0) is None
+
+
+def test_convert_snapshots(test_config):
+    """Test converting stored snapshots between formats."""
+    manager = SnapshotManager(test_config)
+    snapshot = make_snapshot()
+    manager.save_snapshot(0, snapshot)
+    manager.save_snapshot(1, snapshot)
+
+    converted = manager.convert_snapshots("binary")
+
+    assert [path.name for path in converted] == [
+        "0000_snapshot.bin",
+        "0001_snapshot.bin",
+    ]
+    assert not list(manager.snapshot_path.glob("*_snapshot.json"))
+    assert manager.load_snapshot(1) == snapshot
+
+    # Converting again is a no-op
+    assert manager.convert_snapshots("binary") == []
+
+    converted = manager.convert_snapshots("json")
+    assert [path.name for path in converted] == [
+        "0000_snapshot.json",
+        "0001_snapshot.json",
+    ]
+    assert manager.load_snapshot(0) == snapshot
+
+    with pytest.raises(ValueError, match="Unsupported snapshot format"):
+        manager.convert_snapshots("xml")
+
+
+def test_config_snapshot_format(temp_dir):
+    """Test reading and validating snapshot_format from synq.toml."""
+    config_path = temp_dir / "synq.toml"
+    config = SynqConfig(metadata_path="test:metadata", snapshot_format="binary")
+    config.save_to_file(config_path)
+
+    assert SynqConfig.from_file(config_path).snapshot_format == "binary"
+
+    config_path.write_text(
+        '[synq]\nmetadata_path = "test:metadata"\nsnapshot_format = "xml"\n'
+    )
+    with pytest.raises(ValueError, match="Unsupported snapshot_format"):
+        SynqConfig.from_file(config_path)
+
+
+def test_snapshot_convert_command():
+    """Test the snapshot convert CLI command."""
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        config = SynqConfig(metadata_path="test:metadata")
+        config.save_to_file()
+        SnapshotManager(config).save_snapshot(0, make_snapshot())
+
+        result = runner.invoke(cli, ["snapshot", "convert", "--to", "binary"])
+
+        assert result.exit_code == 0
+        assert "Converted 1 snapshot(s)" in result.output
+        assert 'snapshot_format = "binary"' in result.output
+        assert SnapshotManager(config).load_snapshot(0) == make_snapshot()
@@ -1,5 +1,7 @@
 """Tests for CLI commands."""
 
+import subprocess
+import sys
 from pathlib import Path
 
 from click.testing import CliRunner
@@ -17,6 +19,60 @@ def test_cli_help():
     assert "snapshot-based database migration tool" in result.output
 
 
+def imported_modules(code: str) -> dict[str, int]:
+    """Run code in a fresh interpreter and report its imports.
+
+    Returns the cumulative import time in microseconds of every module
+    imported, as reported by ``python -X importtime``.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_cli_import_skips_command_modules():
+    """Test that loading the CLI does not import any command module."""
+    modules = imported_modules("import synq.cli.main")
+
+    assert "synq.cli.main" in modules
+    assert not [name for name in modules if name.startswith("synq.cli.commands.")]
+    assert "sqlalchemy" not in modules
+
+
+def test_package_import_is_lazy():
+    """Test that importing synq defers its exports until first access."""
+    modules = imported_modules("import synq; synq.__version__")
+    assert "synq" in modules
+    assert "sqlalchemy" not in modules
+    assert "synq.core.config" not in modules
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from synq import SynqConfig; "
+            "print('synq.core.config' in sys.modules, "
+            "'synq.core.migration' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["True", "False"]
+
+
 def test_init_command(temp_dir):
     """Test synq init command."""
     runner = CliRunner()
@@ -207,6 +263,51 @@ def test_status_command_with_config(temp_dir):
         assert "No migrations found" in result.output
 
 
+def test_status_command_with_high_water_mark(temp_dir, monkeypatch):
+    """Test that status reads only the high-water mark row in high-water mode."""
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    from synq.core.config import SynqConfig
+    from synq.core.database import DatabaseManager
+    from synq.core.migration import PendingMigration
+
+    config = SynqConfig(
+        metadata_path="test:metadata",
+        db_uri=f"sqlite:///{temp_dir / 'status.db'}",
+        migrations_dir=str(temp_dir / "migrations"),
+        snapshot_dir=str(temp_dir / "migrations" / "meta"),
+        pending_detection="high_water_mark",
+    )
+    config.save_to_file(temp_dir / "synq.toml")
+    config.migrations_path.mkdir(parents=True)
+    for filename in ("9999_m9999.sql", "10000_m10000.sql", "10001_m10001.sql"):
+        (config.migrations_path / filename).write_text("SELECT 1;")
+    for filename in ("9999_m9999.sql", "10000_m10000.sql"):
+        DatabaseManager(config).apply_migration(
+            PendingMigration(filename=filename, sql_content="SELECT 1;")
+        )
+
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    monkeypatch.chdir(temp_dir)
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        result = CliRunner().invoke(cli, ["status"])
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+    assert result.exit_code == 0
+    assert len(statements) == 1
+    assert "synq_high_water_mark" in statements[0]
+    assert "Applied migrations: 2" in result.output
+    assert "Pending migrations: 1" in result.output
+    assert "• 10001_m10001.sql" in result.output
+
+
 def test_generate_command_custom_config_path():
     """Test generate command with custom config path."""
     runner = CliRunner()
@@ -249,3 +350,83 @@ def test_generate_command_with_name_option():
 
         assert result.exit_code == 1
         assert "Configuration file not found" in result.output
+
+
+def test_migrate_command_batch():
+    """Test applying pending migrations with --batch."""
+    import toml
+    from sqlalchemy import create_engine, inspect
+
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        config_data = {
+            "synq": {
+                "metadata_path": "test.module:metadata",
+                "db_uri": "sqlite:///batch.db",
+            }
+        }
+        with open("synq.toml", "w") as f:
+            toml.dump(config_data, f)
+
+        Path("migrations").mkdir()
+        Path("migrations/0000_first.sql").write_text(
+            "CREATE TABLE first (id INTEGER PRIMARY KEY);"
+        )
+        Path("migrations/0001_second.sql").write_text(
+            "CREATE TABLE second (id INTEGER PRIMARY KEY);"
+        )
+
+        result = runner.invoke(cli, ["migrate", "--batch", "-y"])
+
+        assert result.exit_code == 0
+        assert "in one batch" in result.output
+        assert "Successfully applied 2 migration(s)" in result.output
+
+        engine = create_engine("sqlite:///batch.db")
+        assert {"first", "second"} <= set(inspect(engine).get_table_names())
+        engine.dispose()
+
+
+def test_migrate_command_multiple_targets():
+    """Test migrating every configured target and isolating failures."""
+    import toml
+    from sqlalchemy import create_engine, inspect
+
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        config_data = {
+            "synq": {
+                "metadata_path": "test.module:metadata",
+                "db_uris": ["sqlite:///missing/dir/broken.db"],
+                "db_uri_template": "sqlite:///tenant_{target}.db",
+                "db_targets": ["a", "b", "c"],
+            }
+        }
+        with open("synq.toml", "w") as f:
+            toml.dump(config_data, f)
+
+        Path("migrations").mkdir()
+        Path("migrations/0000_first.sql").write_text(
+            "CREATE TABLE first (id INTEGER PRIMARY KEY);"
+        )
+
+        result = runner.invoke(cli, ["migrate", "-y", "--workers", "2"])
+
+        assert result.exit_code != 0
+        assert "Found 4 target database(s)" in result.output
+        assert "sqlite:///tenant_a.db: applied 1 migration(s)" in result.output
+        assert "Succeeded: 3" in result.output
+        assert "Failed: 1" in result.output
+        assert "1 of 4 database(s) failed to migrate" in result.output
+
+        for target in ("a", "b", "c"):
+            engine = create_engine(f"sqlite:///tenant_{target}.db")
+            assert "first" in inspect(engine).get_table_names()
+            engine.dispose()
+
+        # A second run finds every healthy target up to date
+        result = runner.invoke(cli, ["migrate", "--dry-run", "--workers", "2"])
+        assert "sqlite:///tenant_b.db: 0 pending migration(s)" in result.output
+        assert "Pending migrations: 0" in result.output
@@ -224,6 +224,47 @@ def test_generate_command_no_changes():
                             )
 
 
+def test_generate_command_unchanged_fingerprint_skips_diff():
+    """Test that an unchanged schema is detected without loading snapshots."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        # Create config file
+        config_path = temp_path / "synq.toml"
+        config = SynqConfig(
+            metadata_path="test.models:metadata",
+            migrations_dir=str(temp_path / "migrations"),
+            snapshot_dir=str(temp_path / "migrations/meta"),
+        )
+        config.save_to_file(config_path)
+
+        # Create test metadata
+        metadata = MetaData()
+        Table("users", metadata, Column("id", Integer, primary_key=True))
+
+        import_patch = patch(
+            "synq.cli.commands.generate.import_metadata_from_path",
+            return_value=metadata,
+        )
+        validate_patch = patch("synq.cli.commands.generate.validate_metadata_object")
+        with import_patch, validate_patch:
+            with patch("click.echo"):
+                generate_command(
+                    description="Initial", config_path=config_path, custom_name=None
+                )
+
+            load_patch = patch("synq.core.snapshot.SnapshotManager.load_snapshot")
+            with load_patch as mock_load, patch("click.echo") as mock_echo:
+                generate_command(
+                    description=None, config_path=config_path, custom_name=None
+                )
+
+                mock_echo.assert_any_call(
+                    "✅ No schema changes detected. Nothing to migrate!"
+                )
+                mock_load.assert_not_called()
+
+
 def test_generate_command_with_custom_name():
     """Test generation with custom migration name."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -534,6 +575,34 @@ def test_status_command_database_connection_error():
                         mock_echo.assert_called()
 
 
+def test_status_command_uses_configured_engine_settings():
+    """Test that status connects with the pool and timeout settings."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        config_path = temp_path / "synq.toml"
+        config = SynqConfig(
+            metadata_path="test.models:metadata",
+            db_uri=f"sqlite:///{temp_path / 'status.db'}",
+            migrations_dir=str(temp_path / "migrations"),
+            snapshot_dir=str(temp_path / "migrations/meta"),
+            pool_pre_ping=True,
+            connect_timeout=5,
+        )
+        config.save_to_file(config_path)
+        config.migrations_path.mkdir(parents=True, exist_ok=True)
+        (config.migrations_path / "0001_first.sql").write_text("SELECT 1;")
+
+        with patch("synq.cli.commands.status.DatabaseManager") as mock_db:
+            mock_db.return_value.get_applied_migrations.return_value = []
+            status_command(config_path=config_path)
+
+        (passed_config,) = mock_db.call_args.args
+        assert passed_config.pool_pre_ping is True
+        assert passed_config.connect_timeout == 5
+        assert mock_db.call_args.kwargs == {"read_only": True}
+
+
 def test_command_error_handling():
     """Test error handling in commands."""
     with tempfile.TemporaryDirectory() as temp_dir:
@@ -1,5 +1,7 @@
 """Comprehensive tests for schema diff functionality."""
 
+from unittest.mock import patch
+
 from synq.core.diff import MigrationOperation, OperationType, SchemaDiffer
 from synq.core.snapshot import (
     ColumnSnapshot,
@@ -624,3 +626,57 @@ def test_migration_operation_with_definitions():
     assert op.old_definition == old_column
     assert op.new_definition == new_column
     assert str(op) == "ALTER COLUMN users.email"
+
+
+def test_detect_changes_skips_tables_with_matching_fingerprints():
+    """Test that only tables whose content hash differs are compared."""
+    differ = SchemaDiffer()
+
+    def make_table(name: str, email_type: str) -> TableSnapshot:
+        return TableSnapshot(
+            name=name,
+            columns=[
+                ColumnSnapshot(name="id", type="INTEGER", nullable=False),
+                ColumnSnapshot(name="email", type=email_type, nullable=True),
+            ],
+            indexes=[],
+            foreign_keys=[],
+        )
+
+    old_snapshot = SchemaSnapshot(
+        tables=[make_table(f"table_{i}", "VARCHAR(100)") for i in range(10)]
+    )
+    new_snapshot = SchemaSnapshot(
+        tables=[make_table(f"table_{i}", "VARCHAR(100)") for i in range(9)]
+        + [make_table("table_9", "VARCHAR(255)")]
+    )
+
+    with patch.object(
+        differ, "_detect_table_changes", wraps=differ._detect_table_changes
+    ) as mock_detect:
+        operations = differ.detect_changes(old_snapshot, new_snapshot)
+
+    assert mock_detect.call_count == 1
+    assert mock_detect.call_args[0][0].name == "table_9"
+    assert len(operations) == 1
+    assert operations[0].operation_type == OperationType.ALTER_COLUMN
+    assert operations[0].object_name == "email"
+
+
+def test_table_snapshot_fingerprint():
+    """Test that table fingerprints track table content."""
+    column = ColumnSnapshot(name="id", type="INTEGER", nullable=False)
+    table = TableSnapshot(name="users", columns=[column], indexes=[], foreign_keys=[])
+    same = TableSnapshot(name="users", columns=[column], indexes=[], foreign_keys=[])
+    renamed_column = TableSnapshot(
+        name="users",
+        columns=[ColumnSnapshot(name="user_id", type="INTEGER", nullable=False)],
+        indexes=[],
+        foreign_keys=[],
+    )
+
+    assert table.fingerprint() == same.fingerprint()
+    assert table.fingerprint() != renamed_column.fingerprint()
+    # Caching must not leak into equality or serialization
+    assert table == same
+    assert "_fingerprint" not in SchemaSnapshot(tables=[table]).to_dict()["tables"][0]
@@ -189,3 +189,140 @@ def test_config_from_file_default_path(temp_dir):
 
     finally:
         os.chdir(original_cwd)
+
+
+def test_config_snapshot_keyframe_interval(temp_dir):
+    """Test reading and validating snapshot_keyframe_interval."""
+    config_path = temp_dir / "synq.toml"
+    config = SynqConfig(metadata_path="test:metadata", snapshot_keyframe_interval=25)
+    config.save_to_file(config_path)
+
+    assert toml.load(config_path)["synq"]["snapshot_keyframe_interval"] == 25
+    assert SynqConfig.from_file(config_path).snapshot_keyframe_interval == 25
+
+    config_path.write_text(
+        '[synq]\nmetadata_path = "test:metadata"\nsnapshot_keyframe_interval = 0\n'
+    )
+    with pytest.raises(ValueError, match="positive integer"):
+        SynqConfig.from_file(config_path)
+
+
+def test_config_snapshot_workers(temp_dir):
+    """Test reading and validating snapshot_workers."""
+    config_path = temp_dir / "synq.toml"
+    SynqConfig(metadata_path="test:metadata").save_to_file(config_path)
+
+    assert "snapshot_workers" not in toml.load(config_path)["synq"]
+    assert SynqConfig.from_file(config_path).snapshot_workers is None
+
+    SynqConfig(metadata_path="test:metadata", snapshot_workers=4).save_to_file(
+        config_path
+    )
+    assert SynqConfig.from_file(config_path).snapshot_workers == 4
+
+    for value in ("0", '"4"'):
+        config_path.write_text(
+            f'[synq]\nmetadata_path = "test:metadata"\nsnapshot_workers = {value}\n'
+        )
+        with pytest.raises(ValueError, match="snapshot_workers must be a positive"):
+            SynqConfig.from_file(config_path)
+
+
+def test_config_target_db_uris(temp_dir):
+    """Test combining db_uris and the db_uri_template targets."""
+    config_path = temp_dir / "synq.toml"
+    config = SynqConfig(
+        metadata_path="test:metadata",
+        db_uris=["sqlite:///main.db"],
+        db_uri_template="sqlite:///tenant_{target}.db",
+        db_targets=["a", "b"],
+        migrate_workers=2,
+    )
+    config.save_to_file(config_path)
+
+    loaded = SynqConfig.from_file(config_path)
+    assert loaded.migrate_workers == 2
+    assert loaded.target_db_uris == [
+        "sqlite:///main.db",
+        "sqlite:///tenant_a.db",
+        "sqlite:///tenant_b.db",
+    ]
+    assert SynqConfig(metadata_path="test:metadata").target_db_uris == []
+
+    # A database listed twice is only targeted once
+    repeated = SynqConfig(
+        metadata_path="test:metadata",
+        db_uris=["sqlite:///tenant_a.db", "sqlite:///main.db"],
+        db_uri_template="sqlite:///tenant_{target}.db",
+        db_targets=["a", "b"],
+    )
+    assert repeated.target_db_uris == [
+        "sqlite:///tenant_a.db",
+        "sqlite:///main.db",
+        "sqlite:///tenant_b.db",
+    ]
+
+
+def test_config_target_validation(temp_dir):
+    """Test rejecting inconsistent multi-target settings."""
+    config_path = temp_dir / "synq.toml"
+
+    for settings, message in (
+        ('db_uri_template = "sqlite:///x.db"', "placeholder"),
+        ('db_targets = ["a"]', "requires db_uri_template"),
+        ('db_uris = "sqlite:///x.db"', "list of database URIs"),
+        ("migrate_workers = 0", "positive integer"),
+        ('pending_detection = "latest"', "Unsupported pending_detection"),
+    ):
+        config_path.write_text(f'[synq]\nmetadata_path = "test:metadata"\n{settings}\n')
+        with pytest.raises(ValueError, match=message):
+            SynqConfig.from_file(config_path)
+
+
+def test_config_pool_settings(temp_dir):
+    """Test reading and validating the pool settings."""
+    config_path = temp_dir / "synq.toml"
+    SynqConfig(
+        metadata_path="test:metadata",
+        pool_size=5,
+        pool_pre_ping=True,
+        connect_timeout=10,
+        statement_timeout=30.5,
+    ).save_to_file(config_path)
+
+    config = SynqConfig.from_file(config_path)
+    assert config.pool_size == 5
+    assert config.pool_pre_ping is True
+    assert config.connect_timeout == 10
+    assert config.statement_timeout == 30.5
+
+    for settings, message in (
+        ("pool_size = 0", "pool_size"),
+        ('pool_pre_ping = "yes"', "pool_pre_ping"),
+        ("connect_timeout = -1", "connect_timeout"),
+        ("statement_timeout = true", "statement_timeout"),
+    ):
+        config_path.write_text(f'[synq]\nmetadata_path = "test:metadata"\n{settings}\n')
+        with pytest.raises(ValueError, match=message):
+            SynqConfig.from_file(config_path)
+
+
+def test_config_cache_dir(temp_dir):
+    """Test reading and validating cache_dir."""
+    config_path = temp_dir / "synq.toml"
+    config = SynqConfig(metadata_path="test:metadata")
+    config.save_to_file(config_path)
+
+    assert "cache_dir" not in toml.load(config_path)["synq"]
+    assert config.cache_path == Path("migrations/.synq_cache")
+
+    SynqConfig(metadata_path="test:metadata", cache_dir=".cache/synq").save_to_file(
+        config_path
+    )
+    config = SynqConfig.from_file(config_path)
+    assert config.cache_dir == ".cache/synq"
+    assert config.cache_path == Path(".cache/synq")
+
+    config_path.write_text('[synq]\nmetadata_path = "test:metadata"\ncache_dir = 1\n')
+    with pytest.raises(ValueError, match="cache_dir must be a path"):
+        SynqConfig.from_file(config_path)
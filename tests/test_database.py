@@ -1,12 +1,16 @@
 """Tests for database management."""
 
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.exc import SQLAlchemyError
 
+from synq.core.config import SynqConfig
 from synq.core.database import DatabaseManager
+from synq.core.engines import dispose_engines
 from synq.core.migration import PendingMigration
 
 
@@ -25,8 +29,9 @@ def test_database_manager_ensure_migrations_table():
     """Test that migrations table is created."""
     db_uri = "sqlite:///:memory:"
     db_manager = DatabaseManager(db_uri)
+    db_manager.ensure_migrations_table()
 
-    # Table should exist after initialization
+    # Table should exist once ensured
     with db_manager.engine.connect() as conn:
         result = conn.execute(
             text(
@@ -39,11 +44,90 @@ def test_database_manager_ensure_migrations_table():
 
 def test_database_manager_ensure_migrations_table_error_handling():
     """Test error handling when migrations table creation fails."""
-    # Use a problematic database path that should trigger initialization error
+    # Use a problematic database path; the table is only created on first use
+    db_manager = DatabaseManager("sqlite:///nonexistent/path/that/will/fail.db")
+
     with pytest.raises(
         RuntimeError, match="Failed to create or access migrations table"
     ):
-        DatabaseManager("sqlite:///nonexistent/path/that/will/fail.db")
+        db_manager.get_applied_migrations()
+
+
+def test_database_manager_init_is_lazy():
+    """Test that constructing a manager issues no queries or DDL."""
+    with patch("synq.core.database.inspect") as mock_inspect:
+        db_manager = DatabaseManager("sqlite:///:memory:")
+
+    mock_inspect.assert_not_called()
+    with db_manager.engine.connect() as conn:
+        assert not sa_inspect(conn).has_table("synq_migrations")
+
+
+def test_database_manager_migrations_table_checked_once_per_engine():
+    """Test that the table check is cached once the table is known."""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    assert db_manager.get_applied_migrations() == []
+
+    with patch("synq.core.database.inspect") as mock_inspect:
+        assert db_manager.get_applied_migrations() == []
+        db_manager.apply_migration(
+            PendingMigration(filename="0001_a.sql", sql_content="SELECT 1;")
+        )
+
+    mock_inspect.assert_not_called()
+
+
+def test_database_manager_reads_existing_table_without_checking(temp_dir):
+    """Test that a fresh engine reads an existing table with one query."""
+    db_uri = f"sqlite:///{temp_dir / 'existing.db'}"
+    DatabaseManager(db_uri).apply_migration(
+        PendingMigration(filename="0001_a.sql", sql_content="SELECT 1;")
+    )
+    dispose_engines()
+
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    db_manager = DatabaseManager(db_uri, read_only=True)
+    event.listen(db_manager.engine, "before_cursor_execute", record)
+    with patch("synq.core.database.inspect") as mock_inspect:
+        assert db_manager.get_applied_migrations() == ["0001_a.sql"]
+        assert db_manager.get_latest_applied_migration() == "0001_a.sql"
+
+    mock_inspect.assert_not_called()
+    assert len(statements) == 2
+    assert all(statement.lstrip().startswith("SELECT") for statement in statements)
+
+
+def test_database_manager_read_only(temp_dir):
+    """Test that a read-only manager never creates the migrations table."""
+    db_uri = f"sqlite:///{temp_dir / 'read_only.db'}"
+    db_manager = DatabaseManager(db_uri, read_only=True)
+
+    assert db_manager.get_applied_migrations() == []
+    assert db_manager.get_latest_applied_migration() is None
+
+    with pytest.raises(RuntimeError, match="read-only mode"):
+        db_manager.apply_migration(
+            PendingMigration(filename="0001_a.sql", sql_content="SELECT 1;")
+        )
+    with pytest.raises(RuntimeError, match="read-only mode"):
+        db_manager.ensure_migrations_table()
+
+    with db_manager.engine.connect() as conn:
+        assert not sa_inspect(conn).has_table("synq_migrations")
+
+    # Once a writable manager has applied something, it is visible read-only
+    writer = DatabaseManager(db_uri)
+    writer.apply_migration(
+        PendingMigration(filename="0001_a.sql", sql_content="SELECT 1;")
+    )
+    writer.close()
+
+    assert db_manager.get_applied_migrations() == ["0001_a.sql"]
+    db_manager.close()
 
 
 def test_database_manager_get_applied_migrations():
@@ -144,6 +228,97 @@ def test_database_manager_apply_migration():
     assert "0001_test.sql" in applied
 
 
+def test_database_manager_get_latest_applied_migration():
+    """Test reading the highest applied migration filename."""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+    assert db_manager.get_latest_applied_migration() is None
+
+    for filename in ("0002_second.sql", "0010_tenth.sql", "0001_first.sql"):
+        db_manager.apply_migration(
+            PendingMigration(filename=filename, sql_content="SELECT 1;")
+        )
+
+    assert db_manager.get_latest_applied_migration() == "0010_tenth.sql"
+    assert db_manager.get_applied_migrations() == [
+        "0001_first.sql",
+        "0002_second.sql",
+        "0010_tenth.sql",
+    ]
+
+
+def test_database_manager_latest_applied_migration_compares_numbers():
+    """Test that the high-water mark is numeric across the 9999 -> 10000 step."""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+
+    for filename in ("9998_m9998.sql", "9999_m9999.sql", "10000_m10000.sql"):
+        db_manager.apply_migration(
+            PendingMigration(filename=filename, sql_content="SELECT 1;")
+        )
+
+    assert db_manager.get_latest_applied_migration() == "10000_m10000.sql"
+
+
+def test_database_manager_latest_applied_migration_reads_one_row(temp_dir):
+    """Test that the high-water mark is read from its own one-row table."""
+    db_manager = DatabaseManager(f"sqlite:///{temp_dir / 'mark.db'}")
+    db_manager.apply_migrations_batch(
+        [
+            PendingMigration(filename=f"{number:04d}_m.sql", sql_content="SELECT 1;")
+            for number in range(1, 51)
+        ]
+    )
+
+    statements = []
+
+    def record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    event.listen(db_manager.engine, "before_cursor_execute", record)
+    assert db_manager.get_latest_applied_migration() == "0050_m.sql"
+    event.remove(db_manager.engine, "before_cursor_execute", record)
+
+    assert len(statements) == 1
+    assert "synq_high_water_mark" in statements[0]
+    with db_manager.engine.connect() as conn:
+        rows = conn.execute(db_manager.high_water_mark_table.select()).all()
+    assert [row.filename for row in rows] == ["0050_m.sql"]
+    db_manager.close()
+
+
+def test_database_manager_high_water_mark_for_existing_history(temp_dir):
+    """Test that databases migrated before the mark table get it filled in."""
+    db_uri = f"sqlite:///{temp_dir / 'legacy.db'}"
+    with create_engine(db_uri).begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE synq_migrations (id INTEGER PRIMARY KEY, "
+                "filename VARCHAR(255) NOT NULL UNIQUE, applied_at DATETIME)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO synq_migrations (filename) "
+                "VALUES ('9999_a.sql'), ('10000_b.sql')"
+            )
+        )
+
+    # Read-only managers fall back to the applied history
+    reader = DatabaseManager(db_uri, read_only=True)
+    assert reader.get_latest_applied_migration() == "10000_b.sql"
+    with reader.engine.connect() as conn:
+        assert not sa_inspect(conn).has_table("synq_high_water_mark")
+
+    writer = DatabaseManager(db_uri)
+    assert writer.get_latest_applied_migration() == "10000_b.sql"
+    writer.apply_migration(
+        PendingMigration(filename="10001_c.sql", sql_content="SELECT 1;")
+    )
+    assert writer.get_latest_applied_migration() == "10001_c.sql"
+    assert reader.get_latest_applied_migration() == "10001_c.sql"
+    writer.close()
+    reader.close()
+
+
 def test_database_manager_apply_migration_with_comments():
     """Test applying migration with SQL comments."""
     db_uri = "sqlite:///:memory:"
@@ -177,6 +352,61 @@ def test_database_manager_apply_migration_with_comments():
         assert len(tables) == 1
 
 
+def test_database_manager_apply_migration_with_semicolon_in_literal():
+    """Test applying migration data and triggers that contain semicolons."""
+    db_uri = "sqlite:///:memory:"
+    db_manager = DatabaseManager(db_uri)
+
+    migration = PendingMigration(
+        filename="0001_literals.sql",
+        sql_content="""
+        CREATE TABLE notes (id INTEGER PRIMARY KEY, body TEXT);
+        CREATE TABLE note_count (n INTEGER);
+        INSERT INTO note_count VALUES (0);
+        CREATE TRIGGER count_notes AFTER INSERT ON notes
+        BEGIN
+            UPDATE note_count SET n = n + 1;
+        END;
+        INSERT INTO notes (body) VALUES ('first; second -- not a comment');
+        """,
+    )
+
+    db_manager.apply_migration(migration)
+
+    with db_manager.engine.connect() as conn:
+        body = conn.execute(text("SELECT body FROM notes")).scalar()
+        count = conn.execute(text("SELECT n FROM note_count")).scalar()
+
+    assert body == "first; second -- not a comment"
+    assert count == 1
+
+
+def test_database_manager_statement_cache_dir(tmp_path):
+    """Test that a config-based manager caches split SQL in the cache dir."""
+    config = SynqConfig(
+        metadata_path="models:metadata",
+        db_uri="sqlite:///:memory:",
+        migrations_dir=str(tmp_path / "migrations"),
+        snapshot_dir=str(tmp_path / "migrations" / "meta"),
+    )
+    db_manager = DatabaseManager(config)
+    cache_dir = tmp_path / "migrations" / ".synq_cache"
+    assert db_manager.statement_cache_dir == cache_dir / "statements"
+    assert DatabaseManager("sqlite:///:memory:").statement_cache_dir is None
+
+    db_manager.apply_migration(
+        PendingMigration(
+            filename="0001_cached.sql",
+            sql_content="CREATE TABLE cached_statements (id INTEGER PRIMARY KEY);",
+        )
+    )
+
+    assert len(list(db_manager.statement_cache_dir.glob("*.json"))) == 1
+    assert (db_manager.statement_cache_dir / ".gitignore").exists()
+    assert not (tmp_path / "migrations" / "meta").exists()
+    assert "0001_cached.sql" in db_manager.get_applied_migrations()
+
+
 def test_database_manager_apply_migration_rollback_on_error():
     """Test that migration is rolled back on error."""
     db_uri = "sqlite:///:memory:"
@@ -254,3 +484,61 @@ def test_database_manager_get_database_info_error():
     except Exception:
         # If manager creation fails, that's also valid test behavior
         pass
+
+
+def test_database_manager_apply_migrations_batch():
+    """Test applying several migrations in one batch."""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+
+    migrations = [
+        PendingMigration(
+            filename=f"000{i}_batch.sql",
+            sql_content=f"CREATE TABLE batch_{i} (id INTEGER PRIMARY KEY);",
+        )
+        for i in range(3)
+    ]
+
+    db_manager.apply_migrations_batch(migrations)
+
+    assert db_manager.get_applied_migrations() == [
+        "0000_batch.sql",
+        "0001_batch.sql",
+        "0002_batch.sql",
+    ]
+
+    # An empty batch is a no-op
+    db_manager.apply_migrations_batch([])
+
+
+def test_database_manager_apply_migrations_batch_transactional_rollback():
+    """Test that a failed batch records nothing with transactional DDL."""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+
+    migrations = [
+        PendingMigration(filename="0001_good.sql", sql_content="SELECT 1;"),
+        PendingMigration(filename="0002_bad.sql", sql_content="INVALID SQL;"),
+    ]
+
+    dialects_patch = patch("synq.core.database._TRANSACTIONAL_DDL_DIALECTS", {"sqlite"})
+    with dialects_patch, pytest.raises(RuntimeError, match="0002_bad.sql.*whole batch"):
+        db_manager.apply_migrations_batch(migrations)
+
+    assert db_manager.get_applied_migrations() == []
+
+
+def test_database_manager_apply_migrations_batch_non_transactional():
+    """Test that migrations before a failure stay recorded without transactional DDL."""
+    db_manager = DatabaseManager("sqlite:///:memory:")
+
+    migrations = [
+        PendingMigration(
+            filename="0001_good.sql",
+            sql_content="CREATE TABLE good (id INTEGER PRIMARY KEY);",
+        ),
+        PendingMigration(filename="0002_bad.sql", sql_content="INVALID SQL;"),
+    ]
+
+    with pytest.raises(RuntimeError, match="0002_bad.sql"):
+        db_manager.apply_migrations_batch(migrations)
+
+    assert db_manager.get_applied_migrations() == ["0001_good.sql"]
@@ -0,0 +1,153 @@
+"""Tests for the shared engine registry."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from synq.core.config import SynqConfig
+from synq.core.database import DatabaseManager
+from synq.core.engines import (
+    _engines,
+    _set_statement_timeout,
+    dispose_engines,
+    engine_options,
+    get_engine,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Start and finish every test with an empty engine registry."""
+    dispose_engines()
+    yield
+    dispose_engines()
+
+
+def test_get_engine_reuses_engine_per_uri(temp_dir):
+    """Test that the same URI and options share one engine."""
+    db_uri = f"sqlite:///{temp_dir / 'shared.db'}"
+
+    engine = get_engine(db_uri)
+
+    assert get_engine(db_uri) is engine
+    assert get_engine(db_uri, pool_pre_ping=True) is not engine
+    assert get_engine(f"sqlite:///{temp_dir / 'other.db'}") is not engine
+
+
+def test_get_engine_memory_databases_are_private():
+    """Test that in-memory SQLite databases never share an engine."""
+    assert get_engine("sqlite:///:memory:") is not get_engine("sqlite:///:memory:")
+    assert get_engine("sqlite://") is not get_engine("sqlite://")
+
+
+def test_get_engine_normalizes_relative_sqlite_paths(temp_dir):
+    """Test that relative SQLite paths are bound to the current directory."""
+    original_cwd = os.getcwd()
+    try:
+        os.chdir(temp_dir)
+        engine = get_engine("sqlite:///relative.db")
+    finally:
+        os.chdir(original_cwd)
+
+    assert engine.url.database == str(temp_dir / "relative.db")
+    assert get_engine(f"sqlite:///{temp_dir / 'relative.db'}") is engine
+
+
+def test_get_engine_applies_pool_settings(temp_dir):
+    """Test pool size, pre-ping and connect timeout settings."""
+    engine = get_engine(
+        f"sqlite:///{temp_dir / 'pool.db'}",
+        pool_size=3,
+        pool_pre_ping=True,
+        connect_timeout=2.5,
+    )
+
+    assert engine.pool.size() == 3
+    assert engine.pool._pre_ping
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+
+
+def test_set_statement_timeout_per_dialect():
+    """Test the statement run on connect for each supported dialect."""
+    for dialect, expected in (
+        ("postgresql", "SET statement_timeout = 1500"),
+        ("mysql", "SET SESSION max_execution_time = 1500"),
+        ("mariadb", "SET SESSION max_statement_time = 1.5"),
+    ):
+        engine = Mock()
+        engine.dialect.name = dialect
+        with patch("synq.core.engines.event.listens_for") as mock_listens_for:
+            _set_statement_timeout(engine, 1.5)
+
+        mock_listens_for.assert_called_once_with(engine, "connect")
+        set_timeout = mock_listens_for.return_value.call_args.args[0]
+
+        dbapi_connection = Mock()
+        set_timeout(dbapi_connection, None)
+        dbapi_connection.cursor.return_value.execute.assert_called_once_with(expected)
+
+    # Dialects without a statement timeout get no listener
+    engine = Mock()
+    engine.dialect.name = "sqlite"
+    with patch("synq.core.engines.event.listens_for") as mock_listens_for:
+        _set_statement_timeout(engine, 1.5)
+    mock_listens_for.assert_not_called()
+
+
+def test_database_managers_share_engine(temp_dir):
+    """Test that managers for the same database reuse one engine."""
+    config = SynqConfig(
+        metadata_path="test:metadata",
+        db_uri=f"sqlite:///{temp_dir / 'managers.db'}",
+        pool_pre_ping=True,
+    )
+
+    first = DatabaseManager(config)
+    second = DatabaseManager(config)
+
+    assert first.engine is second.engine
+    assert first.engine.pool._pre_ping
+    assert engine_options(config) == {"pool_pre_ping": True}
+
+
+def test_get_engine_skips_pool_size_without_queue_pool(temp_dir):
+    """Test that pool_size is not passed to pools that do not take it."""
+    from sqlalchemy.dialects.sqlite.pysqlite import SQLiteDialect_pysqlite
+    from sqlalchemy.pool import NullPool
+
+    # In-memory SQLite uses a SingletonThreadPool
+    with get_engine("sqlite://", pool_size=3).connect() as conn:
+        assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+
+    # SQLAlchemy 1.4 uses a NullPool for SQLite files
+    with patch.object(SQLiteDialect_pysqlite, "get_pool_class", return_value=NullPool):
+        engine = get_engine(f"sqlite:///{temp_dir / 'null.db'}", pool_size=3)
+    assert isinstance(engine.pool, NullPool)
+
+
+def test_database_manager_close_keeps_shared_engine(temp_dir):
+    """Test that closing one manager does not dispose a shared pool."""
+    db_uri = f"sqlite:///{temp_dir / 'close.db'}"
+    first = DatabaseManager(db_uri)
+    second = DatabaseManager(db_uri)
+    pool = second.engine.pool
+
+    first.close()
+    first.close()
+
+    assert second.engine.pool is pool
+    assert second.get_applied_migrations() == []
+
+    # The last manager to close disposes the engine and unregisters it
+    second.close()
+    assert second.engine.pool is not pool
+    assert _engines == {}
+    assert DatabaseManager(db_uri).engine is not second.engine
+
+    # Private in-memory engines are disposed
+    memory = DatabaseManager("sqlite:///:memory:")
+    memory_pool = memory.engine.pool
+    memory.close()
+    assert memory.engine.pool is not memory_pool
@@ -0,0 +1,75 @@
+"""Tests for migrating several databases in parallel."""
+
+import builtins
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from synq.core.engines import _engines
+from synq.core.fanout import migrate_targets
+from synq.core.migration import MigrationManager
+
+
+@pytest.fixture()
+def config(config_factory):
+    """Create a configuration with two migrations to apply."""
+    config = config_factory()
+    config.migrations_path.mkdir(parents=True)
+    (config.migrations_path / "0001_first.sql").write_text(
+        "CREATE TABLE first (id INTEGER PRIMARY KEY);"
+    )
+    (config.migrations_path / "0002_second.sql").write_text(
+        "CREATE TABLE second (id INTEGER PRIMARY KEY);"
+    )
+    return config
+
+
+def test_migrate_targets_reads_migrations_once(config, temp_dir):
+    """Test that migration files are listed and read once for all targets."""
+    db_uris = [f"sqlite:///{temp_dir / f'tenant_{name}.db'}" for name in "abc"]
+    migration_file = config.migrations_path / "0001_first.sql"
+
+    list_patch = patch.object(
+        MigrationManager,
+        "get_all_migrations",
+        autospec=True,
+        side_effect=MigrationManager.get_all_migrations,
+    )
+    open_patch = patch.object(builtins, "open", wraps=builtins.open)
+    with list_patch as get_all_migrations, open_patch as mock_open:
+        results = migrate_targets(config, db_uris, max_workers=3)
+
+    assert get_all_migrations.call_count == 1
+    assert [call.args[0] for call in mock_open.call_args_list].count(
+        migration_file
+    ) == 1
+    assert [result.applied for result in results] == [
+        ["0001_first.sql", "0002_second.sql"]
+    ] * 3
+
+
+def test_migrate_targets_deduplicates_uris(config, temp_dir):
+    """Test that a URI given twice is migrated once and reported once."""
+    first = f"sqlite:///{temp_dir / 'first.db'}"
+    second = f"sqlite:///{temp_dir / 'second.db'}"
+
+    results = migrate_targets(config, [first, second, first], max_workers=3)
+
+    assert [result.db_uri for result in results] == [first, second]
+    assert all(result.ok for result in results)
+    assert results[0].applied == ["0001_first.sql", "0002_second.sql"]
+
+    engine = create_engine(first)
+    assert {"first", "second"} <= set(inspect(engine).get_table_names())
+    engine.dispose()
+
+
+def test_migrate_targets_disposes_engines(config, temp_dir):
+    """Test that no engine stays open once every target is migrated."""
+    db_uris = [f"sqlite:///{temp_dir / f'tenant_{index}.db'}" for index in range(5)]
+
+    results = migrate_targets(config, db_uris, max_workers=3)
+
+    assert all(result.ok for result in results)
+    assert not [uri for uri, _options in _engines if "tenant_" in uri]
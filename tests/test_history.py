@@ -0,0 +1,173 @@
+"""Tests for the snapshot history index."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from synq.cli.main import cli
+from synq.core.cache import CACHE_DIR_NAME
+from synq.core.config import SynqConfig
+from synq.core.history import HISTORY_INDEX_FILE, HistoryEntry, HistoryIndex
+from synq.core.snapshot import (
+    ColumnSnapshot,
+    SchemaSnapshot,
+    SnapshotManager,
+    TableSnapshot,
+)
+
+
+def make_table(name, *columns, schema=None):
+    return TableSnapshot(
+        name=name,
+        columns=[
+            ColumnSnapshot(name=column, type=column_type, nullable=True)
+            for column, column_type in columns
+        ],
+        indexes=[],
+        foreign_keys=[],
+        schema=schema,
+    )
+
+
+USERS = make_table("users", ("id", "INTEGER"))
+USERS_EMAIL = make_table("users", ("id", "INTEGER"), ("email", "VARCHAR(50)"))
+USERS_LONG_EMAIL = make_table("users", ("id", "INTEGER"), ("email", "VARCHAR(255)"))
+POSTS = make_table("posts", ("id", "INTEGER"))
+
+HISTORY = [
+    [USERS],
+    [USERS_EMAIL, POSTS],
+    [USERS_EMAIL],
+    [USERS_LONG_EMAIL, POSTS],
+    [USERS],
+]
+
+
+def save_history(manager, history=HISTORY):
+    for number, tables in enumerate(history):
+        manager.save_snapshot(number, SchemaSnapshot(tables=tables))
+
+
+@pytest.mark.parametrize("options", [{}, {"snapshot_keyframe_interval": 2}])
+def test_table_and_column_history(snapshot_manager_factory, options):
+    """Test that additions, changes and drops are recorded per migration."""
+    manager = snapshot_manager_factory(**options)
+    save_history(manager)
+
+    assert manager.get_table_history("users") == [
+        HistoryEntry(0, "added"),
+        HistoryEntry(1, "changed"),
+        HistoryEntry(3, "changed"),
+        HistoryEntry(4, "changed"),
+    ]
+    assert manager.get_table_history("posts") == [
+        HistoryEntry(1, "added"),
+        HistoryEntry(2, "dropped"),
+        HistoryEntry(3, "added"),
+        HistoryEntry(4, "dropped"),
+    ]
+    assert manager.get_column_history("users", "email") == [
+        HistoryEntry(1, "added"),
+        HistoryEntry(3, "changed"),
+        HistoryEntry(4, "dropped"),
+    ]
+    assert manager.get_column_history("users", "id") == [HistoryEntry(0, "added")]
+    assert manager.get_column_history("users", "missing") == []
+    assert manager.get_table_history("missing") == []
+    assert manager.get_table_history("users", schema="audit") == []
+
+
+def test_history_index_is_built_once(temp_dir, snapshot_manager_factory):
+    """Test that queries after the first one read no snapshot."""
+    manager = snapshot_manager_factory()
+    save_history(manager)
+    manager.get_table_history("users")
+
+    assert (temp_dir / "migrations" / CACHE_DIR_NAME / HISTORY_INDEX_FILE).exists()
+
+    reader = snapshot_manager_factory()
+    with patch.object(reader, "load_snapshot") as load_snapshot:
+        assert len(reader.get_column_history("users", "email")) == 3
+    load_snapshot.assert_not_called()
+
+
+def test_history_index_is_updated_on_save(snapshot_manager_factory):
+    """Test that saving the next snapshot extends the index in place."""
+    manager = snapshot_manager_factory()
+    save_history(manager, HISTORY[:2])
+    manager.get_table_history("users")
+
+    for number in range(2, len(HISTORY)):
+        manager.save_snapshot(number, SchemaSnapshot(tables=HISTORY[number]))
+
+    with patch.object(manager, "load_snapshot") as load_snapshot:
+        history = manager.get_table_history("posts")
+    load_snapshot.assert_not_called()
+    assert [entry.migration_number for entry in history] == [1, 2, 3, 4]
+
+
+def test_history_index_is_rebuilt_after_rewrite(temp_dir, snapshot_manager_factory):
+    """Test that replacing stored snapshots invalidates the index."""
+    manager = snapshot_manager_factory()
+    save_history(manager)
+    assert len(manager.get_table_history("posts")) == 4
+
+    # Overwriting an indexed snapshot drops the index
+    manager.save_snapshot(2, SchemaSnapshot(tables=[USERS_EMAIL, POSTS]))
+    assert not (temp_dir / "migrations" / CACHE_DIR_NAME / HISTORY_INDEX_FILE).exists()
+    assert manager.get_table_history("posts") == [
+        HistoryEntry(1, "added"),
+        HistoryEntry(4, "dropped"),
+    ]
+
+    # A snapshot replaced behind the index's back, e.g. by git, is detected
+    # from its fingerprint
+    with patch.object(HistoryIndex, "record"):
+        manager.save_snapshot(4, SchemaSnapshot(tables=[USERS_EMAIL, POSTS]))
+    assert (temp_dir / "migrations" / CACHE_DIR_NAME / HISTORY_INDEX_FILE).exists()
+    assert manager.get_table_history("posts") == [HistoryEntry(1, "added")]
+
+
+def test_history_without_snapshots(snapshot_manager_factory):
+    """Test querying a project that has no snapshots yet."""
+    manager = snapshot_manager_factory()
+
+    assert manager.get_table_history("users") == []
+
+    manager.save_snapshot(0, SchemaSnapshot(tables=[USERS]))
+    assert manager.get_table_history("users") == [HistoryEntry(0, "added")]
+
+
+def test_history_command():
+    """Test the history CLI command."""
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        config = SynqConfig(metadata_path="test:metadata")
+        config.save_to_file()
+        save_history(SnapshotManager(config))
+        config.migrations_path.mkdir(exist_ok=True)
+        (config.migrations_path / "0001_add_email.sql").write_text("SELECT 1;")
+
+        result = runner.invoke(cli, ["history", "users.email"])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert "users.email" in lines[0]
+        assert lines[1:] == [
+            "  • 0001  added    0001_add_email.sql",
+            "  • 0003  changed",
+            "  - 0004  dropped",
+        ]
+
+        result = runner.invoke(cli, ["history", "posts"])
+        assert result.exit_code == 0
+        assert "0002  dropped" in result.output
+
+        result = runner.invoke(cli, ["history", "orders"])
+        assert result.exit_code == 0
+        assert "No history found for orders" in result.output
+
+        result = runner.invoke(cli, ["history", ".email"])
+        assert result.exit_code != 0
+        assert "Expected <table> or <table>.<column>" in result.output
@@ -0,0 +1,120 @@
+"""Tests for the cached metadata fingerprint."""
+
+import importlib
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from synq.cli.commands.generate import generate_command
+from synq.core.config import SynqConfig
+from synq.core.metadata_cache import MetadataCache
+
+MODELS = """
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+metadata = MetaData()
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(50)),
+)
+"""
+
+
+@pytest.fixture
+def project(temp_dir, monkeypatch):
+    """A project directory with an importable models module."""
+    module_name = f"cached_models_{os.getpid()}_{id(temp_dir)}"
+    (temp_dir / f"{module_name}.py").write_text(MODELS)
+
+    monkeypatch.chdir(temp_dir)
+    monkeypatch.syspath_prepend(str(temp_dir))
+    yield temp_dir, module_name
+    sys.modules.pop(module_name, None)
+
+
+def make_config(project_dir, module_name):
+    return SynqConfig(
+        metadata_path=f"{module_name}:metadata",
+        migrations_dir=str(project_dir / "migrations"),
+        snapshot_dir=str(project_dir / "migrations/meta"),
+        cache_metadata=True,
+    )
+
+
+def test_metadata_cache_tracks_model_files(project):
+    """Test that the cache hits until a model file changes."""
+    project_dir, module_name = project
+    importlib.import_module(module_name)
+    model_file = project_dir / f"{module_name}.py"
+
+    cache = MetadataCache(make_config(project_dir, module_name))
+    assert cache.get_fingerprint() is None
+    assert model_file.resolve() in cache.project_module_files()
+
+    cache.store("abc123")
+    assert cache.get_fingerprint() == "abc123"
+
+    # Touching without editing still hits
+    stat = model_file.stat()
+    os.utime(model_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.get_fingerprint() == "abc123"
+
+    model_file.write_text(MODELS + "\n# edited\n")
+    assert cache.get_fingerprint() is None
+
+
+def test_metadata_cache_invalidated_by_metadata_path(project):
+    """Test that pointing at another MetaData ignores the cache."""
+    project_dir, module_name = project
+    importlib.import_module(module_name)
+
+    MetadataCache(make_config(project_dir, module_name)).store("abc123")
+
+    other = make_config(project_dir, module_name)
+    other.metadata_path = f"{module_name}:other_metadata"
+    assert MetadataCache(other).get_fingerprint() is None
+
+
+def test_metadata_cache_ignores_corrupt_file(project):
+    """Test that an unreadable cache file is a miss."""
+    project_dir, module_name = project
+    cache = MetadataCache(make_config(project_dir, module_name))
+
+    cache.cache_file.parent.mkdir(parents=True)
+    cache.cache_file.write_text("not json")
+
+    assert cache.get_fingerprint() is None
+
+
+def test_generate_skips_import_when_models_unchanged(project):
+    """Test that generate does not import the models when nothing changed."""
+    project_dir, module_name = project
+    config_path = project_dir / "synq.toml"
+    make_config(project_dir, module_name).save_to_file(config_path)
+
+    with patch("click.echo"):
+        generate_command(
+            description="initial", config_path=config_path, custom_name=None
+        )
+    assert (project_dir / "migrations/.synq_cache/metadata_cache.json").exists()
+
+    import_patch = patch("synq.cli.commands.generate.import_metadata_from_path")
+    with import_patch as mock_import, patch("click.echo") as mock_echo:
+        generate_command(description=None, config_path=config_path, custom_name=None)
+
+    mock_import.assert_not_called()
+    mock_echo.assert_any_call("✅ No schema changes detected. Nothing to migrate!")
+
+    # Editing the models brings the import back
+    (project_dir / f"{module_name}.py").write_text(
+        MODELS.replace("String(50)", "String(120)")
+    )
+    sys.modules.pop(module_name, None)
+    with patch("click.echo"):
+        generate_command(description=None, config_path=config_path, custom_name=None)
+
+    assert len(list((project_dir / "migrations").glob("*.sql"))) == 2
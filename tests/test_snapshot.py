@@ -1,5 +1,16 @@
 """Tests for snapshot system."""
 
+import gc
+import json
+import pickle
+import sys
+import tracemalloc
+from dataclasses import FrozenInstanceError, asdict, replace
+from unittest.mock import patch
+
+import pytest
+
+from synq.core import snapshot as snapshot_module
 from synq.core.snapshot import (
     ColumnSnapshot,
     SchemaSnapshot,
@@ -110,3 +121,547 @@ def test_schema_snapshot_serialization():
     assert restored.tables[0].name == "test"
     assert len(restored.tables[0].columns) == 1
     assert restored.tables[0].columns[0].name == "id"
+
+
+def test_snapshot_fingerprint_ignores_table_order(test_config, test_metadata):
+    """Test that the fingerprint is independent of table declaration order."""
+    manager = SnapshotManager(test_config)
+    snapshot = manager.create_snapshot(test_metadata)
+    users = snapshot.tables[0]
+    posts = TableSnapshot(
+        name="posts",
+        columns=[ColumnSnapshot(name="id", type="INTEGER", nullable=False)],
+        indexes=[],
+        foreign_keys=[],
+    )
+
+    first = SchemaSnapshot(tables=[users, posts])
+    second = SchemaSnapshot(tables=[posts, users])
+
+    assert first.fingerprint() == second.fingerprint()
+
+
+def test_snapshot_fingerprint_changes_with_schema(
+    test_config, test_metadata, modified_metadata
+):
+    """Test that structural changes produce a different fingerprint."""
+    manager = SnapshotManager(test_config)
+    original = manager.create_snapshot(test_metadata)
+    modified = manager.create_snapshot(modified_metadata)
+
+    assert (
+        original.fingerprint() == manager.create_snapshot(test_metadata).fingerprint()
+    )
+    assert original.fingerprint() != modified.fingerprint()
+
+
+def test_save_snapshot_stores_fingerprint(test_config, test_metadata):
+    """Test that saved snapshots have their fingerprint persisted."""
+    manager = SnapshotManager(test_config)
+
+    # No snapshots initially
+    assert manager.get_latest_fingerprint() is None
+
+    snapshot = manager.create_snapshot(test_metadata)
+    manager.save_snapshot(0, snapshot)
+
+    assert (manager.snapshot_path / "0000_snapshot.sha256").exists()
+    assert manager.get_snapshot_fingerprint(0) == snapshot.fingerprint()
+    assert manager.get_latest_fingerprint() == snapshot.fingerprint()
+
+
+def test_get_latest_fingerprint_without_fingerprint_file(test_config, test_metadata):
+    """Test that snapshots saved without a fingerprint report None."""
+    manager = SnapshotManager(test_config)
+    manager.save_snapshot(0, manager.create_snapshot(test_metadata))
+    (manager.snapshot_path / "0000_snapshot.sha256").unlink()
+
+    assert manager.get_latest_fingerprint() is None
+
+
+def test_delta_snapshots_between_keyframes(
+    snapshot_manager_factory, test_metadata, modified_metadata
+):
+    """Test that only keyframes are stored in full."""
+    manager = snapshot_manager_factory(snapshot_keyframe_interval=3)
+    original = manager.create_snapshot(test_metadata)
+    modified = manager.create_snapshot(modified_metadata)
+
+    saved = [
+        manager.save_snapshot(number, snapshot).name
+        for number, snapshot in enumerate([original, modified, modified, original])
+    ]
+
+    assert saved == [
+        "0000_snapshot.json",
+        "0001_delta.json",
+        "0002_delta.json",
+        "0003_snapshot.json",
+    ]
+    assert manager.get_all_snapshots() == [0, 1, 2, 3]
+    assert manager.get_next_migration_number() == 4
+
+
+def test_delta_snapshots_reconstruct_exactly(
+    snapshot_manager_factory, test_metadata, modified_metadata
+):
+    """Test that replaying deltas reproduces the saved snapshots."""
+    manager = snapshot_manager_factory(snapshot_keyframe_interval=10)
+    original = manager.create_snapshot(test_metadata)
+    modified = manager.create_snapshot(modified_metadata)
+    reordered = replace(modified, tables=list(reversed(modified.tables)))
+
+    manager.save_snapshot(0, original)
+    manager.save_snapshot(1, modified)
+    manager.save_snapshot(2, reordered)
+    manager.save_snapshot(3, original)
+
+    # A fresh manager has nothing cached and must replay from the keyframe
+    fresh = snapshot_manager_factory(snapshot_keyframe_interval=10)
+    assert fresh.load_snapshot(1) == modified
+    assert fresh.load_snapshot(2) == reordered
+    assert fresh.load_snapshot(3) == original
+    assert fresh.get_latest_snapshot() == original
+
+
+def test_delta_snapshots_store_only_changed_tables(
+    snapshot_manager_factory, test_metadata
+):
+    """Test that deltas do not repeat unchanged tables."""
+    manager = snapshot_manager_factory(snapshot_keyframe_interval=3)
+    snapshot = manager.create_snapshot(test_metadata)
+
+    manager.save_snapshot(0, snapshot)
+    filepath = manager.save_snapshot(1, snapshot)
+
+    delta = json.loads(filepath.read_text())
+    assert delta["base"] == 0
+    assert delta["changed"] == []
+    assert delta["tables"] == [[None, "users"]]
+
+
+def test_delta_snapshot_reconstruction_is_cached(
+    snapshot_manager_factory, test_metadata
+):
+    """Test that reconstructed snapshots are cached and invalidated on save."""
+    manager = snapshot_manager_factory(snapshot_keyframe_interval=3)
+    snapshot = manager.create_snapshot(test_metadata)
+    manager.save_snapshot(0, snapshot)
+    manager.save_snapshot(1, snapshot)
+
+    first = manager.load_snapshot(1)
+    assert manager.load_snapshot(1) is first
+
+    manager.save_snapshot(1, SchemaSnapshot(tables=[]))
+    assert manager.load_snapshot(1) == SchemaSnapshot(tables=[])
+
+
+def test_delta_snapshot_with_missing_base(snapshot_manager_factory, test_metadata):
+    """Test that a delta whose base is gone loads as None."""
+    manager = snapshot_manager_factory(snapshot_keyframe_interval=3)
+    snapshot = manager.create_snapshot(test_metadata)
+    manager.save_snapshot(0, snapshot)
+    manager.save_snapshot(1, snapshot)
+    (manager.snapshot_path / "0000_snapshot.json").unlink()
+
+    fresh = snapshot_manager_factory(snapshot_keyframe_interval=3)
+    assert fresh.load_snapshot(1) is None
+
+
+def test_snapshot_index_orders_numbers_past_9999(test_config):
+    """Test that snapshot numbers are ordered numerically, not as strings."""
+    manager = SnapshotManager(test_config)
+    manager.save_snapshot(9999, SchemaSnapshot(tables=[]))
+    latest = SchemaSnapshot(tables=[], version="2.0")
+    manager.save_snapshot(10000, latest)
+
+    assert manager.get_all_snapshots() == [9999, 10000]
+    assert manager.get_next_migration_number() == 10001
+    assert manager.get_latest_snapshot() == latest
+
+
+def test_snapshot_index_scans_directory_once(test_config, test_metadata):
+    """Test that one directory scan serves repeated lookups."""
+    manager = SnapshotManager(test_config)
+    snapshot = manager.create_snapshot(test_metadata)
+    manager.save_snapshot(0, snapshot)
+    manager.save_snapshot(1, snapshot)
+
+    with patch.object(
+        manager, "_scan_snapshot_files", wraps=manager._scan_snapshot_files
+    ) as mock_scan:
+        manager.get_latest_fingerprint()
+        manager.get_latest_snapshot()
+        manager.get_next_migration_number()
+        manager.get_all_snapshots()
+        assert mock_scan.call_count == 1
+
+        # Saving invalidates the index explicitly
+        manager.save_snapshot(2, snapshot)
+        assert manager.get_all_snapshots() == [0, 1, 2]
+        assert mock_scan.call_count == 2
+
+
+def test_snapshot_index_detects_external_changes(test_config, test_metadata):
+    """Test that files added by other processes invalidate the index."""
+    manager = SnapshotManager(test_config)
+    snapshot = manager.create_snapshot(test_metadata)
+    manager.save_snapshot(0, snapshot)
+    assert manager.get_all_snapshots() == [0]
+
+    SnapshotManager(test_config).save_snapshot(1, snapshot)
+
+    assert manager.get_all_snapshots() == [0, 1]
+
+
+def test_create_snapshot_reuses_unchanged_tables(test_config, test_metadata):
+    """Test that snapshotting the same MetaData again reuses table snapshots."""
+    manager = SnapshotManager(test_config)
+    first = manager.create_snapshot(test_metadata)
+
+    from sqlalchemy.types import TypeEngine
+
+    build_patch = patch.object(
+        manager, "_build_table_snapshot", wraps=manager._build_table_snapshot
+    )
+    compile_patch = patch.object(
+        TypeEngine, "compile", autospec=True, side_effect=TypeEngine.compile
+    )
+    with build_patch as build, compile_patch as compile_type:
+        second = manager.create_snapshot(test_metadata)
+
+    build.assert_not_called()
+    compile_type.assert_not_called()
+    for before, after in zip(first.tables, second.tables):
+        assert before is after
+
+
+def test_create_snapshot_rebuilds_changed_tables(test_config, test_metadata):
+    """Test that tables changed in place are snapshotted again."""
+    from sqlalchemy import Column, Integer, String, Table, Text
+
+    Table("posts", test_metadata, Column("id", Integer, primary_key=True))
+
+    manager = SnapshotManager(test_config)
+    first = {
+        table.name: table for table in manager.create_snapshot(test_metadata).tables
+    }
+
+    users = test_metadata.tables["users"]
+    users.append_column(Column("bio", Text))
+    users.c.email.nullable = not users.c.email.nullable
+    users.c.name.type = String(100)
+
+    second = {
+        table.name: table for table in manager.create_snapshot(test_metadata).tables
+    }
+
+    assert second["users"] is not first["users"]
+    columns = {column.name: column for column in second["users"].columns}
+    assert "bio" in columns
+    assert columns["email"].nullable is users.c.email.nullable
+    assert columns["name"].type == "VARCHAR(100)"
+    assert second["posts"] is first["posts"]
+
+
+def test_create_snapshot_sees_types_changed_in_place(test_config, test_metadata):
+    """Test that a column type mutated in place is snapshotted again."""
+    manager = SnapshotManager(test_config)
+    users = test_metadata.tables["users"]
+    first = manager.create_snapshot(test_metadata).tables[0]
+
+    users.c.name.type.length = 200
+    second = manager.create_snapshot(test_metadata).tables[0]
+
+    assert second is not first
+    columns = {column.name: column for column in second.columns}
+    assert columns["name"].type == "VARCHAR(200)"
+
+
+def _snapshot_data(table_count, column_count):
+    """Build the dictionary form of a large synthetic snapshot."""
+    types = ["INTEGER", "VARCHAR(255)", "TEXT", "BOOLEAN", "DATETIME"]
+    return {
+        "version": "1.0",
+        "tables": [
+            {
+                "name": f"table_{t}",
+                "columns": [
+                    {
+                        "name": f"col_{c}",
+                        "type": types[c % len(types)],
+                        "nullable": c != 0,
+                        "primary_key": c == 0,
+                    }
+                    for c in range(column_count)
+                ],
+                "indexes": [{"name": f"ix_table_{t}", "columns": ["col_1"]}],
+                "foreign_keys": [],
+            }
+            for t in range(table_count)
+        ],
+    }
+
+
+def test_snapshot_objects_are_frozen_and_slotted():
+    """Test that snapshot objects have no instance dict and cannot be changed."""
+    snapshot = SchemaSnapshot.from_dict(_snapshot_data(1, 2))
+    table = snapshot.tables[0]
+    column = table.columns[0]
+
+    if sys.version_info >= (3, 10):
+        for obj in (table, column, table.indexes[0]):
+            assert not hasattr(obj, "__dict__")
+
+    with pytest.raises(FrozenInstanceError):
+        column.nullable = True
+    with pytest.raises(FrozenInstanceError):
+        table.name = "other"
+
+    assert hash(column) == hash(replace(column))
+    assert hash(table) == hash(TableSnapshot.from_dict(asdict(table)))
+
+
+def test_snapshot_objects_are_changed_with_replace():
+    """Test deriving changed snapshots now that they cannot be assigned to."""
+    column = ColumnSnapshot(name="id", type="INTEGER", nullable=False)
+    table = TableSnapshot(name="users", columns=[column], indexes=[], foreign_keys=[])
+    fingerprint = table.fingerprint()
+
+    with pytest.raises(FrozenInstanceError):
+        column.type = "BIGINT"
+    with pytest.raises(FrozenInstanceError):
+        table.columns = []
+
+    email = ColumnSnapshot(name="email", type="VARCHAR(255)", nullable=True)
+    wider = replace(table, columns=[replace(column, type="BIGINT"), email])
+
+    assert [c.type for c in wider.columns] == ["BIGINT", "VARCHAR(255)"]
+    assert wider.fingerprint() != fingerprint
+    assert table.columns == [column]
+    assert table.fingerprint() == fingerprint
+
+
+def test_snapshot_objects_pickle_with_fingerprint():
+    """Test that frozen snapshot objects survive pickling."""
+    table = SchemaSnapshot.from_dict(_snapshot_data(1, 3)).tables[0]
+    fingerprint = table.fingerprint()
+
+    restored = pickle.loads(pickle.dumps(table))  # noqa: S301
+
+    assert restored == table
+    assert restored.fingerprint() == fingerprint
+
+
+def test_snapshot_strings_are_interned(test_config, test_metadata):
+    """Test that repeated strings share one object across snapshots."""
+    data = json.dumps(_snapshot_data(2, 6))
+    first = SchemaSnapshot.from_dict(json.loads(data))
+    second = SchemaSnapshot.from_dict(json.loads(data))
+
+    assert first.tables[0].columns[1].type is first.tables[1].columns[1].type
+    assert first.tables[0].columns[1].type is second.tables[0].columns[1].type
+    assert first.tables[0].columns[2].name is second.tables[1].columns[2].name
+
+    created = SnapshotManager(test_config).create_snapshot(test_metadata)
+    loaded = SchemaSnapshot.from_dict(json.loads(json.dumps(created.to_dict())))
+    assert created.tables[0].columns[1].type is loaded.tables[0].columns[1].type
+
+
+@pytest.mark.slow
+def test_snapshot_memory_per_column():
+    """Benchmark the memory two large snapshots hold while being diffed.
+
+    Plain dataclasses with a string per field took about 320 bytes per
+    column; slotted instances sharing interned strings take about 150.
+    """
+    data = json.dumps(_snapshot_data(1000, 20))
+    column_count = 2 * 1000 * 20
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        snapshots = [SchemaSnapshot.from_dict(json.loads(data)) for _ in range(2)]
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(snapshots[1].tables) == 1000
+    assert retained / column_count < 200
+
+
+def test_schema_snapshot_tables_view_is_cached_and_read_only():
+    """Test that the dictionary-style tables view is built once."""
+    snapshot = SchemaSnapshot.from_dict(_snapshot_data(3, 2))
+    tables = snapshot["tables"]
+
+    assert snapshot["tables"] is tables
+    assert list(tables) == ["table_0", "table_1", "table_2"]
+    assert tables["table_1"] is tables["table_1"]
+    assert tables["table_1"]["columns"]["col_1"]["type"] == "VARCHAR(255)"
+
+    with pytest.raises(TypeError):
+        tables["table_3"] = {}
+    with pytest.raises(TypeError):
+        tables["table_1"]["name"] = "other"
+
+
+def test_schema_snapshot_tables_view_converts_lazily():
+    """Test that only the tables looked up are converted to dictionaries."""
+    snapshot = SchemaSnapshot.from_dict(_snapshot_data(50, 2))
+
+    with patch(
+        "synq.core.snapshot._table_to_dict", wraps=snapshot_module._table_to_dict
+    ) as to_dict:
+        assert len(snapshot["tables"]) == 50
+        for _ in range(10):
+            snapshot["tables"]["table_7"]
+
+    assert to_dict.call_count == 1
+
+
+def test_schema_snapshot_index_follows_table_assignment():
+    """Test that assigning new tables invalidates the name index."""
+    snapshot = SchemaSnapshot.from_dict(_snapshot_data(2, 2))
+    assert set(snapshot.tables_by_name) == {"table_0", "table_1"}
+    assert set(snapshot["tables"]) == {"table_0", "table_1"}
+
+    snapshot.tables = snapshot.tables[:1]
+
+    assert set(snapshot.tables_by_name) == {"table_0"}
+    assert set(snapshot["tables"]) == {"table_0"}
+
+    restored = pickle.loads(pickle.dumps(snapshot))  # noqa: S301
+    assert restored == snapshot
+    assert set(restored["tables"]) == {"table_0"}
+
+
+def test_schema_snapshot_index_follows_in_place_changes():
+    """Test that changing the tables list in place invalidates the lookups."""
+    tables = SchemaSnapshot.from_dict(_snapshot_data(4, 2)).tables
+    snapshot = SchemaSnapshot(tables=tables[:2])
+    view = snapshot["tables"]
+    assert set(snapshot.tables_by_name) == {"table_0", "table_1"}
+
+    snapshot.tables.append(tables[2])
+    assert set(snapshot.tables_by_name) == {"table_0", "table_1", "table_2"}
+    assert "table_2" in snapshot["tables"]
+    assert snapshot["tables"] is not view
+
+    snapshot.tables[0] = tables[3]
+    del snapshot.tables[1]
+    assert set(snapshot.tables_by_name) == {"table_3", "table_2"}
+
+    snapshot.tables += [tables[0]]
+    snapshot.tables.remove(tables[3])
+    assert set(snapshot["tables"]) == {"table_2", "table_0"}
+
+    snapshot.tables.clear()
+    assert snapshot.tables == []
+    assert len(snapshot["tables"]) == 0
+    assert type(snapshot.to_dict()["tables"]) is list
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"snapshot_format": "binary"}, {"snapshot_keyframe_interval": 3}],
+)
+def test_load_snapshots_in_parallel(snapshot_manager_factory, options):
+    """Test that snapshots decoded by worker processes come back in order."""
+    manager = snapshot_manager_factory(**options)
+    snapshots = [
+        SchemaSnapshot.from_dict(_snapshot_data(number + 1, 3)) for number in range(7)
+    ]
+    for number, snapshot in enumerate(snapshots):
+        manager.save_snapshot(number, snapshot)
+
+    reader = snapshot_manager_factory(**options)
+    assert reader.load_snapshots(max_workers=2) == snapshots
+
+    numbers = [5, 0, 2, 2, 9, 4]
+    fresh = snapshot_manager_factory(**options)
+    assert fresh.load_snapshots(numbers, max_workers=2) == [
+        snapshots[5],
+        snapshots[0],
+        snapshots[2],
+        snapshots[2],
+        None,
+        snapshots[4],
+    ]
+
+
+def test_load_snapshots_with_unreadable_file(snapshot_manager_factory):
+    """Test that a malformed snapshot loads as None without stopping the rest."""
+    manager = snapshot_manager_factory()
+    snapshot = SchemaSnapshot.from_dict(_snapshot_data(2, 2))
+    for number in range(3):
+        manager.save_snapshot(number, snapshot)
+    (manager.snapshot_path / "0001_snapshot.json").write_text("{not json")
+
+    assert list(manager.iter_snapshots(max_workers=2)) == [
+        (0, snapshot),
+        (1, None),
+        (2, snapshot),
+    ]
+
+
+def test_load_snapshots_in_process_by_default(snapshot_manager_factory):
+    """Test that without a worker count files decode in-process, keyframes once."""
+    manager = snapshot_manager_factory(snapshot_keyframe_interval=4)
+    snapshots = [
+        SchemaSnapshot.from_dict(_snapshot_data(number + 1, 2)) for number in range(6)
+    ]
+    for number, snapshot in enumerate(snapshots):
+        manager.save_snapshot(number, snapshot)
+
+    reader = snapshot_manager_factory(snapshot_keyframe_interval=4)
+    wrapped = patch.object(
+        snapshot_module,
+        "_read_snapshot_file",
+        wraps=snapshot_module._read_snapshot_file,
+    )
+    pool = patch.object(snapshot_module, "ProcessPoolExecutor")
+    with pool as executor, wrapped as read_file:
+        assert reader.load_snapshots([1, 2, 3, 5, 4]) == [
+            snapshots[1],
+            snapshots[2],
+            snapshots[3],
+            snapshots[5],
+            snapshots[4],
+        ]
+
+    executor.assert_not_called()
+    # Only the keyframes 0 and 4 are read in full
+    assert [call.args[0].name for call in read_file.call_args_list] == [
+        "0000_snapshot.json",
+        "0004_snapshot.json",
+    ]
+
+
+def test_iter_snapshots_drops_cached_keyframes(snapshot_manager_factory):
+    """Test that iterating keeps at most one keyframe interval cached."""
+    manager = snapshot_manager_factory(snapshot_keyframe_interval=3)
+    for number in range(12):
+        manager.save_snapshot(
+            number, SchemaSnapshot.from_dict(_snapshot_data(number + 1, 2))
+        )
+
+    reader = snapshot_manager_factory(snapshot_keyframe_interval=3)
+    already_cached = reader.load_snapshot(10)
+    cached_before = set(reader._snapshot_cache)
+
+    sizes = []
+    for number, snapshot in reader.iter_snapshots():
+        assert len(snapshot.tables) == number + 1
+        sizes.append(len(set(reader._snapshot_cache) - cached_before))
+
+    assert max(sizes) <= 3
+    assert set(reader._snapshot_cache) == cached_before
+    assert reader.load_snapshot(10) is already_cached
+
+    # Stopping early drops what was cached as well
+    snapshots = reader.iter_snapshots(max_workers=2)
+    next(snapshots)
+    next(snapshots)
+    snapshots.close()
+    assert set(reader._snapshot_cache) == cached_before
@@ -0,0 +1,214 @@
+"""Tests for streaming reads of JSON snapshot files."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from synq.core import snapshot_reader
+from synq.core.snapshot import (
+    ColumnSnapshot,
+    SchemaSnapshot,
+    TableSnapshot,
+)
+from synq.core.snapshot_reader import (
+    build_table_index,
+    iter_snapshot_tables,
+    read_snapshot_table,
+    table_index_file,
+)
+
+
+def make_snapshot(table_count: int = 5) -> SchemaSnapshot:
+    """Build a snapshot with non-ASCII text, so bytes and characters differ."""
+    tables = [
+        TableSnapshot(
+            name=f"tåble_{number}",
+            columns=[
+                ColumnSnapshot(name="id", type="INTEGER", nullable=False),
+                ColumnSnapshot(
+                    name="label", type="VARCHAR(20)", nullable=True, default="'ünï'"
+                ),
+            ],
+            indexes=[],
+            foreign_keys=[],
+        )
+        for number in range(table_count)
+    ]
+    tables.append(
+        TableSnapshot(
+            name="tåble_0",
+            columns=[ColumnSnapshot(name="id", type="INTEGER", nullable=False)],
+            indexes=[],
+            foreign_keys=[],
+            schema="audit",
+        )
+    )
+    return SchemaSnapshot(tables=tables)
+
+
+def write_snapshot(path, snapshot, **dump_options):
+    path.write_text(
+        json.dumps(snapshot.to_dict(), ensure_ascii=False, **dump_options),
+        encoding="utf-8",
+    )
+    return path
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_iter_snapshot_tables(temp_dir, chunk_size):
+    """Test that tables are yielded in order, whatever the read size."""
+    snapshot = make_snapshot()
+    path = write_snapshot(temp_dir / "0001_snapshot.json", snapshot, indent=2)
+
+    assert list(iter_snapshot_tables(path, chunk_size)) == snapshot.tables
+
+
+def test_iter_snapshot_tables_stops_early(temp_dir):
+    """Test that iteration does not need the rest of the file."""
+    path = write_snapshot(temp_dir / "0001_snapshot.json", make_snapshot())
+    # Cut the file off after the first table
+    data = path.read_bytes()
+    path.write_bytes(data[: data.index(b"t\xc3\xa5ble_1")])
+
+    tables = iter_snapshot_tables(path, chunk_size=16)
+    assert next(tables).name == "tåble_0"
+    with pytest.raises(ValueError, match="Invalid JSON snapshot"):
+        next(tables)
+
+
+def test_iter_snapshot_tables_with_version_first(temp_dir):
+    """Test that other top-level keys are skipped wherever they appear."""
+    path = temp_dir / "0001_snapshot.json"
+    snapshot = make_snapshot(2)
+    path.write_text(
+        json.dumps({"version": "1.0", **snapshot.to_dict(), "extra": [1, {}]}),
+        encoding="utf-8",
+    )
+
+    assert list(iter_snapshot_tables(path, chunk_size=3)) == snapshot.tables
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "[]",
+        "{}",
+        '{"tables": {}}',
+        '{"tables": [1]}',
+        '{"tables": [{"na',
+        '{"version": "1.0" "tables": []}',
+        '{"tables": []} {',
+    ],
+)
+def test_iter_snapshot_tables_rejects_invalid_files(temp_dir, content):
+    """Test that malformed snapshots raise ValueError."""
+    path = temp_dir / "0001_snapshot.json"
+    path.write_text(content)
+
+    with pytest.raises(ValueError, match="Invalid JSON snapshot"):
+        list(iter_snapshot_tables(path))
+
+
+def test_read_snapshot_table_uses_byte_offsets(temp_dir):
+    """Test reading single tables by name and schema."""
+    snapshot = make_snapshot()
+    path = write_snapshot(temp_dir / "0001_snapshot.json", snapshot, indent=2)
+
+    for table in snapshot.tables:
+        assert read_snapshot_table(path, table.name, table.schema) == table
+
+    assert read_snapshot_table(path, "missing") is None
+    assert read_snapshot_table(path, "tåble_1", schema="audit") is None
+
+
+def test_read_snapshot_table_scans_once(temp_dir):
+    """Test that the table index is written to the index dir and reused."""
+    snapshot = make_snapshot()
+    path = write_snapshot(temp_dir / "0001_snapshot.json", snapshot)
+    index_dir = temp_dir / "cache"
+
+    assert read_snapshot_table(path, "tåble_3", None, index_dir) == snapshot.tables[3]
+    assert table_index_file(path, index_dir).exists()
+    assert (index_dir / ".gitignore").exists()
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["0001_snapshot.json", "cache"]
+
+    with patch.object(snapshot_reader, "_scan_tables") as scan:
+        assert (
+            read_snapshot_table(path, "tåble_2", None, index_dir) == snapshot.tables[2]
+        )
+    scan.assert_not_called()
+
+
+def test_read_snapshot_table_rebuilds_stale_index(temp_dir):
+    """Test that an index is not used once its snapshot changed."""
+    path = write_snapshot(temp_dir / "0001_snapshot.json", make_snapshot())
+    index_dir = temp_dir / "cache"
+    build_table_index(path, index_dir)
+
+    snapshot = make_snapshot(2)
+    write_snapshot(path, snapshot, indent=4)
+
+    assert read_snapshot_table(path, "tåble_1", None, index_dir) == snapshot.tables[1]
+    assert read_snapshot_table(path, "tåble_3", None, index_dir) is None
+
+
+def test_read_snapshot_table_ignores_corrupt_index(temp_dir):
+    """Test that an unreadable index is rebuilt."""
+    snapshot = make_snapshot()
+    path = write_snapshot(temp_dir / "0001_snapshot.json", snapshot)
+    index_file = table_index_file(path, temp_dir)
+    index_file.write_text("not json")
+
+    assert read_snapshot_table(path, "tåble_4", None, temp_dir) == snapshot.tables[4]
+    assert json.loads(index_file.read_text())["tables"]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"snapshot_format": "binary"}, {"snapshot_keyframe_interval": 3}],
+)
+def test_manager_load_table(snapshot_manager_factory, options):
+    """Test loading single tables from every kind of stored snapshot."""
+    manager = snapshot_manager_factory(**options)
+    first = make_snapshot(3)
+    changed_table = TableSnapshot(
+        name="tåble_1",
+        columns=[ColumnSnapshot(name="id", type="BIGINT", nullable=False)],
+        indexes=[],
+        foreign_keys=[],
+    )
+    second = SchemaSnapshot(tables=[first.tables[0], changed_table, first.tables[3]])
+    manager.save_snapshot(0, first)
+    manager.save_snapshot(1, second)
+
+    reader = snapshot_manager_factory(**options)
+    assert reader.load_table(0, "tåble_1") == first.tables[1]
+    assert reader.load_table(1, "tåble_1") == changed_table
+    assert reader.load_table(1, "tåble_0") == first.tables[0]
+    assert reader.load_table(1, "tåble_0", schema="audit") == first.tables[3]
+    assert reader.load_table(1, "tåble_2") is None
+    assert reader.load_table(2, "tåble_0") is None
+
+    assert list(reader.iter_tables(1)) == second.tables
+    with pytest.raises(ValueError, match="not found"):
+        reader.iter_tables(2)
+
+
+def test_manager_save_snapshot_removes_table_index(temp_dir, snapshot_manager_factory):
+    """Test that overwriting a snapshot drops its table index."""
+    manager = snapshot_manager_factory()
+    snapshot = make_snapshot(2)
+    path = manager.save_snapshot(0, snapshot)
+
+    index_dir = temp_dir / "migrations" / ".synq_cache" / "tables"
+
+    assert manager.load_table(0, "tåble_1") == snapshot.tables[1]
+    assert table_index_file(path, index_dir).exists()
+
+    manager.save_snapshot(0, make_snapshot(1))
+
+    assert not table_index_file(path, index_dir).exists()
+    assert manager.load_table(0, "tåble_1") is None
+    assert manager.get_all_snapshots() == [0]
@@ -0,0 +1,236 @@
+"""Tests for splitting migration SQL into statements."""
+
+import json
+from unittest.mock import patch
+
+from synq.core.sql_splitter import (
+    STATEMENT_CACHE_VERSION,
+    _statement_cache,
+    get_sql_statements,
+    split_sql_statements,
+    sql_content_hash,
+)
+
+
+def test_split_simple_statements():
+    """Test splitting plain statements and dropping empty ones."""
+    sql = "CREATE TABLE a (id INT);;\nCREATE TABLE b (id INT);\n;"
+
+    assert split_sql_statements(sql) == [
+        "CREATE TABLE a (id INT)",
+        "CREATE TABLE b (id INT)",
+    ]
+
+
+def test_split_ignores_semicolons_in_strings_and_identifiers():
+    """Test that quoted semicolons do not end a statement."""
+    sql = (
+        "INSERT INTO notes VALUES ('a; b', 'it''s; fine');\n"
+        'SELECT "odd;name" FROM `other;table`;'
+    )
+
+    assert split_sql_statements(sql) == [
+        "INSERT INTO notes VALUES ('a; b', 'it''s; fine')",
+        'SELECT "odd;name" FROM `other;table`',
+    ]
+
+
+def test_split_strips_comments():
+    """Test that comments are removed but optimizer hints are kept."""
+    sql = """
+    -- leading comment; with a semicolon
+    CREATE TABLE t (
+        id INT, /* block; comment */
+        name TEXT -- trailing; comment
+    );
+    SELECT /*+ INDEX(t) */ id FROM t;
+    /*!40101 SET NAMES utf8 */;
+    """
+
+    statements = split_sql_statements(sql)
+
+    assert len(statements) == 3
+    assert "--" not in statements[0]
+    assert "block" not in statements[0]
+    assert statements[0].startswith("CREATE TABLE t (")
+    assert statements[1] == "SELECT /*+ INDEX(t) */ id FROM t"
+    assert statements[2] == "/*!40101 SET NAMES utf8 */"
+
+
+def test_split_dollar_quoted_bodies():
+    """Test that PostgreSQL dollar-quoted function bodies stay intact."""
+    body = "BEGIN NEW.updated := now(); RETURN NEW; END;"
+    sql = (
+        f"CREATE FUNCTION touch() RETURNS trigger AS $$ {body} $$ LANGUAGE plpgsql;\n"
+        f"CREATE FUNCTION touch2() RETURNS trigger AS $fn$ {body} $fn$ LANGUAGE plpgsql;\n"
+        "SELECT $1;"
+    )
+
+    statements = split_sql_statements(sql)
+
+    assert len(statements) == 3
+    assert body in statements[0]
+    assert body in statements[1]
+    assert statements[2] == "SELECT $1"
+
+
+def test_split_trigger_blocks():
+    """Test that BEGIN ... END trigger bodies are kept as one statement."""
+    sql = """
+    CREATE TRIGGER bump AFTER INSERT ON items FOR EACH ROW
+    BEGIN
+        UPDATE counters SET n = CASE WHEN n IS NULL THEN 1 ELSE n + 1 END;
+        INSERT INTO log VALUES (NEW.id);
+    END;
+    SELECT 1;
+    """
+
+    statements = split_sql_statements(sql)
+
+    assert len(statements) == 2
+    assert statements[0].endswith("END")
+    assert "INSERT INTO log" in statements[0]
+    assert statements[1] == "SELECT 1"
+
+
+def test_split_procedure_with_end_if():
+    """Test that END IF and END WHILE do not close the enclosing block."""
+    sql = (
+        "CREATE PROCEDURE p() BEGIN IF x THEN SELECT 1; END IF; "
+        "WHILE y DO SELECT 2; END WHILE; END; SELECT 3;"
+    )
+
+    assert split_sql_statements(sql) == [
+        "CREATE PROCEDURE p() BEGIN IF x THEN SELECT 1; END IF; "
+        "WHILE y DO SELECT 2; END WHILE; END",
+        "SELECT 3",
+    ]
+
+
+def test_split_procedure_with_end_case():
+    """Test that END CASE closes the CASE statement it ends."""
+    sql = (
+        "CREATE PROCEDURE p() BEGIN CASE x WHEN 1 THEN SELECT 1; END CASE; END; "
+        "SELECT 4; SELECT 5;"
+    )
+
+    assert split_sql_statements(sql) == [
+        "CREATE PROCEDURE p() BEGIN CASE x WHEN 1 THEN SELECT 1; END CASE; END",
+        "SELECT 4",
+        "SELECT 5",
+    ]
+
+
+def test_split_transaction_control():
+    """Test that BEGIN as a transaction statement does not open a block."""
+    assert split_sql_statements("BEGIN; CREATE TABLE t (id INT); COMMIT;") == [
+        "BEGIN",
+        "CREATE TABLE t (id INT)",
+        "COMMIT",
+    ]
+    assert split_sql_statements("BEGIN TRANSACTION; SELECT 1; END;") == [
+        "BEGIN TRANSACTION",
+        "SELECT 1",
+        "END",
+    ]
+
+
+def test_split_backslash_escapes():
+    """Test MySQL-style backslash escapes in string literals."""
+    sql = r"INSERT INTO t VALUES ('a\'; b'); SELECT 1;"
+
+    assert split_sql_statements(sql, backslash_escapes=True) == [
+        r"INSERT INTO t VALUES ('a\'; b')",
+        "SELECT 1",
+    ]
+    # Without backslash escapes the quote closes the literal
+    assert split_sql_statements(sql)[0] == r"INSERT INTO t VALUES ('a\'"
+
+
+def test_split_postgresql_escape_strings():
+    """Test that E'...' strings always use backslash escapes."""
+    sql = r"INSERT INTO t VALUES (E'a\'; b'), ('c\'); SELECT 1;"
+
+    assert split_sql_statements(sql) == [
+        r"INSERT INTO t VALUES (E'a\'; b'), ('c\')",
+        "SELECT 1",
+    ]
+    # A trailing E on an identifier is not a string prefix
+    assert split_sql_statements("SELECT name'x; y'; SELECT 2;") == [
+        "SELECT name'x; y'",
+        "SELECT 2",
+    ]
+
+
+def test_split_unterminated_quote():
+    """Test that an unterminated literal runs to the end of the text."""
+    assert split_sql_statements("SELECT 'open; SELECT 2") == ["SELECT 'open; SELECT 2"]
+
+
+def test_get_sql_statements_caches_by_content():
+    """Test that the same SQL content is only split once."""
+    sql = "CREATE TABLE cached_split (id INT); SELECT 42;"
+
+    with patch(
+        "synq.core.sql_splitter.split_sql_statements",
+        wraps=split_sql_statements,
+    ) as split:
+        first = get_sql_statements(sql)
+        second = get_sql_statements(sql)
+
+    assert first == second == ["CREATE TABLE cached_split (id INT)", "SELECT 42"]
+    assert split.call_count == 1
+
+    # Returned lists are copies, so callers cannot corrupt the cache
+    first.append("DROP TABLE cached_split")
+    assert get_sql_statements(sql) == second
+
+
+def test_get_sql_statements_disk_cache(tmp_path):
+    """Test that split statements are stored on disk and reused."""
+    sql = "CREATE TABLE disk_cached (id INT); -- note\nSELECT 'a;b';"
+    cache_dir = tmp_path / "statements"
+
+    statements = get_sql_statements(sql, cache_dir=cache_dir)
+
+    cache_file = cache_dir / f"{sql_content_hash(sql)}.json"
+    assert cache_file.exists()
+    assert json.loads(cache_file.read_text())["statements"] == statements
+
+    # A new process only has the on-disk entry
+    _statement_cache.clear()
+    with patch("synq.core.sql_splitter.split_sql_statements") as split:
+        assert get_sql_statements(sql, cache_dir=cache_dir) == statements
+    split.assert_not_called()
+
+
+def test_get_sql_statements_disk_cache_per_escape_mode(tmp_path):
+    """Test that backslash-escaped splits get their own cache entry."""
+    sql = r"SELECT 'a\'; SELECT 2;"
+
+    plain = get_sql_statements(sql, cache_dir=tmp_path)
+    escaped = get_sql_statements(sql, backslash_escapes=True, cache_dir=tmp_path)
+
+    assert plain != escaped
+    assert (tmp_path / f"{sql_content_hash(sql)}_backslash.json").exists()
+
+
+def test_get_sql_statements_ignores_bad_cache_entries(tmp_path):
+    """Test that corrupt or outdated cache files are replaced."""
+    sql = "SELECT 1; SELECT 2;"
+    cache_file = tmp_path / f"{sql_content_hash(sql)}.json"
+
+    for contents in ("not json", json.dumps({"version": 0, "statements": ["x"]})):
+        _statement_cache.clear()
+        cache_file.write_text(contents)
+
+        assert get_sql_statements(sql, cache_dir=tmp_path) == ["SELECT 1", "SELECT 2"]
+        assert json.loads(cache_file.read_text())["version"] == STATEMENT_CACHE_VERSION
+
+
+def test_get_sql_statements_unwritable_cache_dir(tmp_path):
+    """Test that a cache directory that cannot be created is ignored."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+
+    assert get_sql_statements("SELECT 3;", cache_dir=blocker / "cache") == ["SELECT 3"]
@@ -0,0 +1,127 @@
+"""Tests for watching models for schema changes."""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from synq.cli.main import cli
+from synq.core.config import SynqConfig
+from synq.core.diff import OperationType
+from synq.core.watch import SchemaWatcher
+
+TABLES = """
+from sqlalchemy import Column, Integer, String, Table
+
+from .base import metadata
+
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True),
+{extra})
+"""
+
+
+@pytest.fixture
+def project(temp_dir, monkeypatch):
+    """A project whose tables live in a different module than the MetaData."""
+    package = f"watched_models_{os.getpid()}_{id(temp_dir)}"
+    package_dir = temp_dir / package
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        "from .base import metadata\nfrom . import tables\n"
+    )
+    (package_dir / "base.py").write_text(
+        "from sqlalchemy import MetaData\n\nmetadata = MetaData()\n"
+    )
+    (package_dir / "tables.py").write_text(TABLES.format(extra=""))
+
+    monkeypatch.chdir(temp_dir)
+    monkeypatch.syspath_prepend(str(temp_dir))
+    yield temp_dir, package
+    for name in list(sys.modules):
+        if name.startswith(package):
+            del sys.modules[name]
+
+
+def make_config(project_dir, package):
+    return SynqConfig(
+        metadata_path=f"{package}:metadata",
+        migrations_dir=str(project_dir / "migrations"),
+        snapshot_dir=str(project_dir / "migrations/meta"),
+    )
+
+
+def test_schema_watcher_detects_changes(project):
+    """Test that editing a table module is picked up on the next load."""
+    project_dir, package = project
+    watcher = SchemaWatcher(make_config(project_dir, package))
+
+    snapshot = watcher.load()
+    assert [table.name for table in snapshot.tables] == ["users"]
+    assert project_dir / package / "tables.py" in watcher.files
+    assert watcher.changed_files() == []
+
+    operations = watcher.pending_operations(snapshot)
+    assert [op.operation_type for op in operations] == [OperationType.CREATE_TABLE]
+
+    # Record the first snapshot as migrated
+    watcher.snapshot_manager.save_snapshot(0, snapshot)
+    assert watcher.pending_operations(snapshot) == []
+
+    tables_file = project_dir / package / "tables.py"
+    tables_file.write_text(TABLES.format(extra='    Column("email", String(50)),\n'))
+    assert watcher.changed_files() == [tables_file]
+
+    snapshot = watcher.load()
+    operations = watcher.pending_operations(snapshot)
+
+    assert watcher.changed_files() == []
+    assert [str(op) for op in operations] == ["ADD COLUMN users.email"]
+
+
+def test_schema_watcher_survives_broken_module(project):
+    """Test that a syntax error is reported and later edits still load."""
+    project_dir, package = project
+    watcher = SchemaWatcher(make_config(project_dir, package))
+    watcher.load()
+
+    tables_file = project_dir / package / "tables.py"
+    tables_file.write_text("def broken(:\n")
+    with pytest.raises(SyntaxError):
+        watcher.load()
+
+    # The broken file is still watched, but not reported again
+    assert tables_file in watcher.files
+    assert watcher.changed_files() == []
+
+    tables_file.write_text(TABLES.format(extra='    Column("age", Integer),\n'))
+    snapshot = watcher.load()
+    assert [column.name for column in snapshot.tables[0].columns] == ["id", "age"]
+
+
+def test_watch_command_prints_pending_operations(project):
+    """Test the watch loop output until it is interrupted."""
+    project_dir, package = project
+    make_config(project_dir, package).save_to_file(project_dir / "synq.toml")
+    tables_file = project_dir / package / "tables.py"
+
+    def sleep(_interval):
+        if sleep.calls:
+            raise KeyboardInterrupt
+        sleep.calls += 1
+        tables_file.write_text(TABLES.format(extra='    Column("email", String),\n'))
+
+    sleep.calls = 0
+
+    with patch("synq.cli.commands.watch.time.sleep", sleep):
+        result = CliRunner().invoke(cli, ["watch", "--interval", "0.1"])
+
+    assert result.exit_code == 0
+    assert "1 pending operation(s)" in result.output
+    assert f"Changed: {package}/tables.py" in result.output
+    assert "CREATE TABLE users" in result.output
+    assert "Stopped watching." in result.output